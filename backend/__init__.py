@@ -1 +1 @@
-"""Backend package root for FinIQ.ai."""
+"""Backend package root for FinIQ.ai."""
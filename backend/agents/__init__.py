@@ -1,23 +1,29 @@
-"""
-FinIQ.ai Agents Package
-Each agent is responsible for a specific financial analysis task.
-"""
-
-from .funding_stage_agent import FundingStageAgent
-from .raise_amount_agent import RaiseAmountAgent
-from .investor_type_agent import InvestorTypeAgent
-from .runway_agent import RunwayAgent
-from .financial_priority_agent import FinancialPriorityAgent
-from .idea_understanding_agent import IdeaUnderstandingAgent
-from .industry_specialist_agent import IndustrySpecialistAgent
-
-__all__ = [
-    "FundingStageAgent",
-    "RaiseAmountAgent",
-    "InvestorTypeAgent",
-    "RunwayAgent",
-    "FinancialPriorityAgent",
-    "IdeaUnderstandingAgent",
-    "IndustrySpecialistAgent",
-]
-
+"""
+FinIQ.ai Agents Package
+Each agent is responsible for a specific financial analysis task.
+"""
+
+from .funding_stage_agent import FundingStageAgent
+from .raise_amount_agent import RaiseAmountAgent
+from .investor_type_agent import InvestorTypeAgent
+from .runway_agent import RunwayAgent
+from .financial_priority_agent import FinancialPriorityAgent
+from .idea_understanding_agent import IdeaUnderstandingAgent
+from .industry_specialist_agent import IndustrySpecialistAgent
+from .combined_agent import CombinedAgent
+from .post_stage_agent import PostStageAgent
+from .combined_finance_agent import CombinedFinanceAgent
+
+__all__ = [
+    "FundingStageAgent",
+    "RaiseAmountAgent",
+    "InvestorTypeAgent",
+    "RunwayAgent",
+    "FinancialPriorityAgent",
+    "IdeaUnderstandingAgent",
+    "IndustrySpecialistAgent",
+    "CombinedAgent",
+    "PostStageAgent",
+    "CombinedFinanceAgent",
+]
+
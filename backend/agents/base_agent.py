@@ -1,51 +1,73 @@
-"""
-Base Agent Class
-All financial agents inherit from this base class.
-"""
-
-from abc import ABC, abstractmethod
-from typing import Dict, Any
-import logging
-
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-
-class BaseAgent(ABC):
-    """
-    Abstract base class for all financial agents.
-    
-    Each agent must implement:
-    - name: Agent's identifier
-    - description: What this agent does
-    - run(): Main execution logic
-    """
-    
-    def __init__(self):
-        self.name = self.__class__.__name__
-        self.description = self.get_description()
-        logger.info(f"[INIT] {self.name} initialized")
-    
-    @abstractmethod
-    def get_description(self) -> str:
-        """Return a description of what this agent does."""
-        pass
-    
-    @abstractmethod
-    def run(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Execute the agent's main logic.
-        
-        Args:
-            input_data: Raw startup input from frontend
-            context: Shared context with outputs from previous agents
-            
-        Returns:
-            Dict with this agent's output
-        """
-        pass
-    
-    def log_output(self, output: Dict[str, Any]) -> None:
-        """Log agent output for debugging."""
-        logger.info(f"[OUTPUT] {self.name} → {output}")
-
+"""
+Base Agent Class
+All financial agents inherit from this base class.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+import logging
+
+from utils import prompt_templates
+from utils.prompt_templates import BoundPromptTemplates
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BaseAgent(ABC):
+    """
+    Abstract base class for all financial agents.
+    
+    Each agent must implement:
+    - name: Agent's identifier
+    - description: What this agent does
+    - run(): Main execution logic
+    - fallback_output(): Heuristic output when the LLM is unavailable
+    """
+    
+    def __init__(self):
+        self.name = self.__class__.__name__
+        self.description = self.get_description()
+        logger.info(f"[INIT] {self.name} initialized")
+    
+    @abstractmethod
+    def get_description(self) -> str:
+        """Return a description of what this agent does."""
+        pass
+    
+    @abstractmethod
+    def run(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the agent's main logic.
+        
+        Args:
+            input_data: Raw startup input from frontend
+            context: Shared context with outputs from previous agents
+        
+        Returns:
+            Dict with this agent's output
+        """
+        pass
+    
+    @abstractmethod
+    def fallback_output(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Heuristic output used when the LLM call fails or returns nothing usable.
+        
+        Args:
+            input_data: Raw startup input from frontend
+            context: Shared context with outputs from previous agents
+        
+        Returns:
+            Dict with this agent's output (same shape as run())
+        """
+        pass
+    
+    def get_prompts(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> BoundPromptTemplates:
+        """Prompt templates bound to this startup (the orchestrator shares one via context["prompts"])."""
+        return context.get("prompts") or prompt_templates.bind(input_data)
+    
+    def log_output(self, output: Dict[str, Any]) -> None:
+        """Log agent output for debugging."""
+        logger.info(f"[OUTPUT] {self.name} → {output}")
+
@@ -0,0 +1,141 @@
+"""
+Combined Agent Base Class
+Shared logic for agents that answer several single agents in one LLM call.
+"""
+
+import os
+import json
+import logging
+from abc import abstractmethod
+from typing import Dict, Any, Tuple, Type
+
+from .base_agent import BaseAgent
+from utils.llm_client import llm_client
+from utils.prompt_templates import schema_instruction
+
+logger = logging.getLogger(__name__)
+
+
+class CombinedAgent(BaseAgent):
+    """
+    Base class for agents that replace a run of single agents with one prompt.
+    
+    Subclasses declare the sections they cover and build the prompt; this class
+    makes the LLM call and splits the response back into the single agents'
+    context keys. A section that is missing or invalid falls back to the
+    matching single agent's fallback; if the combined call itself fails, the
+    single agents run as before.
+    """
+    
+    # Response key -> (context key, required fields), in chain order
+    SECTIONS: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+    # Context key -> single agent class, used for fallbacks
+    SECTION_AGENTS: Dict[str, Type[BaseAgent]] = {}
+    # Schema names passed to schema_instruction, in section order
+    SCHEMAS: Tuple[str, ...] = ()
+    TEMPERATURE = 0.5
+    MAX_OUTPUT_TOKENS = 4096
+    
+    def __init__(self, api_key: str = None):
+        """
+        All LLM calls now go through utils.llm_client with automatic provider failover.
+        """
+        super().__init__()
+        if not (
+            os.getenv("GROQ_API_KEY")
+            or os.getenv("DEEPSEEK_API_KEY")
+            or os.getenv("OPENROUTER_API_KEY")
+            or os.getenv("GEMINI_API_KEY")
+            or os.getenv("GOOGLE_API_KEY")
+        ):
+            raise ValueError(
+                "No LLM providers configured. "
+                "Set at least one of GROQ_API_KEY, DEEPSEEK_API_KEY, "
+                "OPENROUTER_API_KEY, GEMINI_API_KEY, or GOOGLE_API_KEY."
+            )
+        # Single agents provide per-section fallbacks and the full fallback path
+        self.section_agents = {
+            context_key: agent_class(api_key=api_key)
+            for context_key, agent_class in self.SECTION_AGENTS.items()
+        }
+        logger.info(f"[INIT] {self.name} ready with unified LLM client")
+    
+    @property
+    def context_keys(self) -> Tuple[str, ...]:
+        """Context keys this agent fills, in chain order."""
+        return tuple(context_key for context_key, _ in self.SECTIONS.values())
+    
+    @abstractmethod
+    def build_prompt(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> str:
+        """Build the combined prompt for every covered section."""
+        pass
+    
+    def run(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Produce every covered section in one LLM call.
+        
+        Returns:
+            Dict keyed by context key, one entry per section
+        """
+        startup_name = input_data.get('startupName') or input_data.get('startup_name', 'Unknown')
+        logger.info(f"[RUN] {self.name} processing startup: {startup_name}")
+        
+        try:
+            prompt = self.build_prompt(input_data, context)
+            
+            logger.info("[CALL] Calling unified LLM client...")
+            raw_text = llm_client.generate(
+                prompt,
+                temperature=self.TEMPERATURE,
+                max_output_tokens=self.MAX_OUTPUT_TOKENS,
+                schema_instruction=schema_instruction(*self.SCHEMAS),
+            )
+            
+            result = self._parse_response(raw_text)
+        except Exception as e:
+            logger.error(f"[ERROR] {self.name} combined call failed, running single agents: {str(e)}")
+            return self._run_single_agents(input_data, context)
+        
+        # Fallbacks read earlier sections (e.g. raise amount needs the stage), so build on a local context
+        local_context = dict(context)
+        output = {}
+        for section, (context_key, required_fields) in self.SECTIONS.items():
+            section_output = result.get(section)
+            if not (isinstance(section_output, dict) and all(f in section_output for f in required_fields)):
+                logger.warning(f"[FALLBACK] {self.name} section '{section}' missing or incomplete")
+                section_output = self.section_agents[context_key].fallback_output(input_data, local_context)
+            output[context_key] = local_context[context_key] = section_output
+        
+        self.log_output(output)
+        return output
+    
+    def _parse_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse the combined JSON response."""
+        clean_text = response_text.strip()
+        if clean_text.startswith("```json"):
+            clean_text = clean_text.replace("```json", "").replace("```", "").strip()
+        elif clean_text.startswith("```"):
+            clean_text = clean_text.replace("```", "").strip()
+        
+        parsed = json.loads(clean_text)
+        if not isinstance(parsed, dict):
+            raise ValueError("Combined response is not a JSON object")
+        
+        return parsed
+    
+    def fallback_output(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Every covered section's single-agent fallback, in chain order."""
+        local_context = dict(context)
+        output = {}
+        for context_key in self.context_keys:
+            output[context_key] = local_context[context_key] = self.section_agents[context_key].fallback_output(input_data, local_context)
+        return output
+    
+    def _run_single_agents(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the covered single agents in order, as the chain does without this agent."""
+        local_context = dict(context)
+        output = {}
+        for context_key in self.context_keys:
+            agent = self.section_agents[context_key]
+            output[context_key] = local_context[context_key] = agent.run(input_data, local_context)
+        return output
@@ -0,0 +1,55 @@
+"""
+Combined Finance Agent
+Runs funding stage, raise amount, investor type, runway, and financial priority analysis in a single LLM call.
+"""
+
+from typing import Dict, Any
+
+from .combined_agent import CombinedAgent
+from .funding_stage_agent import FundingStageAgent
+from .raise_amount_agent import RaiseAmountAgent
+from .investor_type_agent import InvestorTypeAgent
+from .runway_agent import RunwayAgent
+from .financial_priority_agent import FinancialPriorityAgent
+
+
+class CombinedFinanceAgent(CombinedAgent):
+    """
+    Combined replacement for every agent after IndustrySpecialist.
+    
+    Once the idea profile and industry bullets exist, the remaining five agents
+    only read each other's outputs, so one prompt can answer them in order: the
+    startup context, idea profile and bullets are sent once instead of five
+    times, and four network round trips go away.
+    
+    Output is split back into the usual context keys (`funding_stage`,
+    `raise_amount`, `investor_type`, `runway`, `financial_priority`).
+    
+    Requires:
+    - context["idea_profile"]
+    - context["industry_bullets"] (optional)
+    """
+    
+    SECTIONS = {
+        "funding_stage": ("funding_stage", ("funding_stage", "confidence", "rationale")),
+        "raise_amount": ("raise_amount", ("recommended_amount", "rationale")),
+        "investor_type": ("investor_type", ("primary_investor_type", "rationale")),
+        "runway": ("runway", ("estimated_runway_months", "monthly_burn_rate")),
+        "priorities": ("financial_priority", ("priorities",)),
+    }
+    SECTION_AGENTS = {
+        "funding_stage": FundingStageAgent,
+        "raise_amount": RaiseAmountAgent,
+        "investor_type": InvestorTypeAgent,
+        "runway": RunwayAgent,
+        "financial_priority": FinancialPriorityAgent,
+    }
+    SCHEMAS = ("FUNDING_STAGE_V1", "RAISE_AMOUNT_V1", "INVESTOR_TYPE_V1", "RUNWAY_V1", "FINANCIAL_PRIORITY_V1")
+    TEMPERATURE = 0.4
+    MAX_OUTPUT_TOKENS = 6144
+    
+    def get_description(self) -> str:
+        return "Determines funding stage, raise amount, investor types, runway, and financial priorities in one call"
+    
+    def build_prompt(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> str:
+        return self.get_prompts(input_data, context).combined_finance_agent()
@@ -10,8 +10,8 @@ import logging
 from typing import Dict, Any
 
 from .base_agent import BaseAgent
-from utils.prompt_templates import PromptTemplates
 from utils.llm_client import llm_client
+from utils.prompt_templates import schema_instruction
 
 logger = logging.getLogger(__name__)
 
@@ -68,35 +68,22 @@ class IdeaUnderstandingAgent(BaseAgent):
         logger.info(f"[CONTEXT] Idea description length: {len(idea_desc)} chars")
 
         try:
-            prompt = PromptTemplates.idea_understanding_agent(input_data)
+            prompt = self.get_prompts(input_data, context).idea_understanding_agent()
 
-            # Strong schema enforcement for idea_profile JSON
-            schema_instruction = """
-CRITICAL: Output ONLY a valid JSON object matching this EXACT schema. No other text, no markdown (no ```json), no explanations. Use ALL details from the input to derive precise, non-generic values. If uncertain, explain briefly in "notes" but NEVER use defaults like "Medium" without rationale.
-
-SCHEMA:
-{
-  "category": "string (precise sub-industry, e.g., 'PropTech FinTech', not 'General')",
-  "business_model": "string (specific, e.g., 'Per-shipment + subscription')",
-  "capital_intensity": "string (Low/Medium/High/Very High, justified by hardware/logistics needs)",
-  "burn_profile": "string (Low/Medium/High, based on ops/compliance burn)",
-  "hardware_dependency": "string (Low/Medium/High, e.g., High for IoT sensors/dewars)",
-  "operational_complexity": "string (Low/Medium/High, factoring regulation/partnerships)",
-  "regulation_risk": "string (Low/Medium/High/Very High, e.g., Very High for FDA/pharma shipping)",
-  "scalability_model": "string (brief, e.g., 'Network effects via pharma partnerships')",
-  "margin_profile": "string (Low/Medium/High, e.g., High post-scale due to recurring fees)",
-  "team_requirements": "array of strings (3-5 key roles, e.g., ['Chief Quality Officer', 'Logistics Engineer'])",
-  "confidence": "string (low/medium/high, high if input is detailed)",
-  "notes": "string (1-2 sentences on key risks/opportunities)"
-}
-"""
+            # Strong schema enforcement for idea_profile JSON (the schema itself lives in SCHEMAS)
+            schema_text = (
+                "\nCRITICAL: Output ONLY a valid JSON object matching this EXACT schema. No other text, no markdown (no ```json), no explanations. "
+                "Use ALL details from the input to derive precise, non-generic values. "
+                "If uncertain, explain briefly in \"notes\" but NEVER use defaults like \"Medium\" without rationale.\n\n"
+                + schema_instruction("IDEA_PROFILE_V1")
+            )
 
             logger.info("[CALL] Calling unified LLM client for idea understanding (schema-enforced)...")
             raw_text = llm_client.generate(
                 prompt,
                 temperature=0.1,
                 max_output_tokens=1024,
-                schema_instruction=schema_instruction,
+                schema_instruction=schema_text,
             )
 
             # Log raw response BEFORE parsing
@@ -112,7 +99,7 @@ SCHEMA:
             logger.error(f"[ERROR] {self.name} failed with exception: {str(e)}")
             logger.error(f"[FALLBACK] Using heuristic-based fallback profile")
             # Fall back to a minimal profile using existing fields
-            return self._get_fallback_output(input_data)
+            return self.fallback_output(input_data, context)
 
     def _parse_response(self, response_text: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -197,7 +184,7 @@ SCHEMA:
         
         return parsed
 
-    def _get_fallback_output(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    def fallback_output(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
         """
         Industry-aware heuristic fallback profile.
         Returns more intelligent defaults based on industry/description keywords.
@@ -0,0 +1,57 @@
+"""
+Post-Stage Agent
+Runs investor type, runway, and financial priority analysis in a single LLM call.
+"""
+
+import logging
+from typing import Dict, Any
+
+from .combined_agent import CombinedAgent
+from .investor_type_agent import InvestorTypeAgent
+from .runway_agent import RunwayAgent
+from .financial_priority_agent import FinancialPriorityAgent
+
+logger = logging.getLogger(__name__)
+
+
+class PostStageAgent(CombinedAgent):
+    """
+    Combined replacement for the last three agents in the chain.
+    
+    InvestorType, Runway and FinancialPriority only depend on the funding stage
+    and raise amount, so one prompt can answer all three: the shared startup
+    context and instructions are sent once instead of three times, and two
+    network round trips go away.
+    
+    Output is split back into the usual context keys (`investor_type`, `runway`,
+    `financial_priority`).
+    
+    Requires:
+    - context["funding_stage"]
+    - context["raise_amount"]
+    - context["idea_profile"]
+    """
+    
+    SECTIONS = {
+        "investor_type": ("investor_type", ("primary_investor_type", "rationale")),
+        "runway": ("runway", ("estimated_runway_months", "monthly_burn_rate")),
+        "priorities": ("financial_priority", ("priorities",)),
+    }
+    SECTION_AGENTS = {
+        "investor_type": InvestorTypeAgent,
+        "runway": RunwayAgent,
+        "financial_priority": FinancialPriorityAgent,
+    }
+    SCHEMAS = ("INVESTOR_TYPE_V1", "RUNWAY_V1", "FINANCIAL_PRIORITY_V1")
+    TEMPERATURE = 0.5
+    MAX_OUTPUT_TOKENS = 4096
+    
+    def get_description(self) -> str:
+        return "Identifies investor types, runway, and financial priorities in one call"
+    
+    def build_prompt(self, input_data: Dict[str, Any], context: Dict[str, Any]) -> str:
+        funding_stage = context.get("funding_stage", {}).get("funding_stage", "Seed")
+        raise_amount = context.get("raise_amount", {}).get("recommended_amount", "$500K")
+        logger.info(f"[CONTEXT] Funding stage: {funding_stage}, Raise amount: {raise_amount}")
+        
+        return self.get_prompts(input_data, context).combined_post_stage_agent(funding_stage, raise_amount)
@@ -1,7 +1,7 @@
-"""Core utilities for backend (e.g., Redis limiter)."""
-
-from .limiter_redis import RedisLimiter
-
-__all__ = ["RedisLimiter"]
-
-
+"""Core utilities for backend (e.g., Redis limiter)."""
+
+from .limiter_redis import RedisLimiter
+
+__all__ = ["RedisLimiter"]
+
+
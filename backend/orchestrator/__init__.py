@@ -1,9 +1,9 @@
-"""
-Orchestrator Package
-Manages the agent chain execution and context sharing.
-"""
-
-from .chain_manager import ChainManager
-
-__all__ = ["ChainManager"]
-
+"""
+Orchestrator Package
+Manages the agent chain execution and context sharing.
+"""
+
+from .chain_manager import ChainManager
+
+__all__ = ["ChainManager"]
+
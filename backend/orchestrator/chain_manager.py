@@ -1,316 +1,480 @@
-"""
-Chain Manager - Agent Orchestrator
-Executes the financial agent chain sequentially and manages shared context.
-"""
-
-import logging
-from typing import Dict, Any, List
-from datetime import datetime
-
-from agents import (
-    FundingStageAgent,
-    RaiseAmountAgent,
-    InvestorTypeAgent,
-    RunwayAgent,
-    FinancialPriorityAgent,
-    IdeaUnderstandingAgent,
-    IndustrySpecialistAgent,
-)
-from utils import validate_startup_input, input_to_dict
-from utils.cache import compute_hash, cache_get, cache_set
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s [%(levelname)s] %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
-logger = logging.getLogger(__name__)
-
-
-class ChainManager:
-    """
-    Orchestrates the financial agent chain.
-    
-    Flow:
-    1. Validate input
-    2. Execute agents sequentially
-    3. Build shared context
-    4. Return consolidated output
-    """
-    
-    def __init__(self, api_key: str = None):
-        """
-        Initialize the chain manager and all agents.
-        
-        Args:
-            api_key: Gemini API key (passed to all agents)
-        """
-        logger.info("=" * 70)
-        logger.info("[INIT] Initializing FinIQ.ai Agent Chain")
-        logger.info("=" * 70)
-        
-        self.api_key = api_key
-        self.context: Dict[str, Any] = {}
-        self.execution_log: List[Dict[str, Any]] = []
-        
-        # Initialize all agents
-        # Order: IdeaUnderstanding → IndustrySpecialist → FundingStage → RaiseAmount → InvestorType → Runway → FinancialPriority
-        try:
-            self.agents = [
-                IdeaUnderstandingAgent(api_key=api_key),
-                IndustrySpecialistAgent(api_key=api_key),  # NEW: Hyper-specific niche bullets
-                FundingStageAgent(api_key=api_key),
-                RaiseAmountAgent(api_key=api_key),
-                InvestorTypeAgent(api_key=api_key),
-                RunwayAgent(api_key=api_key),
-                FinancialPriorityAgent(api_key=api_key)
-            ]
-            logger.info(f"[OK] Initialized {len(self.agents)} agents successfully")
-        except Exception as e:
-            logger.error(f"[FAIL] Failed to initialize agents: {str(e)}")
-            raise
-    
-    def run(self, raw_input: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Execute the complete agent chain.
-        
-        Args:
-            raw_input: Raw startup input from frontend
-            
-        Returns:
-            Consolidated financial strategy report with 'cached' metadata
-        """
-        start_time = datetime.now()
-        logger.info("\n" + "=" * 70)
-        logger.info("[START] Starting FinIQ.ai Analysis")
-        logger.info("=" * 70)
-        
-        try:
-            # Step 1: Validate input
-            logger.info("\n[STEP 1] Validating input data...")
-            validated_input = validate_startup_input(raw_input)
-            input_dict = input_to_dict(validated_input)
-
-            # Normalize naming for descriptions so prompts can use a consistent shape
-            input_dict["startup_name"] = input_dict.get("startupName", "")
-            # Prefer an explicit one-line description if provided, otherwise fall back to the name
-            input_dict["one_line_description"] = (
-                input_dict.get("oneLineDescription")
-                or input_dict.get("startupName", "")
-            )
-            # Prefer a dedicated ideaDescription; fall back to tractionSummary if needed
-            input_dict["idea_description"] = (
-                input_dict.get("ideaDescription")
-                or input_dict.get("tractionSummary")
-                or ""
-            )
-
-            logger.info(f"[OK] Input validated for: {input_dict['startupName']}")
-            
-            # Step 1.5: Check cache before executing agents
-            logger.info("\n[CACHE CHECK] Computing cache key...")
-            cache_key = compute_hash(input_dict)
-            cached_result = cache_get(cache_key)
-            
-            if cached_result:
-                # Cache hit - return immediately without calling agents
-                execution_time = (datetime.now() - start_time).total_seconds()
-                logger.info(f"[CACHE HIT] ⚡ Returning cached result in {execution_time:.3f}s")
-                logger.info("=" * 70)
-                
-                # Add metadata to indicate this is cached
-                cached_result["metadata"] = cached_result.get("metadata", {})
-                cached_result["metadata"]["cached"] = True
-                cached_result["metadata"]["cache_retrieval_time_seconds"] = execution_time
-                cached_result["metadata"]["original_execution_time_seconds"] = cached_result["metadata"].get("execution_time_seconds", 0)
-                
-                return cached_result
-            
-            logger.info("[CACHE MISS] No cached result found, executing agent chain...")
-            
-            # Step 2: Execute agent chain
-            logger.info("\n[STEP 2] Executing agent chain...")
-            self.context = {"input": input_dict}
-            
-            for i, agent in enumerate(self.agents, 1):
-                logger.info(f"\n--- Agent {i}/{len(self.agents)}: {agent.name} ---")
-                
-                try:
-                    # Run agent
-                    agent_output = agent.run(input_dict, self.context)
-                    
-                    # Store output in context
-                    agent_key = self._get_agent_key(agent.name)
-                    self.context[agent_key] = agent_output
-
-                    # Make idea understanding profile available to all downstream agents
-                    if agent_key == "idea_understanding":
-                        if agent_output and "error" not in agent_output:
-                            self.context["idea_profile"] = agent_output
-                            # Also attach to input dict so prompt templates can see it
-                            input_dict["ideaProfile"] = agent_output
-                            logger.info(f"[CONTEXT] Idea profile successfully stored with keys: {list(agent_output.keys())}")
-                        else:
-                            logger.warning(f"[CONTEXT] IdeaUnderstandingAgent returned error or empty output, using fallback for downstream agents")
-                            # Set a minimal fallback profile so downstream agents don't fail
-                            fallback_profile = {
-                                "category": "General",
-                                "business_model": "Not specified",
-                                "capital_intensity": "Medium",
-                                "burn_profile": "Medium",
-                                "hardware_dependency": "Medium",
-                                "operational_complexity": "Medium",
-                                "regulation_risk": "Medium",
-                                "scalability_model": "Standard",
-                                "margin_profile": "Medium",
-                                "team_requirements": [],
-                                "confidence": "low",
-                                "notes": "Fallback profile due to IdeaUnderstandingAgent failure"
-                            }
-                            self.context["idea_profile"] = fallback_profile
-                            input_dict["ideaProfile"] = fallback_profile
-                    
-                    # Make industry specialist bullets available to all downstream agents
-                    if agent_key == "industry_specialist":
-                        if agent_output and "error" not in agent_output:
-                            self.context["industry_bullets"] = agent_output
-                            # Also attach to input dict so prompt templates can see it
-                            input_dict["industryBullets"] = agent_output
-                            bullets = agent_output.get("bullets", [])
-                            logger.info(f"[CONTEXT] Industry bullets stored: {len(bullets)} bullets for '{agent_output.get('industry_label', 'Unknown')}'")
-                        else:
-                            logger.warning(f"[CONTEXT] IndustrySpecialistAgent returned error or empty output")
-                            self.context["industry_bullets"] = {"bullets": [], "industry_label": "General", "confidence": "low"}
-                            input_dict["industryBullets"] = self.context["industry_bullets"]
-                    
-                    # Log execution
-                    self.execution_log.append({
-                        "agent": agent.name,
-                        "status": "success",
-                        "timestamp": datetime.now().isoformat(),
-                        "output_keys": list(agent_output.keys())
-                    })
-                    
-                    logger.info(f"[OK] {agent.name} completed successfully")
-                    
-                except Exception as e:
-                    logger.error(f"[FAIL] {agent.name} failed: {str(e)}")
-                    logger.error(f"[TRACEBACK] Full error: ", exc_info=True)
-                    
-                    # Log failure
-                    self.execution_log.append({
-                        "agent": agent.name,
-                        "status": "failed",
-                        "timestamp": datetime.now().isoformat(),
-                        "error": str(e)
-                    })
-                    
-                    # Store error in context
-                    agent_key = self._get_agent_key(agent.name)
-                    self.context[agent_key] = {"error": str(e)}
-                    
-                    # If IdeaUnderstandingAgent fails, provide fallback profile
-                    if agent_key == "idea_understanding":
-                        logger.warning(f"[FALLBACK] IdeaUnderstandingAgent failed, providing minimal profile for downstream agents")
-                        fallback_profile = {
-                            "category": "General",
-                            "business_model": "Not specified",
-                            "capital_intensity": "Medium",
-                            "burn_profile": "Medium",
-                            "hardware_dependency": "Medium",
-                            "operational_complexity": "Medium",
-                            "regulation_risk": "Medium",
-                            "scalability_model": "Standard",
-                            "margin_profile": "Medium",
-                            "team_requirements": [],
-                            "confidence": "low",
-                            "notes": f"Fallback profile: {str(e)}"
-                        }
-                        self.context["idea_profile"] = fallback_profile
-                        input_dict["ideaProfile"] = fallback_profile
-            
-            # Step 3: Build consolidated output
-            logger.info("\n[STEP 3] Building consolidated report...")
-            output = self._build_output()
-            
-            # Calculate execution time
-            execution_time = (datetime.now() - start_time).total_seconds()
-            output["metadata"] = {
-                "execution_time_seconds": execution_time,
-                "timestamp": datetime.now().isoformat(),
-                "agents_executed": len(self.agents),
-                "execution_log": self.execution_log,
-                "cached": False  # This is a fresh execution
-            }
-            
-            logger.info(f"[COMPLETE] Analysis complete in {execution_time:.2f}s")
-            
-            # Step 4: Store result in cache for future requests
-            logger.info("\n[STEP 4] Storing result in cache...")
-            cache_ttl = 3600  # 1 hour TTL (can be configured via env)
-            cache_success = cache_set(cache_key, output, ttl=cache_ttl)
-            
-            if cache_success:
-                logger.info(f"[CACHE STORE] ✓ Result cached successfully (TTL: {cache_ttl}s)")
-            else:
-                logger.warning("[CACHE STORE] ✗ Failed to cache result (execution still successful)")
-            
-            logger.info("=" * 70)
-            
-            return output
-            
-        except Exception as e:
-            logger.error(f"\n[FAIL] Chain execution failed: {str(e)}")
-            raise
-    
-    def _get_agent_key(self, agent_name: str) -> str:
-        """
-        Convert agent class name to context key.
-        
-        Example: FundingStageAgent -> funding_stage
-        """
-        # Remove 'Agent' suffix and convert to snake_case
-        key = agent_name.replace("Agent", "")
-        
-        # Convert CamelCase to snake_case
-        import re
-        key = re.sub('([a-z0-9])([A-Z])', r'\1_\2', key).lower()
-        
-        return key
-    
-    def _build_output(self) -> Dict[str, Any]:
-        """
-        Build the final consolidated output from all agent results.
-        
-        Returns:
-            Structured financial strategy report
-        """
-        return {
-            "startup_name": self.context["input"]["startupName"],
-            "idea_understanding": self.context.get("idea_understanding", {}),
-            "industry_specialist": self.context.get("industry_specialist", {}),
-            "funding_stage": self.context.get("funding_stage", {}),
-            "raise_amount": self.context.get("raise_amount", {}),
-            "investor_type": self.context.get("investor_type", {}),
-            "runway": self.context.get("runway", {}),
-            "financial_priority": self.context.get("financial_priority", {}),
-            "summary": self._generate_summary()
-        }
-    
-    def _generate_summary(self) -> str:
-        """Generate a human-readable summary of the analysis."""
-        stage = self.context.get("funding_stage", {}).get("funding_stage", "N/A")
-        amount = self.context.get("raise_amount", {}).get("recommended_amount", "N/A")
-        investor = self.context.get("investor_type", {}).get("primary_investor_type", "N/A")
-        runway = self.context.get("runway", {}).get("estimated_runway_months", "N/A")
-        
-        return f"""Based on the analysis, {self.context['input']['startupName']} should target {stage} stage funding of {amount} from {investor}. This will provide approximately {runway} months of runway to achieve key milestones."""
-    
-    def get_execution_log(self) -> List[Dict[str, Any]]:
-        """Return the execution log for debugging."""
-        return self.execution_log
-    
-    def get_context(self) -> Dict[str, Any]:
-        """Return the full shared context."""
-        return self.context
-
+"""
+Chain Manager - Agent Orchestrator
+Executes the financial agent chain stage by stage and manages shared context.
+
+Agents are grouped into stages by what they read from each other; agents in
+the same stage are independent and run concurrently (InvestorType and Runway
+both only need the funding stage and raise amount).
+
+Set CHAIN_COMBINE_POST_STAGE=true to run InvestorType, Runway and
+FinancialPriority as one combined LLM call (PostStageAgent) instead of three.
+
+Set CHAIN_COMBINE_FINANCE=true to go further and run everything after
+IndustrySpecialist (FundingStage through FinancialPriority) as one combined
+LLM call (CombinedFinanceAgent) instead of five.
+
+Set CHAIN_PARALLEL_FIRST_STAGE=true to run IdeaUnderstanding and
+IndustrySpecialist concurrently. IndustrySpecialist then uses the input
+industry instead of the idea profile's category, so it is opt-in.
+
+Identical requests that arrive while one is running wait for that run instead
+of starting their own (single-flight). A waiter gives up after
+CHAIN_SINGLE_FLIGHT_TIMEOUT seconds (default 120) and runs the chain itself.
+"""
+
+import os
+import logging
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List
+from datetime import datetime
+
+import orjson
+
+from agents import (
+    FundingStageAgent,
+    RaiseAmountAgent,
+    InvestorTypeAgent,
+    RunwayAgent,
+    FinancialPriorityAgent,
+    IdeaUnderstandingAgent,
+    IndustrySpecialistAgent,
+    CombinedAgent,
+    PostStageAgent,
+    CombinedFinanceAgent,
+)
+from utils import validate_startup_input, input_to_dict, normalize_startup_data, IdeaProfile, IndustryBullets
+from utils.cache import compute_hash, cache_get, cache_set, UNCACHEABLE_KEY, FALLBACK_KEY_PREFIX
+from utils import prompt_templates
+from utils.tracing import get_tracer
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s [%(levelname)s] %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+tracer = get_tracer("finiq.chain")
+
+# Co-prompt the three agents that follow RaiseAmount in a single LLM call
+COMBINE_POST_STAGE = os.getenv("CHAIN_COMBINE_POST_STAGE", "false").lower().strip() in ("1", "true", "yes")
+
+# Co-prompt all five agents after IndustrySpecialist in a single LLM call (takes precedence)
+COMBINE_FINANCE = os.getenv("CHAIN_COMBINE_FINANCE", "false").lower().strip() in ("1", "true", "yes")
+
+# Run IdeaUnderstanding and IndustrySpecialist side by side (see module docstring)
+PARALLEL_FIRST_STAGE = os.getenv("CHAIN_PARALLEL_FIRST_STAGE", "false").lower().strip() in ("1", "true", "yes")
+
+# Worker threads for agents that share a stage (agents make blocking LLM calls)
+_stage_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="chain-stage")
+
+# Single-flight: cache key -> Future for a chain run that is already in progress,
+# so concurrent identical requests share one set of LLM calls
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Longest a coalesced request waits for the identical run before running the chain itself
+SINGLE_FLIGHT_TIMEOUT = float(os.getenv("CHAIN_SINGLE_FLIGHT_TIMEOUT", "120"))
+
+
+class ChainManager:
+    """
+    Orchestrates the financial agent chain.
+    
+    Flow:
+    1. Validate input
+    2. Execute agent stages in order (agents within a stage run concurrently)
+    3. Build shared context
+    4. Return consolidated output
+    """
+    
+    def __init__(self, api_key: str = None):
+        """
+        Initialize the chain manager and all agents.
+        
+        Args:
+            api_key: Gemini API key (passed to all agents)
+        """
+        logger.info("=" * 70)
+        logger.info("[INIT] Initializing FinIQ.ai Agent Chain")
+        logger.info("=" * 70)
+        
+        self.api_key = api_key
+        self.context: Dict[str, Any] = {}
+        self.execution_log: List[Dict[str, Any]] = []
+        
+        # Initialize all agents, grouped into stages
+        # Order: IdeaUnderstanding → IndustrySpecialist → FundingStage → RaiseAmount → (InvestorType | Runway) → FinancialPriority
+        # (the last three become a single PostStageAgent when COMBINE_POST_STAGE is on,
+        # the last five a single CombinedFinanceAgent when COMBINE_FINANCE is on)
+        try:
+            idea_agent = IdeaUnderstandingAgent(api_key=api_key)
+            industry_agent = IndustrySpecialistAgent(api_key=api_key)  # NEW: Hyper-specific niche bullets
+            self.stages: List[List[Any]] = (
+                [[idea_agent, industry_agent]] if PARALLEL_FIRST_STAGE
+                else [[idea_agent], [industry_agent]]
+            )
+            if COMBINE_FINANCE:
+                self.stages.append([CombinedFinanceAgent(api_key=api_key)])
+            else:
+                self.stages += [
+                    [FundingStageAgent(api_key=api_key)],
+                    [RaiseAmountAgent(api_key=api_key)],
+                ]
+                if COMBINE_POST_STAGE:
+                    self.stages.append([PostStageAgent(api_key=api_key)])
+                else:
+                    self.stages += [
+                        [InvestorTypeAgent(api_key=api_key), RunwayAgent(api_key=api_key)],
+                        [FinancialPriorityAgent(api_key=api_key)],
+                    ]
+            self.agents = [agent for stage in self.stages for agent in stage]
+            logger.info(f"[OK] Initialized {len(self.agents)} agents in {len(self.stages)} stages successfully")
+        except Exception as e:
+            logger.error(f"[FAIL] Failed to initialize agents: {str(e)}")
+            raise
+    
+    def run(self, raw_input: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the complete agent chain.
+        
+        Args:
+            raw_input: Raw startup input from frontend
+        
+        Returns:
+            Consolidated financial strategy report with 'cached' metadata
+        """
+        with tracer.start_as_current_span("chain.run") as root_span:
+            start_time = datetime.now()
+            logger.info("\n" + "=" * 70)
+            logger.info("[START] Starting FinIQ.ai Analysis")
+            logger.info("=" * 70)
+            
+            try:
+                # Step 1: Validate input
+                logger.info("\n[STEP 1] Validating input data...")
+                validated_input = validate_startup_input(raw_input)
+                input_dict = input_to_dict(validated_input)
+                
+                # Add snake_case aliases once so prompts can use a consistent shape
+                # (one-line description falls back to the name)
+                input_dict = normalize_startup_data(input_dict)
+                # Prefer a dedicated ideaDescription; fall back to tractionSummary if needed
+                input_dict["idea_description"] = (
+                    input_dict.get("ideaDescription")
+                    or input_dict.get("tractionSummary")
+                    or ""
+                )
+                
+                logger.info(f"[OK] Input validated for: {input_dict['startupName']}")
+                
+                # Step 1.5: Check cache before executing agents
+                logger.info("\n[CACHE CHECK] Computing cache key...")
+                cache_key = compute_hash(input_dict)
+                cached_result = cache_get(cache_key)
+                root_span.set_attribute("cached", bool(cached_result))
+                
+                if cached_result:
+                    # Cache hit - return immediately without calling agents
+                    execution_time = (datetime.now() - start_time).total_seconds()
+                    logger.info(f"[CACHE HIT] ⚡ Returning cached result in {execution_time:.3f}s")
+                    logger.info("=" * 70)
+                    
+                    # Add metadata to indicate this is cached (every cache hit is a fresh copy)
+                    cached_result.setdefault("metadata", {})
+                    cached_result["metadata"]["cached"] = True
+                    cached_result["metadata"]["cache_retrieval_time_seconds"] = execution_time
+                    cached_result["metadata"]["original_execution_time_seconds"] = cached_result["metadata"].get("execution_time_seconds", 0)
+                    
+                    return cached_result
+                
+                logger.info("[CACHE MISS] No cached result found, executing agent chain...")
+                
+                # Step 1.6: Coalesce identical requests that are already running
+                # (empty and fallback keys do not identify the input, so those always run)
+                if cache_key == UNCACHEABLE_KEY or cache_key.startswith(FALLBACK_KEY_PREFIX):
+                    return self._execute_chain(input_dict, cache_key, start_time)
+                
+                with _inflight_lock:
+                    inflight = _inflight.get(cache_key)
+                    is_owner = inflight is None
+                    if is_owner:
+                        inflight = _inflight[cache_key] = Future()
+                
+                if not is_owner:
+                    logger.info("[SINGLE-FLIGHT] Identical request already running, waiting for its result")
+                    try:
+                        result = inflight.result(timeout=SINGLE_FLIGHT_TIMEOUT)
+                    except TimeoutError:
+                        logger.warning(f"[SINGLE-FLIGHT] Identical run still busy after {SINGLE_FLIGHT_TIMEOUT:g}s, running the chain for this request")
+                        return self._execute_chain(input_dict, cache_key, start_time)
+                    root_span.set_attribute("coalesced", True)
+                    # Fresh copy, so waiters never share nested dicts with the owner's result
+                    result = orjson.loads(orjson.dumps(result))
+                    result.setdefault("metadata", {})["coalesced"] = True
+                    return result
+                
+                try:
+                    output = self._execute_chain(input_dict, cache_key, start_time)
+                    inflight.set_result(output)
+                    return output
+                except BaseException as e:
+                    inflight.set_exception(e)
+                    raise
+                finally:
+                    with _inflight_lock:
+                        _inflight.pop(cache_key, None)
+            
+            except Exception as e:
+                logger.error(f"\n[FAIL] Chain execution failed: {str(e)}")
+                raise
+    
+    def _execute_chain(self, input_dict: Dict[str, Any], cache_key: str, start_time: datetime) -> Dict[str, Any]:
+        """Run every agent on a cache miss, then cache and return the report."""
+        # Step 2: Execute agent chain
+        logger.info("\n[STEP 2] Executing agent chain...")
+        # Context and log are per run, so concurrent runs on this instance don't mix
+        # Bind the prompt templates once (normalization + core identity block) for every agent
+        context = {"input": input_dict, "prompts": prompt_templates.bind(input_dict)}
+        execution_log: List[Dict[str, Any]] = []
+        
+        agent_number = 0
+        for stage in self.stages:
+            for agent in stage:
+                agent_number += 1
+                logger.info(f"\n--- Agent {agent_number}/{len(self.agents)}: {agent.name} ---")
+            
+            if len(stage) == 1:
+                results = [self._run_agent(stage[0], input_dict, context)]
+            else:
+                logger.info(f"[PARALLEL] Running {', '.join(agent.name for agent in stage)} concurrently")
+                # Copy the tracing context so agent spans stay children of chain.run
+                futures = [
+                    _stage_pool.submit(contextvars.copy_context().run, self._run_agent, agent, input_dict, context)
+                    for agent in stage
+                ]
+                results = [future.result() for future in futures]
+            
+            # Record in stage order, so context and log match the sequential chain
+            for agent, agent_output, error in results:
+                if error is None:
+                    try:
+                        self._record_output(agent, agent_output, input_dict, context, execution_log)
+                        continue
+                    except Exception as e:
+                        error = e
+                self._record_failure(agent, error, input_dict, context, execution_log)
+        
+        # Step 3: Build consolidated output
+        logger.info("\n[STEP 3] Building consolidated report...")
+        output = self._build_output(context)
+        
+        # Calculate execution time
+        execution_time = (datetime.now() - start_time).total_seconds()
+        output["metadata"] = {
+            "execution_time_seconds": execution_time,
+            "timestamp": datetime.now().isoformat(),
+            "agents_executed": len(self.agents),
+            "execution_log": execution_log,
+            "cached": False  # This is a fresh execution
+        }
+        
+        logger.info(f"[COMPLETE] Analysis complete in {execution_time:.2f}s")
+        
+        # Keep the last completed run for the debug endpoint
+        self.context, self.execution_log = context, execution_log
+        
+        # Step 4: Store result in cache for future requests
+        logger.info("\n[STEP 4] Storing result in cache...")
+        cache_ttl = 3600  # 1 hour TTL (can be configured via env)
+        cache_success = cache_set(cache_key, output, ttl=cache_ttl)
+        
+        if cache_success:
+            logger.info(f"[CACHE STORE] ✓ Result cached successfully (TTL: {cache_ttl}s)")
+        else:
+            logger.warning("[CACHE STORE] ✗ Failed to cache result (execution still successful)")
+        
+        logger.info("=" * 70)
+        
+        return output
+    
+    def _run_agent(self, agent: Any, input_dict: Dict[str, Any], context: Dict[str, Any]) -> tuple:
+        """Run one agent; returns (agent, output, None) or (agent, None, exception)."""
+        try:
+            with tracer.start_as_current_span(f"agent.{agent.name}") as agent_span:
+                agent_span.set_attribute("cached", False)
+                return agent, agent.run(input_dict, context), None
+        except Exception as e:
+            return agent, None, e
+    
+    def _record_output(
+        self,
+        agent: Any,
+        agent_output: Dict[str, Any],
+        input_dict: Dict[str, Any],
+        context: Dict[str, Any],
+        execution_log: List[Dict[str, Any]],
+    ) -> None:
+        """Store a successful agent output in the run's shared context."""
+        # Store output in context
+        agent_key = self._get_agent_key(agent.name)
+        if isinstance(agent, CombinedAgent):
+            # Combined agents return one output per context key (investor_type, runway, ...)
+            context.update(agent_output)
+        else:
+            context[agent_key] = agent_output
+        
+        # Make idea understanding profile available to all downstream agents
+        if agent_key == "idea_understanding":
+            if agent_output and "error" not in agent_output:
+                context["idea_profile"] = agent_output
+                # Also attach (parsed once) to input dict so prompt templates can see it
+                input_dict["ideaProfile"] = IdeaProfile.from_dict(agent_output)
+                logger.info(f"[CONTEXT] Idea profile successfully stored with keys: {list(agent_output.keys())}")
+            else:
+                logger.warning(f"[CONTEXT] IdeaUnderstandingAgent returned error or empty output, using fallback for downstream agents")
+                # Set a minimal fallback profile so downstream agents don't fail
+                fallback_profile = {
+                    "category": "General",
+                    "business_model": "Not specified",
+                    "capital_intensity": "Medium",
+                    "burn_profile": "Medium",
+                    "hardware_dependency": "Medium",
+                    "operational_complexity": "Medium",
+                    "regulation_risk": "Medium",
+                    "scalability_model": "Standard",
+                    "margin_profile": "Medium",
+                    "team_requirements": [],
+                    "confidence": "low",
+                    "notes": "Fallback profile due to IdeaUnderstandingAgent failure"
+                }
+                context["idea_profile"] = fallback_profile
+                input_dict["ideaProfile"] = IdeaProfile.from_dict(fallback_profile)
+        
+        # Make industry specialist bullets available to all downstream agents
+        if agent_key == "industry_specialist":
+            if agent_output and "error" not in agent_output:
+                context["industry_bullets"] = agent_output
+                # Also attach (parsed once) to input dict so prompt templates can see it
+                input_dict["industryBullets"] = IndustryBullets.from_dict(agent_output)
+                bullets = agent_output.get("bullets", [])
+                logger.info(f"[CONTEXT] Industry bullets stored: {len(bullets)} bullets for '{agent_output.get('industry_label', 'Unknown')}'")
+            else:
+                logger.warning(f"[CONTEXT] IndustrySpecialistAgent returned error or empty output")
+                context["industry_bullets"] = {"bullets": [], "industry_label": "General", "confidence": "low"}
+                input_dict["industryBullets"] = IndustryBullets.from_dict(context["industry_bullets"])
+        
+        # Log execution
+        execution_log.append({
+            "agent": agent.name,
+            "status": "success",
+            "timestamp": datetime.now().isoformat(),
+            "output_keys": list(agent_output.keys())
+        })
+        
+        logger.info(f"[OK] {agent.name} completed successfully")
+    
+    def _record_failure(
+        self,
+        agent: Any,
+        e: Exception,
+        input_dict: Dict[str, Any],
+        context: Dict[str, Any],
+        execution_log: List[Dict[str, Any]],
+    ) -> None:
+        """Log a failed agent and store its error (plus fallbacks) in the run's shared context."""
+        logger.error(f"[FAIL] {agent.name} failed: {str(e)}")
+        logger.error(f"[TRACEBACK] Full error: ", exc_info=e)
+        
+        # Log failure
+        execution_log.append({
+            "agent": agent.name,
+            "status": "failed",
+            "timestamp": datetime.now().isoformat(),
+            "error": str(e)
+        })
+        
+        # Store error in context
+        agent_key = self._get_agent_key(agent.name)
+        if isinstance(agent, CombinedAgent):
+            # Combined agents own several report sections: surface the error in each
+            for context_key in agent.context_keys:
+                context[context_key] = {"error": str(e)}
+        else:
+            context[agent_key] = {"error": str(e)}
+        
+        # If IdeaUnderstandingAgent fails, provide fallback profile
+        if agent_key == "idea_understanding":
+            logger.warning(f"[FALLBACK] IdeaUnderstandingAgent failed, providing minimal profile for downstream agents")
+            fallback_profile = {
+                "category": "General",
+                "business_model": "Not specified",
+                "capital_intensity": "Medium",
+                "burn_profile": "Medium",
+                "hardware_dependency": "Medium",
+                "operational_complexity": "Medium",
+                "regulation_risk": "Medium",
+                "scalability_model": "Standard",
+                "margin_profile": "Medium",
+                "team_requirements": [],
+                "confidence": "low",
+                "notes": f"Fallback profile: {str(e)}"
+            }
+            context["idea_profile"] = fallback_profile
+            input_dict["ideaProfile"] = IdeaProfile.from_dict(fallback_profile)
+    
+    def _get_agent_key(self, agent_name: str) -> str:
+        """
+        Convert agent class name to context key.
+        
+        Example: FundingStageAgent -> funding_stage
+        """
+        # Remove 'Agent' suffix and convert to snake_case
+        key = agent_name.replace("Agent", "")
+        
+        # Convert CamelCase to snake_case
+        import re
+        key = re.sub('([a-z0-9])([A-Z])', r'\1_\2', key).lower()
+        
+        return key
+    
+    def _build_output(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the final consolidated output from all agent results.
+        
+        Args:
+            context: Shared context of the finished run
+        
+        Returns:
+            Structured financial strategy report
+        """
+        return {
+            "startup_name": context["input"]["startupName"],
+            "idea_understanding": context.get("idea_understanding", {}),
+            "industry_specialist": context.get("industry_specialist", {}),
+            "funding_stage": context.get("funding_stage", {}),
+            "raise_amount": context.get("raise_amount", {}),
+            "investor_type": context.get("investor_type", {}),
+            "runway": context.get("runway", {}),
+            "financial_priority": context.get("financial_priority", {}),
+            "summary": self._generate_summary(context)
+        }
+    
+    def _generate_summary(self, context: Dict[str, Any]) -> str:
+        """Generate a human-readable summary of the analysis."""
+        stage = context.get("funding_stage", {}).get("funding_stage", "N/A")
+        amount = context.get("raise_amount", {}).get("recommended_amount", "N/A")
+        investor = context.get("investor_type", {}).get("primary_investor_type", "N/A")
+        runway = context.get("runway", {}).get("estimated_runway_months", "N/A")
+        
+        return f"""Based on the analysis, {context['input']['startupName']} should target {stage} stage funding of {amount} from {investor}. This will provide approximately {runway} months of runway to achieve key milestones."""
+    
+    def get_execution_log(self) -> List[Dict[str, Any]]:
+        """Return the last completed run's execution log for debugging."""
+        return self.execution_log
+    
+    def get_context(self) -> Dict[str, Any]:
+        """Return the full shared context of the last completed run."""
+        return self.context
+
@@ -0,0 +1,232 @@
+"""
+Test script for the Redis metrics manager.
+Runs against fakeredis when it is installed, otherwise against REDIS_URL.
+"""
+
+import sys
+import os
+import asyncio
+import uuid
+
+# Add backend directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import redis.asyncio as aioredis
+from utils import redis_manager
+from utils.redis_manager import RedisMetricsManager
+
+try:
+    import fakeredis
+    FAKEREDIS_AVAILABLE = True
+except ImportError:
+    FAKEREDIS_AVAILABLE = False
+
+# Unique per run, so a real Redis never sees clashing keys
+RUN_ID = uuid.uuid4().hex[:8]
+
+def user(name):
+    return f"test-{RUN_ID}-{name}"
+
+
+async def make_manager():
+    """Metrics manager on fakeredis (with Lua support) or the configured Redis"""
+    if FAKEREDIS_AVAILABLE:
+        redis_url = "redis://fakeredis/0"
+        redis_manager._pools[redis_url] = aioredis.BlockingConnectionPool(
+            connection_class=fakeredis.FakeAsyncConnection,
+            server=fakeredis.FakeServer(),
+            decode_responses=True,
+        )
+    else:
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    manager = RedisMetricsManager(redis_url)
+    print(f"Backend: {'fakeredis' if FAKEREDIS_AVAILABLE else redis_url}")
+    return manager, await manager.connect()
+
+
+async def cleanup(manager, *names):
+    for name in names:
+        await manager.client.delete(*redis_manager._rating_keys(user(name)))
+
+
+async def test_running_rating_totals():
+    """Test that new ratings and re-ratings keep the running sum/count exact"""
+    print("\n" + "="*70)
+    print("TEST 1: Running Rating Sum/Count")
+    print("="*70)
+    
+    manager, connected = await make_manager()
+    if not connected:
+        print("✗ No Redis available")
+        return False
+    
+    try:
+        feedback_key, sum_key, count_key = redis_manager._rating_keys(user("rater"))
+        await manager.add_feedback(user("rater"), "s1", 4)
+        await manager.add_feedback(user("rater"), "s2", 5)
+        first = (await manager.get_average_rating(user("rater")), await manager.client.get(sum_key), await manager.client.get(count_key))
+        print(f"After 4 and 5: average/sum/count = {first}")
+        
+        # Re-rating shifts the sum by the difference and keeps the count
+        await manager.add_feedback(user("rater"), "s1", 2)
+        second = (await manager.get_average_rating(user("rater")), await manager.client.get(sum_key), await manager.client.get(count_key))
+        print(f"After re-rating s1 to 2: average/sum/count = {second}")
+        
+        rejected = not await manager.add_feedback(user("rater"), "s3", 6)
+        print(f"✓ Out-of-range rating rejected: {rejected}")
+        ttl = await manager.client.ttl(count_key)
+        print(f"✓ Totals expire with the hash: {ttl > 0}")
+        
+        return (
+            first == (4.5, "9", "2")
+            and second == (3.5, "7", "2")
+            and rejected
+            and await manager.get_average_rating(user("rater")) == 3.5
+            and ttl > 0
+        )
+    finally:
+        await cleanup(manager, "rater")
+        await manager.close()
+
+
+async def test_legacy_hash_rebuild():
+    """Test that hashes stored before the running totals are read and rebuilt"""
+    print("\n" + "="*70)
+    print("TEST 2: Legacy Rating Hash")
+    print("="*70)
+    
+    manager, connected = await make_manager()
+    if not connected:
+        print("✗ No Redis available")
+        return False
+    
+    try:
+        feedback_key, sum_key, count_key = redis_manager._rating_keys(user("legacy"))
+        await manager.client.hset(feedback_key, mapping={"x": 2, "y": 3})
+        before = await manager.get_average_rating(user("legacy"))
+        print(f"Average without totals: {before}")
+        
+        # The first new rating rebuilds the totals from the hash, then adds itself
+        await manager.add_feedback(user("legacy"), "z", 4)
+        after = (await manager.get_average_rating(user("legacy")), await manager.client.get(sum_key), await manager.client.get(count_key))
+        print(f"After a new rating: average/sum/count = {after}")
+        
+        return before == 2.5 and after == (3.0, "9", "3")
+    finally:
+        await cleanup(manager, "legacy")
+        await manager.close()
+
+
+async def test_bulk_average_ratings():
+    """Test averages for many users in one pipeline"""
+    print("\n" + "="*70)
+    print("TEST 3: Bulk Average Ratings")
+    print("="*70)
+    
+    manager, connected = await make_manager()
+    if not connected:
+        print("✗ No Redis available")
+        return False
+    
+    try:
+        await manager.add_feedback(user("a"), "s1", 4)
+        await manager.add_feedback(user("a"), "s2", 5)
+        await manager.add_feedback(user("b"), "s1", 1)
+        await manager.client.hset(redis_manager._rating_keys(user("legacy"))[0], mapping={"x": 2, "y": 3})
+        
+        averages = await manager.bulk_average_ratings([user("a"), user("b"), user("legacy"), user("none")])
+        print(f"Averages: {list(averages.values())}")
+        empty = await manager.bulk_average_ratings([])
+        print(f"✓ Empty input: {empty == {}}")
+        
+        return averages == {user("a"): 4.5, user("b"): 1.0, user("legacy"): 2.5, user("none"): 0.0} and empty == {}
+    finally:
+        await cleanup(manager, "a", "b", "legacy")
+        await manager.close()
+
+
+async def test_null_redis_fallback():
+    """Test that every method degrades to its empty reply without Redis"""
+    print("\n" + "="*70)
+    print("TEST 4: Unreachable Redis (_NullRedis)")
+    print("="*70)
+    
+    manager = RedisMetricsManager("redis://127.0.0.1:1/0")
+    connected = await manager.connect()
+    print(f"✓ Connect fails: {not connected}")
+    print(f"✓ Falls back to _NullRedis: {not manager.client}")
+    
+    replies = {
+        "increment_generation_count": await manager.increment_generation_count("u"),
+        "get_generation_count": await manager.get_generation_count("u"),
+        "add_feedback": await manager.add_feedback("u", "s", 4),
+        "get_average_rating": await manager.get_average_rating("u"),
+        "bulk_average_ratings": await manager.bulk_average_ratings(["u", "v"]),
+        "update_last_active": await manager.update_last_active("u"),
+        "get_user_metrics": await manager.get_user_metrics("u"),
+        "create_session": await manager.create_session("u", {"a": 1}),
+        "get_session": await manager.get_session("u"),
+        "delete_session": await manager.delete_session("u"),
+    }
+    for name, reply in replies.items():
+        print(f"{name}: {reply!r}")
+    
+    return not connected and not manager.client and replies == {
+        "increment_generation_count": 0,
+        "get_generation_count": 0,
+        "add_feedback": False,
+        "get_average_rating": 0.0,
+        "bulk_average_ratings": {"u": 0.0, "v": 0.0},
+        "update_last_active": False,
+        "get_user_metrics": {"generation_count": 0, "average_rating": 0.0, "last_active": None},
+        "create_session": False,
+        "get_session": None,
+        "delete_session": False,
+    }
+
+
+async def run_tests():
+    tests = [
+        ("Running Rating Sum/Count", test_running_rating_totals),
+        ("Legacy Rating Hash", test_legacy_hash_rebuild),
+        ("Bulk Average Ratings", test_bulk_average_ratings),
+        ("Unreachable Redis", test_null_redis_fallback),
+    ]
+    
+    results = []
+    for test_name, test_func in tests:
+        try:
+            passed = await test_func()
+            results.append((test_name, passed))
+        except Exception as e:
+            print(f"✗ Test failed with error: {e}")
+            results.append((test_name, False))
+    return results
+
+
+def main():
+    """Run all metrics tests"""
+    print("\n" + "="*70)
+    print("FinIQ.ai Redis Metrics Test Suite")
+    print("="*70)
+    
+    results = asyncio.run(run_tests())
+    
+    # Summary
+    print("\n" + "="*70)
+    print("TEST SUMMARY")
+    print("="*70)
+    
+    for test_name, passed in results:
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"{status}: {test_name}")
+    
+    total = len(results)
+    passed = sum(1 for _, p in results if p)
+    
+    print(f"\nTotal: {passed}/{total} tests passed")
+    return 0 if passed == total else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
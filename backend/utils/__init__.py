@@ -1,20 +1,32 @@
-"""
-Utility Package
-Contains prompt templates, validation, caching, and helper functions.
-"""
-
-from .prompt_templates import PromptTemplates
-from .data_validation import validate_startup_input, input_to_dict
-from .cache import compute_hash, cache_get, cache_set, cache_clear, get_cache_stats
-
-__all__ = [
-    "PromptTemplates",
-    "validate_startup_input",
-    "input_to_dict",
-    "compute_hash",
-    "cache_get",
-    "cache_set",
-    "cache_clear",
-    "get_cache_stats",
-]
-
+"""
+Utility Package
+Contains prompt templates, validation, caching, and helper functions.
+"""
+
+from .prompt_templates import BoundPromptTemplates, StartupContext
+from .data_validation import (
+    validate_startup_input,
+    input_to_dict,
+    normalize_startup_data,
+    IdeaProfile,
+    IndustryBullets,
+)
+from .cache import compute_hash, cache_get, cache_set, cache_mget, cache_mset, cache_clear, get_cache_stats
+
+__all__ = [
+    "BoundPromptTemplates",
+    "StartupContext",
+    "validate_startup_input",
+    "input_to_dict",
+    "normalize_startup_data",
+    "IdeaProfile",
+    "IndustryBullets",
+    "compute_hash",
+    "cache_get",
+    "cache_set",
+    "cache_mget",
+    "cache_mset",
+    "cache_clear",
+    "get_cache_stats",
+]
+
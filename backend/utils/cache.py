@@ -1,362 +1,862 @@
-"""
-Cache Utility for FinIQ.ai
-Provides production-ready caching with Redis + file-based fallback.
-
-Features:
-- Stable hash generation from input data
-- Redis caching (primary)
-- File-based caching (fallback)
-- Graceful error handling
-- Cache versioning
-- TTL support
-"""
-
-import json
-import hashlib
-import os
-import logging
-from typing import Any, Dict, Optional
-from pathlib import Path
-from datetime import datetime
-
-logger = logging.getLogger(__name__)
-
-# Cache version - increment when prompt templates or agent logic changes
-CACHE_VERSION = "v1"
-
-# Try to import Redis
-try:
-    import redis
-    REDIS_AVAILABLE = True
-    logger.info("[CACHE] Redis library available")
-except ImportError:
-    REDIS_AVAILABLE = False
-    logger.warning("[CACHE] Redis not installed, using file-based cache only")
-
-# Initialize Redis client (lazy)
-_redis_client = None
-_redis_initialized = False
-
-
-def _get_redis_client():
-    """
-    Get or initialize Redis client.
-    Lazy initialization to avoid connection errors on startup.
-    
-    Returns:
-        Redis client or None if unavailable/failed
-    """
-    global _redis_client, _redis_initialized
-    
-    if _redis_initialized:
-        return _redis_client
-    
-    _redis_initialized = True
-    
-    if not REDIS_AVAILABLE:
-        logger.info("[CACHE] Redis library not available, skipping Redis initialization")
-        return None
-    
-    try:
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-        _redis_client = redis.from_url(
-            redis_url,
-            decode_responses=True,  # Auto-decode bytes to strings
-            socket_connect_timeout=2,  # 2 second timeout
-            socket_timeout=2,
-            retry_on_timeout=False
-        )
-        
-        # Test connection
-        _redis_client.ping()
-        logger.info(f"[CACHE] ✓ Redis connected successfully: {redis_url}")
-        return _redis_client
-        
-    except Exception as e:
-        logger.warning(f"[CACHE] Redis connection failed: {e}. Falling back to file cache.")
-        _redis_client = None
-        return None
-
-
-def compute_hash(input_data: Dict[str, Any]) -> str:
-    """
-    Generate a stable, deterministic hash from input data.
-    
-    The hash is used as the cache key. It must be:
-    - Deterministic (same input → same hash)
-    - Stable (order-independent)
-    - Version-aware (invalidates on prompt changes)
-    
-    Args:
-        input_data: Startup input dictionary (must be JSON-serializable)
-        
-    Returns:
-        Cache key in format: "{version}:{sha256_hash}"
-    """
-    try:
-        # Create a copy to avoid mutating original
-        cache_input = dict(input_data)
-        
-        # Remove fields that should NOT affect cache
-        # (These are metadata that don't impact the strategy)
-        exclude_keys = {
-            'user_id', 'timestamp', 'execution_time_seconds',
-            'tokens_used', 'remaining_trials', 'metadata',
-            'generatedAt', 'processingTime'
-        }
-        for key in exclude_keys:
-            cache_input.pop(key, None)
-        
-        # Sort keys for deterministic serialization
-        stringified = json.dumps(cache_input, sort_keys=True, ensure_ascii=False)
-        
-        # Generate SHA-256 hash
-        hash_digest = hashlib.sha256(stringified.encode('utf-8')).hexdigest()
-        
-        # Return versioned key
-        cache_key = f"{CACHE_VERSION}:{hash_digest}"
-        
-        logger.debug(f"[CACHE] Computed hash: {cache_key[:20]}... for input: {cache_input.get('startupName', 'unknown')}")
-        return cache_key
-        
-    except Exception as e:
-        logger.error(f"[CACHE] Failed to compute hash: {e}", exc_info=True)
-        # Fallback: use timestamp-based key (won't cache effectively, but won't break)
-        fallback_key = f"{CACHE_VERSION}:fallback_{int(datetime.now().timestamp())}"
-        return fallback_key
-
-
-def cache_set(key: str, value: Dict[str, Any], ttl: int = 3600) -> bool:
-    """
-    Store a value in the cache with TTL.
-    
-    Tries Redis first, falls back to file cache if Redis unavailable.
-    
-    Args:
-        key: Cache key (from compute_hash)
-        value: Dictionary to cache (must be JSON-serializable)
-        ttl: Time-to-live in seconds (default: 1 hour)
-        
-    Returns:
-        True if successfully cached, False otherwise
-    """
-    if not key or not value:
-        logger.warning("[CACHE] Cannot cache empty key or value")
-        return False
-    
-    try:
-        # Add cache metadata
-        cached_value = {
-            "data": value,
-            "cached_at": datetime.now().isoformat(),
-            "ttl": ttl,
-            "version": CACHE_VERSION
-        }
-        
-        serialized = json.dumps(cached_value, ensure_ascii=False)
-        
-        # Try Redis first
-        redis_client = _get_redis_client()
-        if redis_client:
-            try:
-                redis_client.setex(
-                    name=f"finiq:strategy:{key}",
-                    time=ttl,
-                    value=serialized
-                )
-                logger.info(f"[CACHE] ✓ Stored in Redis: {key[:20]}... (TTL: {ttl}s)")
-                return True
-            except Exception as e:
-                logger.warning(f"[CACHE] Redis set failed: {e}, falling back to file cache")
-        
-        # Fallback to file cache
-        cache_dir = Path("cache")
-        cache_dir.mkdir(exist_ok=True)
-        
-        cache_file = cache_dir / f"{key}.json"
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cached_value, f, ensure_ascii=False, indent=2)
-        
-        logger.info(f"[CACHE] ✓ Stored in file: {cache_file.name}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"[CACHE] Failed to cache value: {e}", exc_info=True)
-        return False
-
-
-def cache_get(key: str) -> Optional[Dict[str, Any]]:
-    """
-    Retrieve a value from the cache.
-    
-    Tries Redis first, falls back to file cache if Redis unavailable.
-    
-    Args:
-        key: Cache key (from compute_hash)
-        
-    Returns:
-        Cached dictionary or None if not found/expired/invalid
-    """
-    if not key:
-        logger.warning("[CACHE] Cannot retrieve with empty key")
-        return None
-    
-    try:
-        # Try Redis first
-        redis_client = _get_redis_client()
-        if redis_client:
-            try:
-                cached_data = redis_client.get(f"finiq:strategy:{key}")
-                if cached_data:
-                    parsed = json.loads(cached_data)
-                    
-                    # Validate version
-                    if parsed.get("version") != CACHE_VERSION:
-                        logger.info(f"[CACHE] ✗ Version mismatch in Redis, skipping cache")
-                        return None
-                    
-                    logger.info(f"[CACHE] ✓ Hit (Redis): {key[:20]}...")
-                    return parsed.get("data")
-                    
-            except json.JSONDecodeError as e:
-                logger.error(f"[CACHE] Invalid JSON in Redis cache: {e}")
-                return None
-            except Exception as e:
-                logger.warning(f"[CACHE] Redis get failed: {e}, trying file cache")
-        
-        # Fallback to file cache
-        cache_file = Path("cache") / f"{key}.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    parsed = json.load(f)
-                
-                # Validate version
-                if parsed.get("version") != CACHE_VERSION:
-                    logger.info(f"[CACHE] ✗ Version mismatch in file, deleting stale cache")
-                    cache_file.unlink(missing_ok=True)
-                    return None
-                
-                # Check TTL (file cache doesn't auto-expire)
-                cached_at = datetime.fromisoformat(parsed.get("cached_at", "2000-01-01"))
-                ttl = parsed.get("ttl", 3600)
-                age_seconds = (datetime.now() - cached_at).total_seconds()
-                
-                if age_seconds > ttl:
-                    logger.info(f"[CACHE] ✗ Expired file cache (age: {age_seconds:.0f}s > TTL: {ttl}s)")
-                    cache_file.unlink(missing_ok=True)
-                    return None
-                
-                logger.info(f"[CACHE] ✓ Hit (File): {cache_file.name}")
-                return parsed.get("data")
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"[CACHE] Invalid JSON in file cache: {e}")
-                cache_file.unlink(missing_ok=True)
-                return None
-            except Exception as e:
-                logger.error(f"[CACHE] Failed to read file cache: {e}")
-                return None
-        
-        # Cache miss
-        logger.info(f"[CACHE] ✗ Miss: {key[:20]}...")
-        return None
-        
-    except Exception as e:
-        logger.error(f"[CACHE] Unexpected error in cache_get: {e}", exc_info=True)
-        return None
-
-
-def cache_clear(pattern: Optional[str] = None) -> int:
-    """
-    Clear cache entries.
-    
-    Args:
-        pattern: Optional pattern to match keys (e.g., "v1:*")
-                If None, clears all FinIQ cache entries
-    
-    Returns:
-        Number of entries cleared
-    """
-    cleared = 0
-    
-    try:
-        # Clear Redis
-        redis_client = _get_redis_client()
-        if redis_client:
-            try:
-                if pattern:
-                    keys = redis_client.keys(f"finiq:strategy:{pattern}")
-                else:
-                    keys = redis_client.keys("finiq:strategy:*")
-                
-                if keys:
-                    cleared += redis_client.delete(*keys)
-                    logger.info(f"[CACHE] Cleared {cleared} Redis entries")
-            except Exception as e:
-                logger.error(f"[CACHE] Failed to clear Redis: {e}")
-        
-        # Clear file cache
-        cache_dir = Path("cache")
-        if cache_dir.exists():
-            for cache_file in cache_dir.glob("*.json"):
-                try:
-                    cache_file.unlink()
-                    cleared += 1
-                except Exception as e:
-                    logger.error(f"[CACHE] Failed to delete {cache_file}: {e}")
-        
-        logger.info(f"[CACHE] Total cleared: {cleared} entries")
-        return cleared
-        
-    except Exception as e:
-        logger.error(f"[CACHE] Failed to clear cache: {e}", exc_info=True)
-        return cleared
-
-
-def get_cache_stats() -> Dict[str, Any]:
-    """
-    Get cache statistics for monitoring.
-    
-    Returns:
-        Dictionary with cache stats (size, hits, misses, etc.)
-    """
-    stats = {
-        "redis_available": False,
-        "redis_connected": False,
-        "file_cache_entries": 0,
-        "file_cache_size_mb": 0.0,
-        "cache_version": CACHE_VERSION
-    }
-    
-    try:
-        # Redis stats
-        redis_client = _get_redis_client()
-        if redis_client:
-            stats["redis_available"] = True
-            try:
-                redis_client.ping()
-                stats["redis_connected"] = True
-                
-                # Count keys
-                keys = redis_client.keys("finiq:strategy:*")
-                stats["redis_entries"] = len(keys)
-                
-            except Exception as e:
-                logger.error(f"[CACHE] Failed to get Redis stats: {e}")
-        
-        # File cache stats
-        cache_dir = Path("cache")
-        if cache_dir.exists():
-            files = list(cache_dir.glob("*.json"))
-            stats["file_cache_entries"] = len(files)
-            
-            total_size = sum(f.stat().st_size for f in files)
-            stats["file_cache_size_mb"] = round(total_size / (1024 * 1024), 2)
-        
-        return stats
-        
-    except Exception as e:
-        logger.error(f"[CACHE] Failed to get cache stats: {e}", exc_info=True)
-        return stats
-
+"""
+Cache Utility for FinIQ.ai
+Provides production-ready caching with Redis + file-based fallback.
+
+Features:
+- Stable hash generation from input data (xxh3_64, non-cryptographic)
+- In-process tier (L1) in front of Redis/file for hot keys, with value-aware
+  admission and eviction
+- Redis caching (primary), with pipelined batch get/set (cache_mget / cache_mset)
+- File-based caching (fallback)
+- Graceful error handling
+- Cache versioning
+- TTL support
+- Background sweeper for expired / over-capacity file cache entries
+"""
+
+import os
+import glob
+import math
+import time
+import fnmatch
+import asyncio
+import itertools
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+
+import orjson
+import xxhash
+
+from .tracing import get_tracer
+
+logger = logging.getLogger(__name__)
+tracer = get_tracer("finiq.cache")
+
+# Cache version - increment when prompt templates or agent logic changes
+CACHE_VERSION = "v2"
+
+# Keys fetched per SCAN call / removed per pipelined UNLINK
+_SCAN_BATCH_SIZE = 500
+
+# Separates the cache key from the expiry timestamp in file cache names
+_FILE_EXPIRY_MARKER = "__exp"
+
+# Worker threads used by cache_mget to read file cache entries in parallel
+_FILE_READ_WORKERS = 8
+
+# Sweeper deletes orphaned temp files (from interrupted writes) older than this
+_TMP_FILE_MAX_AGE = 60
+
+# get_cache_stats stops counting Redis entries after this many keys
+_STATS_SCAN_LIMIT = 10_000
+
+# Metadata fields that don't impact the strategy, so they never affect the cache key
+_HASH_EXCLUDE_KEYS = frozenset({
+    'user_id', 'timestamp', 'execution_time_seconds',
+    'tokens_used', 'remaining_trials', 'metadata',
+    'generatedAt', 'processingTime'
+})
+
+# Key returned by compute_hash for inputs with no strategy-affecting fields;
+# cache_get/cache_set treat it as a no-op
+UNCACHEABLE_KEY = f"{CACHE_VERSION}:empty"
+
+# Prefix of the timestamp key compute_hash returns when hashing fails; such keys
+# do not identify the input, so callers must not treat them as equal requests
+FALLBACK_KEY_PREFIX = f"{CACHE_VERSION}:fallback_"
+
+# orjson options for hashing values: sorted nested keys keep the digest order-independent
+_HASH_VALUE_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+# In-process tier in front of Redis/file, kept in recency order (oldest first).
+# Entries hold the serialized entry exactly as stored in Redis/file (no second
+# encode) and every hit decodes a fresh copy, so, like a Redis/file hit, callers
+# never share (or mutate) the stored object.
+_L1: "OrderedDict[str, _L1Entry]" = OrderedDict()
+_L1_MAX = int(os.getenv("CACHE_L1_MAX_ENTRIES", "512"))
+_L1_LOCK = threading.Lock()
+
+# Values larger than this are only admitted to L1 once the key has been seen
+# again (i.e. it has shown reuse); one-off large responses stay in Redis/file.
+_L1_MAX_ENTRY_BYTES = int(os.getenv("CACHE_L1_MAX_ENTRY_BYTES", "65536"))
+
+# Eviction considers only the least recently used fraction of L1
+_L1_EVICTION_WINDOW = 0.1
+
+# Keys of recently declined large values, so a repeat request gets admitted
+_L1_GHOSTS: "OrderedDict[str, None]" = OrderedDict()
+
+# Try to import Redis
+try:
+    import redis
+    REDIS_AVAILABLE = True
+    logger.info("[CACHE] Redis library available")
+except ImportError:
+    REDIS_AVAILABLE = False
+    logger.warning("[CACHE] Redis not installed, using file-based cache only")
+
+# Initialize Redis client (lazy)
+_redis_client = None
+_redis_initialized = False
+
+
+def _get_redis_client():
+    """
+    Get or initialize Redis client.
+    Lazy initialization to avoid connection errors on startup.
+    
+    Returns:
+        Redis client or None if unavailable/failed
+    """
+    global _redis_client, _redis_initialized
+    
+    if _redis_initialized:
+        return _redis_client
+    
+    _redis_initialized = True
+    
+    if not REDIS_AVAILABLE:
+        logger.info("[CACHE] Redis library not available, skipping Redis initialization")
+        return None
+    
+    try:
+        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+        # Pool of sockets so concurrent requests don't queue on a single connection.
+        # Blocking pool: when all connections are busy, wait up to `timeout` instead of erroring.
+        pool = redis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=int(os.getenv("REDIS_CACHE_MAX_CONNECTIONS", "32")),
+            timeout=2,
+            decode_responses=False,  # Payloads stay bytes; orjson parses them directly
+            socket_connect_timeout=2,  # 2 second timeout
+            socket_timeout=2,
+            retry_on_timeout=False
+        )
+        _redis_client = redis.Redis(connection_pool=pool)
+        
+        # Test connection
+        _redis_client.ping()
+        logger.info(f"[CACHE] ✓ Redis connected successfully: {redis_url}")
+        return _redis_client
+        
+    except Exception as e:
+        logger.warning(f"[CACHE] Redis connection failed: {e}. Falling back to file cache.")
+        _redis_client = None
+        return None
+
+
+def _file_cache_name(key: str, expires_at: int) -> str:
+    """File cache entries carry their expiry in the name: {key}__exp{unix_ts}.json"""
+    return f"{key}{_FILE_EXPIRY_MARKER}{expires_at}.json"
+
+
+def _parse_file_expiry(name: str) -> Optional[int]:
+    """Return the expiry timestamp encoded in a cache filename, or None if absent/invalid."""
+    _, marker, suffix = name.rpartition(_FILE_EXPIRY_MARKER)
+    if not marker or not suffix.endswith(".json"):
+        return None
+    try:
+        return int(suffix[:-5])
+    except ValueError:
+        return None
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write bytes straight to a raw fd, skipping Python's buffered file layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            # os.write may be partial for large buffers; resume without copying
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _file_cache_entries(cache_dir: Path, key: str) -> list:
+    """All cache files for a key (normally at most one)."""
+    return list(cache_dir.glob(f"{glob.escape(key)}{_FILE_EXPIRY_MARKER}*.json"))
+
+
+class _L1Entry:
+    __slots__ = ("expires_at", "hits", "created_at", "last_access", "size_bytes", "payload")
+
+    def __init__(self, expires_at: float, payload: bytes):
+        now = time.time()
+        self.expires_at = expires_at
+        self.hits = 0
+        self.created_at = now
+        self.last_access = now
+        self.size_bytes = len(payload)
+        self.payload = payload
+
+    def value(self, now: float) -> float:
+        """Caching value: large, young and frequently hit entries score highest."""
+        age = max(now - self.created_at, 1.0)
+        return math.log(self.size_bytes / age + self.hits + 1e-6)
+
+
+def _l1_get(key: str) -> Optional[Dict[str, Any]]:
+    with _L1_LOCK:
+        entry = _L1.get(key)
+        if entry is None:
+            return None
+        now = time.time()
+        if entry.expires_at <= now:
+            del _L1[key]
+            return None
+        entry.hits += 1
+        entry.last_access = now
+        _L1.move_to_end(key)
+        payload = entry.payload
+    return orjson.loads(payload).get("data")
+
+
+def _l1_evict_one() -> None:
+    """Evict the lowest-value entry among the least recently used ones."""
+    window = max(1, int(len(_L1) * _L1_EVICTION_WINDOW))
+    now = time.time()
+    victim = min(
+        itertools.islice(_L1.items(), window),
+        key=lambda item: item[1].value(now),
+    )[0]
+    del _L1[victim]
+
+
+def _l1_put(key: str, payload: bytes, expires_at: float) -> None:
+    """Keep a serialized cache entry (as stored in Redis/file) in L1."""
+    if _L1_MAX <= 0:
+        return
+    with _L1_LOCK:
+        if len(payload) > _L1_MAX_ENTRY_BYTES and key not in _L1:
+            if key not in _L1_GHOSTS:
+                _L1_GHOSTS[key] = None
+                while len(_L1_GHOSTS) > _L1_MAX:
+                    _L1_GHOSTS.popitem(last=False)
+                return
+            del _L1_GHOSTS[key]
+        
+        _L1[key] = _L1Entry(expires_at, payload)
+        _L1.move_to_end(key)
+        while len(_L1) > _L1_MAX:
+            _l1_evict_one()
+
+
+def compute_hash(input_data: Dict[str, Any]) -> str:
+    """
+    Generate a stable, deterministic hash from input data.
+    
+    The hash is used as the cache key. It must be:
+    - Deterministic (same input → same hash)
+    - Stable (order-independent)
+    - Version-aware (invalidates on prompt changes)
+    
+    Args:
+        input_data: Startup input dictionary (must be JSON-serializable)
+        
+    Returns:
+        Cache key in format: "{version}:{xxh3_64_hash}", or UNCACHEABLE_KEY
+        if no strategy-affecting field is present
+    """
+    try:
+        # Copy without the fields that don't affect the strategy
+        cache_input = {k: v for k, v in input_data.items() if k not in _HASH_EXCLUDE_KEYS}
+        
+        # Nothing strategy-relevant: every such request would share one key,
+        # so hand back the uncacheable sentinel instead
+        if not cache_input:
+            return UNCACHEABLE_KEY
+        
+        # Stream sorted key/value pairs into the hasher instead of building one
+        # large JSON string. xxh3_64 is fine here: the key needs no cryptographic property.
+        hasher = xxhash.xxh3_64()
+        for field in sorted(cache_input):
+            hasher.update(field.encode('utf-8'))
+            hasher.update(b'\x00')
+            hasher.update(orjson.dumps(cache_input[field], option=_HASH_VALUE_OPTIONS, default=str))
+            hasher.update(b'\x00')
+        hash_digest = hasher.hexdigest()
+        
+        # Return versioned key
+        cache_key = f"{CACHE_VERSION}:{hash_digest}"
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[CACHE] Computed hash: %.20s... for input: %s", cache_key, cache_input.get('startupName', 'unknown'))
+        return cache_key
+        
+    except Exception as e:
+        logger.error(f"[CACHE] Failed to compute hash: {e}", exc_info=True)
+        # Fallback: use timestamp-based key (won't cache effectively, but won't break)
+        fallback_key = f"{FALLBACK_KEY_PREFIX}{int(datetime.now().timestamp())}"
+        return fallback_key
+
+
+def cache_set(key: str, value: Dict[str, Any], ttl: int = 3600) -> bool:
+    """
+    Store a value in the cache with TTL.
+    
+    Tries Redis first, falls back to file cache if Redis unavailable.
+    
+    Args:
+        key: Cache key (from compute_hash)
+        value: Dictionary to cache (must be JSON-serializable)
+        ttl: Time-to-live in seconds (default: 1 hour)
+        
+    Returns:
+        True if successfully cached, False otherwise
+    """
+    with tracer.start_as_current_span("cache.set") as span:
+        if key == UNCACHEABLE_KEY:
+            span.set_attribute("cache.stored", False)
+            return False
+        serialized = _cache_set(key, value, ttl)
+        success = serialized is not None
+        if success:
+            _l1_put(key, serialized, time.time() + ttl)
+        span.set_attribute("cache.stored", success)
+        return success
+
+
+def _cache_set(key: str, value: Dict[str, Any], ttl: int) -> Optional[bytes]:
+    """Store in Redis, else the file cache. Returns the stored bytes (None on failure)."""
+    if not key or not value:
+        logger.warning("[CACHE] Cannot cache empty key or value")
+        return None
+    
+    try:
+        # Add cache metadata
+        cached_value = {
+            "data": value,
+            "cached_at": datetime.now().isoformat(),
+            "ttl": ttl,
+            "version": CACHE_VERSION
+        }
+        
+        # orjson returns UTF-8 bytes, ready for Redis and the cache file as-is
+        serialized = orjson.dumps(cached_value)
+        
+        # Try Redis first
+        redis_client = _get_redis_client()
+        if redis_client:
+            try:
+                redis_client.setex(
+                    name=f"finiq:strategy:{key}",
+                    time=ttl,
+                    value=serialized
+                )
+                logger.info("[CACHE] ✓ Stored in Redis: %.20s... (TTL: %ss)", key, ttl)
+                return serialized
+            except Exception as e:
+                logger.warning("[CACHE] Redis set failed: %s, falling back to file cache", e)
+        
+        # Fallback to file cache
+        _file_cache_set(key, serialized, ttl)
+        return serialized
+        
+    except Exception as e:
+        logger.error(f"[CACHE] Failed to cache value: {e}", exc_info=True)
+        return None
+
+
+def _file_cache_set(key: str, serialized: bytes, ttl: int) -> int:
+    """Write one serialized entry to the file cache. Returns bytes written."""
+    cache_dir = Path("cache")
+    cache_dir.mkdir(exist_ok=True)
+    
+    # Previous entries for this key (their names hold the old expiry)
+    old_files = _file_cache_entries(cache_dir, key)
+    
+    # Write to a temp file and rename it into place, so readers never see a
+    # partially written entry
+    cache_file = cache_dir / _file_cache_name(key, int(time.time()) + ttl)
+    tmp_file = cache_dir / f".{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+    _write_file(tmp_file, serialized)
+    os.replace(tmp_file, cache_file)
+    
+    for old_file in old_files:
+        if old_file != cache_file:
+            old_file.unlink(missing_ok=True)
+    
+    logger.info("[CACHE] ✓ Stored in file: %s", cache_file.name)
+    return len(serialized)
+
+
+def cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Retrieve a value from the cache.
+    
+    Tries Redis first, falls back to file cache if Redis unavailable.
+    
+    Args:
+        key: Cache key (from compute_hash)
+        
+    Returns:
+        Cached dictionary or None if not found/expired/invalid
+    """
+    with tracer.start_as_current_span("cache.get") as span:
+        if key == UNCACHEABLE_KEY:
+            span.set_attribute("cache.hit", False)
+            return None
+        result = _l1_get(key) if key else None
+        if result is not None:
+            span.set_attribute("cache.tier", "l1")
+        else:
+            hit = _cache_get(key)
+            if hit is not None:
+                expires_at, payload, result = hit
+                _l1_put(key, payload, expires_at)
+        span.set_attribute("cache.hit", result is not None)
+        return result
+
+
+def _cache_get(key: str) -> Optional[Tuple[float, bytes, Dict[str, Any]]]:
+    """Look a key up in Redis, then the file cache. Returns (expires_at, stored bytes, data)."""
+    if not key:
+        logger.warning("[CACHE] Cannot retrieve with empty key")
+        return None
+    
+    try:
+        # Try Redis first
+        redis_client = _get_redis_client()
+        if redis_client:
+            try:
+                # GET + TTL in one round trip so the L1 copy expires with Redis
+                pipe = redis_client.pipeline(transaction=False)
+                pipe.get(f"finiq:strategy:{key}")
+                pipe.ttl(f"finiq:strategy:{key}")
+                cached_data, remaining = pipe.execute()
+                if cached_data:
+                    parsed = orjson.loads(cached_data)
+                    
+                    # Validate version
+                    if parsed.get("version") != CACHE_VERSION:
+                        logger.info("[CACHE] ✗ Version mismatch in Redis, skipping cache")
+                        return None
+                    
+                    logger.info("[CACHE] ✓ Hit (Redis): %.20s...", key)
+                    return time.time() + max(remaining, 0), cached_data, parsed.get("data")
+                    
+            except orjson.JSONDecodeError as e:
+                logger.error(f"[CACHE] Invalid JSON in Redis cache: {e}")
+                return None
+            except Exception as e:
+                logger.warning("[CACHE] Redis get failed: %s, trying file cache", e)
+        
+        # Fallback to file cache
+        hit = _file_cache_get(key)
+        if hit is not None:
+            return hit
+        
+        # Cache miss
+        logger.info("[CACHE] ✗ Miss: %.20s...", key)
+        return None
+        
+    except Exception as e:
+        logger.error(f"[CACHE] Unexpected error in cache_get: {e}", exc_info=True)
+        return None
+
+
+def cache_mget(keys: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Retrieve several values in one go.
+    
+    Keys not in the in-process tier are fetched from Redis in a single
+    pipelined round trip; anything still missing is read from the file
+    cache in parallel.
+    
+    Args:
+        keys: Cache keys (from compute_hash)
+        
+    Returns:
+        Dict mapping each key to its cached dictionary, or None if not found
+    """
+    with tracer.start_as_current_span("cache.mget") as span:
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        for key in dict.fromkeys(k for k in keys if k):
+            if key == UNCACHEABLE_KEY:
+                results[key] = None
+                continue
+            results[key] = _l1_get(key)
+            if results[key] is None:
+                missing.append(key)
+        
+        try:
+            redis_client = _get_redis_client()
+            if missing and redis_client:
+                try:
+                    # GET + TTL per key, all in one round trip
+                    pipe = redis_client.pipeline(transaction=False)
+                    for key in missing:
+                        pipe.get(f"finiq:strategy:{key}")
+                        pipe.ttl(f"finiq:strategy:{key}")
+                    replies = pipe.execute()
+                    
+                    still_missing = []
+                    now = time.time()
+                    for i, key in enumerate(missing):
+                        cached_data, remaining = replies[2 * i], replies[2 * i + 1]
+                        parsed = orjson.loads(cached_data) if cached_data else None
+                        if parsed and parsed.get("version") == CACHE_VERSION:
+                            results[key] = parsed.get("data")
+                            _l1_put(key, cached_data, now + max(remaining, 0))
+                        else:
+                            still_missing.append(key)
+                    missing = still_missing
+                except Exception as e:
+                    logger.warning("[CACHE] Redis mget failed: %s, trying file cache", e)
+            
+            if missing:
+                with ThreadPoolExecutor(max_workers=min(_FILE_READ_WORKERS, len(missing))) as pool:
+                    for key, hit in zip(missing, pool.map(_file_cache_get, missing)):
+                        if hit is not None:
+                            expires_at, payload, results[key] = hit
+                            _l1_put(key, payload, expires_at)
+        
+        except Exception as e:
+            logger.error(f"[CACHE] Unexpected error in cache_mget: {e}", exc_info=True)
+        
+        hits = sum(1 for value in results.values() if value is not None)
+        span.set_attribute("cache.keys", len(results))
+        span.set_attribute("cache.hits", hits)
+        logger.info("[CACHE] mget: %d/%d hits", hits, len(results))
+        return results
+
+
+def cache_mset(items: Dict[str, Dict[str, Any]], ttl: int = 3600) -> int:
+    """
+    Store several values with the same TTL.
+    
+    Uses one pipelined batch of SETEX calls against Redis, falling back to
+    the file cache if Redis is unavailable.
+    
+    Args:
+        items: Mapping of cache key to dictionary to cache
+        ttl: Time-to-live in seconds (default: 1 hour)
+        
+    Returns:
+        Number of entries stored
+    """
+    with tracer.start_as_current_span("cache.mset") as span:
+        stored = 0
+        expires_at = time.time() + ttl
+        try:
+            serialized = {
+                key: orjson.dumps({
+                    "data": value,
+                    "cached_at": datetime.now().isoformat(),
+                    "ttl": ttl,
+                    "version": CACHE_VERSION
+                })
+                for key, value in items.items() if key and value and key != UNCACHEABLE_KEY
+            }
+            
+            in_redis = False
+            redis_client = _get_redis_client()
+            if serialized and redis_client:
+                try:
+                    pipe = redis_client.pipeline(transaction=False)
+                    for key, payload in serialized.items():
+                        pipe.setex(name=f"finiq:strategy:{key}", time=ttl, value=payload)
+                    pipe.execute()
+                    in_redis = True
+                except Exception as e:
+                    logger.warning("[CACHE] Redis mset failed: %s, falling back to file cache", e)
+            
+            if not in_redis:
+                for key, payload in serialized.items():
+                    _file_cache_set(key, payload, ttl)
+            
+            for key, payload in serialized.items():
+                _l1_put(key, payload, expires_at)
+            stored = len(serialized)
+            logger.info("[CACHE] mset: stored %d entries (TTL: %ss)", stored, ttl)
+        
+        except Exception as e:
+            logger.error(f"[CACHE] Failed to cache values: {e}", exc_info=True)
+        
+        span.set_attribute("cache.stored", stored)
+        return stored
+
+
+def _file_cache_get(key: str) -> Optional[Tuple[float, bytes, Dict[str, Any]]]:
+    """
+    Look a key up in the file cache. Expiry is read from the filename, so
+    stale entries are deleted without ever being opened.
+    """
+    cache_file = None
+    file_expires_at = 0
+    cache_dir = Path("cache")
+    if cache_dir.exists():
+        now = time.time()
+        for candidate in _file_cache_entries(cache_dir, key):
+            expires_at = _parse_file_expiry(candidate.name)
+            if expires_at is None or now > expires_at:
+                logger.info("[CACHE] ✗ Expired file cache: %s", candidate.name)
+                candidate.unlink(missing_ok=True)
+            else:
+                cache_file, file_expires_at = candidate, expires_at
+    
+    if cache_file is not None:
+        try:
+            with open(cache_file, 'rb') as f:
+                raw = f.read()
+            parsed = orjson.loads(raw)
+            
+            # Validate version
+            if parsed.get("version") != CACHE_VERSION:
+                logger.info("[CACHE] ✗ Version mismatch in file, deleting stale cache")
+                cache_file.unlink(missing_ok=True)
+                return None
+            
+            logger.info("[CACHE] ✓ Hit (File): %s", cache_file.name)
+            return file_expires_at, raw, parsed.get("data")
+        
+        except orjson.JSONDecodeError as e:
+            logger.error(f"[CACHE] Invalid JSON in file cache: {e}")
+            cache_file.unlink(missing_ok=True)
+            return None
+        except Exception as e:
+            logger.error(f"[CACHE] Failed to read file cache: {e}")
+            return None
+    
+    return None
+
+
+def cache_clear(pattern: Optional[str] = None) -> int:
+    """
+    Clear cache entries.
+    
+    Args:
+        pattern: Optional pattern to match keys (e.g., "v1:*")
+                If None, clears all FinIQ cache entries
+    
+    Returns:
+        Number of entries cleared
+    """
+    cleared = 0
+    
+    with _L1_LOCK:
+        if pattern:
+            for l1_key in [k for k in _L1 if fnmatch.fnmatchcase(k, pattern)]:
+                del _L1[l1_key]
+        else:
+            _L1.clear()
+            _L1_GHOSTS.clear()
+    
+    try:
+        # Clear Redis
+        redis_client = _get_redis_client()
+        if redis_client:
+            try:
+                match = f"finiq:strategy:{pattern}" if pattern else "finiq:strategy:*"
+                
+                # SCAN instead of KEYS so Redis is never blocked walking the whole keyspace.
+                # UNLINK frees memory in the background; each batch is sent as soon as it
+                # fills, so neither side buffers the whole keyspace.
+                pipe = redis_client.pipeline(transaction=False)
+                redis_cleared = 0
+                batch = []
+                for redis_key in redis_client.scan_iter(match=match, count=_SCAN_BATCH_SIZE):
+                    batch.append(redis_key)
+                    if len(batch) >= _SCAN_BATCH_SIZE:
+                        pipe.unlink(*batch)
+                        redis_cleared += sum(pipe.execute())
+                        batch = []
+                if batch:
+                    pipe.unlink(*batch)
+                    redis_cleared += sum(pipe.execute())
+                
+                if redis_cleared:
+                    cleared += redis_cleared
+                    logger.info(f"[CACHE] Cleared {redis_cleared} Redis entries")
+            except Exception as e:
+                logger.error(f"[CACHE] Failed to clear Redis: {e}")
+        
+        # Clear file cache
+        cache_dir = Path("cache")
+        if cache_dir.exists():
+            for cache_file in cache_dir.glob("*.json"):
+                try:
+                    cache_file.unlink()
+                    cleared += 1
+                except Exception as e:
+                    logger.error(f"[CACHE] Failed to delete {cache_file}: {e}")
+        
+        logger.info(f"[CACHE] Total cleared: {cleared} entries")
+        return cleared
+        
+    except Exception as e:
+        logger.error(f"[CACHE] Failed to clear cache: {e}", exc_info=True)
+        return cleared
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get cache statistics for monitoring.
+    
+    Returns:
+        Dictionary with cache stats (size, hits, misses, etc.)
+    """
+    stats = {
+        "redis_available": False,
+        "redis_connected": False,
+        "file_cache_entries": 0,
+        "file_cache_size_mb": 0.0,
+        "l1_entries": len(_L1),
+        "cache_version": CACHE_VERSION
+    }
+    
+    try:
+        # Redis stats
+        redis_client = _get_redis_client()
+        if redis_client:
+            stats["redis_available"] = True
+            try:
+                redis_client.ping()
+                stats["redis_connected"] = True
+                
+                # Count keys with a bounded SCAN (KEYS would block Redis on large keyspaces).
+                # A maintained counter would drift because entries expire via TTL without
+                # any hook to decrement it, so we count and cap instead.
+                redis_entries = 0
+                for _ in redis_client.scan_iter(match="finiq:strategy:*", count=_SCAN_BATCH_SIZE):
+                    redis_entries += 1
+                    if redis_entries >= _STATS_SCAN_LIMIT:
+                        break
+                stats["redis_entries"] = redis_entries
+                stats["redis_entries_capped"] = redis_entries >= _STATS_SCAN_LIMIT
+                
+            except Exception as e:
+                logger.error(f"[CACHE] Failed to get Redis stats: {e}")
+        
+        # File cache stats
+        cache_dir = Path("cache")
+        if cache_dir.exists():
+            # scandir yields DirEntry objects whose type/stat info comes from the
+            # directory read itself, avoiding a Path object + stat() per file
+            entries = 0
+            total_size = 0
+            with os.scandir(cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                        entries += 1
+                        total_size += entry.stat(follow_symlinks=False).st_size
+            
+            stats["file_cache_entries"] = entries
+            stats["file_cache_size_mb"] = round(total_size / (1024 * 1024), 2)
+        
+        return stats
+        
+    except Exception as e:
+        logger.error(f"[CACHE] Failed to get cache stats: {e}", exc_info=True)
+        return stats
+
+
+def sweep_file_cache(max_entries: Optional[int] = None, max_mb: Optional[float] = None) -> int:
+    """
+    Remove expired and stale-version entries from the file cache, then
+    evict the oldest entries (by mtime) while over the size caps.
+    
+    cache_get only expires a file when that exact key is read again, so
+    entries for keys that are never re-queried would otherwise accumulate.
+    
+    Args:
+        max_entries: Max number of cache files to keep (default: FILE_CACHE_MAX_ENTRIES or 10000)
+        max_mb: Max total size in MB (default: FILE_CACHE_MAX_MB or 500)
+        
+    Returns:
+        Number of files removed
+    """
+    if max_entries is None:
+        max_entries = int(os.getenv("FILE_CACHE_MAX_ENTRIES", "10000"))
+    if max_mb is None:
+        max_mb = float(os.getenv("FILE_CACHE_MAX_MB", "500"))
+    
+    cache_dir = Path("cache")
+    if not cache_dir.exists():
+        return 0
+    
+    removed = 0
+    kept = []  # (mtime, size, path)
+    now = time.time()
+    version_prefix = f"{CACHE_VERSION}:"
+    
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".tmp"):
+                # Temp file left behind by a writer that died before its rename
+                try:
+                    if now - entry.stat(follow_symlinks=False).st_mtime > _TMP_FILE_MAX_AGE:
+                        os.unlink(entry.path)
+                        removed += 1
+                except FileNotFoundError:
+                    pass
+                continue
+            
+            if not (entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)):
+                continue
+            
+            # Decided from the name alone: files without an expiry suffix are from
+            # the old naming scheme, and other versions are never served.
+            expires_at = _parse_file_expiry(entry.name)
+            if expires_at is None or now > expires_at or not entry.name.startswith(version_prefix):
+                try:
+                    os.unlink(entry.path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+                continue
+            
+            st = entry.stat(follow_symlinks=False)
+            kept.append((st.st_mtime, st.st_size, entry.path))
+    
+    # Capacity eviction: oldest first until under both caps
+    max_bytes = max_mb * 1024 * 1024
+    total_size = sum(size for _, size, _ in kept)
+    if len(kept) > max_entries or total_size > max_bytes:
+        kept.sort()
+        count = len(kept)
+        for _, size, path in kept:
+            if count <= max_entries and total_size <= max_bytes:
+                break
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                pass
+            count -= 1
+            total_size -= size
+    
+    if removed:
+        logger.info(f"[CACHE] Sweeper removed {removed} file cache entries")
+    return removed
+
+
+async def run_file_cache_sweeper(interval: Optional[int] = None) -> None:
+    """
+    Run sweep_file_cache forever, every `interval` seconds.
+    
+    Meant to be started once at app startup with asyncio.create_task().
+    The sweep itself does blocking file I/O, so it runs in a worker thread.
+    
+    Args:
+        interval: Seconds between sweeps (default: FILE_CACHE_SWEEP_INTERVAL or 300)
+    """
+    if interval is None:
+        interval = int(os.getenv("FILE_CACHE_SWEEP_INTERVAL", "300"))
+    
+    logger.info(f"[CACHE] File cache sweeper started (interval: {interval}s)")
+    while True:
+        try:
+            await asyncio.to_thread(sweep_file_cache)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[CACHE] File cache sweep failed: {e}", exc_info=True)
+        await asyncio.sleep(interval)
@@ -1,80 +1,227 @@
-"""
-Data Validation Utilities
-Validates startup input data before processing.
-"""
-
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, validator
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class StartupInput(BaseModel):
-    """
-    Validated startup input schema.
-    Matches the frontend form structure.
-    """
-    startupName: str = Field(..., min_length=1, max_length=500)
-    # Optional one-line description / tagline for the startup
-    oneLineDescription: Optional[str] = ""
-    industry: str = Field(..., min_length=1, max_length=200)
-    targetMarket: str = Field(..., pattern="^(B2B|B2C|B2B2C)$")
-    geography: str = Field(..., min_length=1, max_length=200)
-    teamSize: int = Field(..., ge=0, le=10000)
-    productStage: str = Field(..., pattern="^(Idea|MVP|Beta|Early Revenue|Growth)$")
-    monthlyRevenue: Optional[float] = Field(0, ge=0)
-    growthRate: Optional[str] = ""
-    tractionSummary: Optional[str] = ""
-    businessModel: str = Field(..., min_length=1, max_length=500)
-    fundingGoal: Optional[float] = Field(None, ge=0)
-    mainFinancialConcern: str = Field(..., min_length=1, max_length=1000)
-    ideaDescription: Optional[str] = Field("", min_length=0, max_length=3000)
-    
-    @validator('monthlyRevenue', 'fundingGoal', pre=True)
-    def convert_to_float(cls, v):
-        """Convert string numbers to float."""
-        if v is None or v == "":
-            return None if cls.__fields__['fundingGoal'] else 0
-        try:
-            return float(v)
-        except (ValueError, TypeError):
-            return None if cls.__fields__['fundingGoal'] else 0
-    
-    @validator('teamSize', pre=True)
-    def convert_to_int(cls, v):
-        """Convert string numbers to int."""
-        if v is None or v == "":
-            return 0
-        try:
-            return int(v)
-        except (ValueError, TypeError):
-            return 0
-
-
-def validate_startup_input(data: Dict[str, Any]) -> StartupInput:
-    """
-    Validate and clean startup input data.
-    
-    Args:
-        data: Raw input dictionary from frontend
-        
-    Returns:
-        Validated StartupInput object
-        
-    Raises:
-        ValueError: If validation fails
-    """
-    try:
-        validated = StartupInput(**data)
-        logger.info(f"[OK] Input validation passed for: {validated.startupName}")
-        return validated
-    except Exception as e:
-        logger.error(f"[FAIL] Input validation failed: {str(e)}")
-        raise ValueError(f"Invalid startup input: {str(e)}")
-
-
-def input_to_dict(validated_input: StartupInput) -> Dict[str, Any]:
-    """Convert validated input back to dictionary."""
-    return validated_input.dict()
-
+"""
+Data Validation Utilities
+Validates startup input data before processing.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+from pydantic import BaseModel, Field, validator
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StartupInput(BaseModel):
+    """
+    Validated startup input schema.
+    Matches the frontend form structure.
+    """
+    startupName: str = Field(..., min_length=1, max_length=500)
+    # Optional one-line description / tagline for the startup
+    oneLineDescription: Optional[str] = ""
+    industry: str = Field(..., min_length=1, max_length=200)
+    targetMarket: str = Field(..., pattern="^(B2B|B2C|B2B2C)$")
+    geography: str = Field(..., min_length=1, max_length=200)
+    teamSize: int = Field(..., ge=0, le=10000)
+    productStage: str = Field(..., pattern="^(Idea|MVP|Beta|Early Revenue|Growth)$")
+    monthlyRevenue: Optional[float] = Field(0, ge=0)
+    growthRate: Optional[str] = ""
+    tractionSummary: Optional[str] = ""
+    businessModel: str = Field(..., min_length=1, max_length=500)
+    fundingGoal: Optional[float] = Field(None, ge=0)
+    mainFinancialConcern: str = Field(..., min_length=1, max_length=1000)
+    ideaDescription: Optional[str] = Field("", min_length=0, max_length=3000)
+    
+    @validator('monthlyRevenue', 'fundingGoal', pre=True)
+    def convert_to_float(cls, v):
+        """Convert string numbers to float."""
+        if v is None or v == "":
+            return None if cls.__fields__['fundingGoal'] else 0
+        try:
+            return float(v)
+        except (ValueError, TypeError):
+            return None if cls.__fields__['fundingGoal'] else 0
+    
+    @validator('teamSize', pre=True)
+    def convert_to_int(cls, v):
+        """Convert string numbers to int."""
+        if v is None or v == "":
+            return 0
+        try:
+            return int(v)
+        except (ValueError, TypeError):
+            return 0
+
+
+def validate_startup_input(data: Dict[str, Any]) -> StartupInput:
+    """
+    Validate and clean startup input data.
+    
+    Args:
+        data: Raw input dictionary from frontend
+    
+    Returns:
+        Validated StartupInput object
+    
+    Raises:
+        ValueError: If validation fails
+    """
+    try:
+        validated = StartupInput(**data)
+        logger.info(f"[OK] Input validation passed for: {validated.startupName}")
+        return validated
+    except Exception as e:
+        logger.error(f"[FAIL] Input validation failed: {str(e)}")
+        raise ValueError(f"Invalid startup input: {str(e)}")
+
+
+def input_to_dict(validated_input: StartupInput) -> Dict[str, Any]:
+    """Convert validated input back to dictionary."""
+    return validated_input.dict()
+
+
+# camelCase form keys -> canonical snake_case keys used by the prompt templates
+_ALIAS_MAP: Dict[str, str] = {
+    'startupName': 'startup_name',
+    'oneLineDescription': 'one_line_description',
+    'ideaDescription': 'idea_description',
+    'industry': 'industry',
+    'businessModel': 'business_model',
+    'targetMarket': 'target_market',
+    'geography': 'geography',
+    'teamSize': 'team_size',
+    'productStage': 'product_stage',
+    'monthlyRevenue': 'monthly_revenue',
+    'growthRate': 'growth_rate',
+    'tractionSummary': 'traction_summary',
+    'fundingGoal': 'funding_goal',
+    'mainFinancialConcern': 'main_financial_concern',
+}
+
+# Set on dicts returned by normalize_startup_data so repeat calls are free
+NORMALIZED_MARKER = '_normalized'
+
+
+def format_money(value: Any, default: str = 'Not specified') -> str:
+    """
+    Compact money string for prompts: 950 -> "$950", 1500 -> "$1.5K",
+    125000 -> "$125K", 2500000 -> "$2.5M", -5000 -> "-$5K".
+    
+    Numeric strings may carry "$" and thousands separators ("$1,000").
+    Empty and non-finite values give `default`; other text is passed through.
+    """
+    if value is None or value == '':
+        return default
+    try:
+        amount = float(value.replace(',', '').replace('$', '') if isinstance(value, str) else value)
+    except (TypeError, ValueError):
+        return str(value)
+    if not math.isfinite(amount):
+        return default
+    
+    sign = '-' if amount < 0 else ''
+    amount = abs(amount)
+    # K keeps one decimal and M two, so the value stays within ~1% of the input
+    if amount >= 999_950:
+        return f"{sign}${_trim_decimals(amount / 1_000_000, 2)}M"
+    if amount >= 999.5:
+        return f"{sign}${_trim_decimals(amount / 1000, 1)}K"
+    return f"{sign}${amount:.0f}"
+
+
+def _trim_decimals(number: float, places: int) -> str:
+    """Format with up to `places` decimals, dropping trailing zeros."""
+    return f"{number:.{places}f}".rstrip('0').rstrip('.')
+
+
+def normalize_startup_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add canonical snake_case keys for every camelCase input field.
+    
+    Returns a new dict that keeps the original keys (agents and the output
+    builder still read camelCase) plus the snake_case aliases, so prompt
+    templates can do a single lookup per field. A snake_case value that is
+    already set wins over its camelCase alias. The one-line description
+    falls back to the startup name, and money fields get pre-formatted
+    `*_fmt` strings (see format_money).
+    
+    Args:
+        data: Startup input dictionary (camelCase and/or snake_case keys)
+    
+    Returns:
+        Normalized copy (or `data` itself if it is already normalized)
+    """
+    if data.get(NORMALIZED_MARKER):
+        return data
+    
+    normalized = dict(data)
+    for camel, snake in _ALIAS_MAP.items():
+        if not normalized.get(snake) and camel in data:
+            normalized[snake] = data[camel]
+    
+    if not normalized.get('one_line_description') and normalized.get('startup_name'):
+        normalized['one_line_description'] = normalized['startup_name']
+    
+    normalized['monthly_revenue_fmt'] = format_money(normalized.get('monthly_revenue'), '$0')
+    normalized['funding_goal_fmt'] = format_money(normalized.get('funding_goal'))
+    
+    normalized[NORMALIZED_MARKER] = True
+    return normalized
+
+
+@dataclass(slots=True, frozen=True)
+class IdeaProfile:
+    """
+    Structured idea profile from IdeaUnderstandingAgent.
+    Parsed once by the orchestrator; a default-constructed profile stands in
+    when the agent produced nothing, so prompt templates never check for None.
+    """
+    category: Any = 'N/A'
+    business_model: Any = 'N/A'
+    capital_intensity: Any = 'N/A'
+    burn_profile: Any = 'N/A'
+    hardware_dependency: Any = 'N/A'
+    operational_complexity: Any = 'N/A'
+    regulation_risk: Any = 'N/A'
+    scalability_model: Any = 'N/A'
+    margin_profile: Any = 'N/A'
+    team_requirements: Tuple[str, ...] = ()
+    confidence: Any = 'N/A'
+    
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "IdeaProfile":
+        """Build from the agent's JSON output; missing fields keep their defaults."""
+        values = {name: raw[name] for name in cls.__dataclass_fields__ if name in raw}
+        team = values.get('team_requirements')
+        if isinstance(team, list):
+            values['team_requirements'] = tuple(team)
+        return cls(**values)
+    
+    @property
+    def is_empty(self) -> bool:
+        """True when every field still has its default (no profile available)."""
+        return self == _DEFAULT_IDEA_PROFILE
+
+
+_DEFAULT_IDEA_PROFILE = IdeaProfile()
+
+
+@dataclass(slots=True, frozen=True)
+class IndustryBullets:
+    """
+    Niche-specific bullets from IndustrySpecialistAgent.
+    Parsed once by the orchestrator; hashable so the rendered section can be cached.
+    """
+    industry_label: str = 'General'
+    confidence: str = 'medium'
+    bullets: Tuple[str, ...] = ()
+    
+    @classmethod
+    def from_dict(cls, raw: Dict[str, Any]) -> "IndustryBullets":
+        """Build from the agent's JSON output."""
+        return cls(
+            industry_label=str(raw.get('industry_label', 'General')),
+            confidence=str(raw.get('confidence', 'medium')),
+            bullets=tuple(map(str, raw.get('bullets') or ())),
+        )
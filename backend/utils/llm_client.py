@@ -1,358 +1,472 @@
-"""
-Unified LLM client with automatic provider failover.
-
-Order of preference (if API keys are set):
-1. Groq
-2. DeepSeek
-3. OpenRouter
-4. Gemini (fallback, last resort)
-
-Design goals:
-- JSON-first: all prompts are written to return ONLY JSON.
-  This client just returns raw text; agents are responsible for parsing.
-- Failover: if a provider errors or times out, we log and try the next one.
-- Simplicity: no streaming, single-turn chat completion.
-"""
-
-from __future__ import annotations
-
-import os
-import logging
-from typing import Optional, Callable
-
-import requests
-
-try:
-    import google.generativeai as genai  # type: ignore
-except ImportError:  # pragma: no cover - handled at runtime
-    genai = None
-
-
-logger = logging.getLogger(__name__)
-
-# Optional hard override for a single provider, e.g. FORCE_LLM_MODEL=groq
-FORCE_MODEL = os.getenv("FORCE_LLM_MODEL")
-
-
-class LLMClient:
-    def __init__(self) -> None:
-        # Provider API keys
-        self.groq_api_key = os.getenv("GROQ_API_KEY")
-        self.deepseek_api_key = os.getenv("DEEPSEEK_API_KEY")
-        self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
-
-        # Optional model overrides
-        self.groq_model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
-        self.deepseek_model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
-        self.openrouter_model = os.getenv(
-            "OPENROUTER_MODEL",
-            "meta-llama/3.1-70b-instruct"
-        )
-        self.gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
-
-        # Lazy Gemini model
-        self._gemini_model = None
-
-        # Log configuration summary (without leaking keys)
-        providers = []
-        if self.groq_api_key:
-            providers.append(f"Groq[{self.groq_model}]")
-        if self.deepseek_api_key:
-            providers.append(f"DeepSeek[{self.deepseek_model}]")
-        if self.openrouter_api_key:
-            providers.append(f"OpenRouter[{self.openrouter_model}]")
-        if self.gemini_api_key and genai is not None:
-            providers.append(f"Gemini[{self.gemini_model_name}]")
-
-        if providers:
-            logger.info(f"[LLM] Available providers (in order): {', '.join(providers)}")
-        else:
-            logger.warning("[LLM] No LLM providers configured. All calls will fail.")
-
-    # --------------------------------------------------------------------- #
-    # Public API
-    # --------------------------------------------------------------------- #
-
-    def generate(
-        self,
-        prompt: str,
-        *,
-        temperature: float = 0.3,
-        max_output_tokens: int = 1024,
-        system_msg: Optional[str] = None,
-        schema_instruction: Optional[str] = None,
-    ) -> str:
-        """
-        Generate a completion for the given prompt using the first available provider.
-
-        Returns:
-            Raw text response (agents are responsible for JSON parsing).
-
-        Raises:
-            RuntimeError if all providers fail or none are configured.
-        """
-        last_error: Optional[Exception] = None
-
-        # Base system message – can be overridden per-call if needed
-        base_system_msg = (
-            system_msg
-            or "You are a precise JSON-generating assistant. "
-               "Always return ONLY valid JSON, no markdown or commentary."
-        )
-
-        # If a schema is provided, append it to the system message so the model
-        # is forced to match it exactly.
-        full_system_msg = (
-            base_system_msg + ("\n" + schema_instruction if schema_instruction else "")
-        )
-
-        # Provider order: Groq → DeepSeek → OpenRouter → Gemini
-        providers: list[tuple[str, Callable[..., str]]] = [
-            ("groq", self._call_groq),
-            ("deepseek", self._call_deepseek),
-            ("openrouter", self._call_openrouter),
-            ("gemini", self._call_gemini),
-        ]
-
-        # Optional hard override to a single provider (no failover)
-        if FORCE_MODEL:
-            forced = FORCE_MODEL.lower().strip()
-            forced_list = [(name, fn) for name, fn in providers if name == forced]
-            if forced_list:
-                providers = forced_list
-                logger.info(f"[LLM] FORCE MODE: Using only provider '{forced}' (no failover)")
-
-        for name, fn in providers:
-            try:
-                if not self._provider_available(name):
-                    continue
-
-                logger.info(f"[LLM] Trying provider: {name}")
-                text = fn(
-                    prompt,
-                    system_msg=full_system_msg,
-                    temperature=temperature,
-                    max_tokens=max_output_tokens,
-                )
-                if text and isinstance(text, str) and text.strip():
-                    logger.info(f"[LLM] Provider {name} succeeded")
-                    return text
-            except Exception as e:  # pragma: no cover - runtime behaviour
-                last_error = e
-                logger.warning(f"[LLM] Provider {name} failed: {e}", exc_info=True)
-
-        raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
-
-    # --------------------------------------------------------------------- #
-    # Provider helpers
-    # --------------------------------------------------------------------- #
-
-    def _provider_available(self, name: str) -> bool:
-        if name == "groq":
-            return bool(self.groq_api_key)
-        if name == "deepseek":
-            return bool(self.deepseek_api_key)
-        if name == "openrouter":
-            return bool(self.openrouter_api_key)
-        if name == "gemini":
-            return bool(self.gemini_api_key and genai is not None)
-        return False
-
-    def _call_groq(
-        self,
-        prompt: str,
-        *,
-        system_msg: str,
-        temperature: float,
-        max_tokens: int,
-    ) -> str:
-        """
-        Call Groq's OpenAI-compatible chat completions API.
-        Docs: https://console.groq.com/docs/openai
-        """
-        if not self.groq_api_key:
-            raise RuntimeError("GROQ_API_KEY not set")
-
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.groq_api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "model": self.groq_model,
-            "messages": [
-                {"role": "system", "content": system_msg},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
-        if resp.status_code >= 400:
-            raise RuntimeError(f"Groq error {resp.status_code}: {resp.text[:200]}")
-
-        data = resp.json()
-        content = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-        )
-        if not content:
-            raise RuntimeError("Groq returned empty content")
-        return content
-
-    def _call_deepseek(
-        self,
-        prompt: str,
-        *,
-        system_msg: str,
-        temperature: float,
-        max_tokens: int,
-    ) -> str:
-        """
-        Call DeepSeek chat completions API.
-        Docs: https://platform.deepseek.com/api-docs
-        """
-        if not self.deepseek_api_key:
-            raise RuntimeError("DEEPSEEK_API_KEY not set")
-
-        url = "https://api.deepseek.com/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.deepseek_api_key}",
-            "Content-Type": "application/json",
-        }
-        payload = {
-            "model": self.deepseek_model,
-            "messages": [
-                {"role": "system", "content": system_msg},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
-        if resp.status_code >= 400:
-            raise RuntimeError(f"DeepSeek error {resp.status_code}: {resp.text[:200]}")
-
-        data = resp.json()
-        content = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-        )
-        if not content:
-            raise RuntimeError("DeepSeek returned empty content")
-        return content
-
-    def _call_openrouter(
-        self,
-        prompt: str,
-        *,
-        system_msg: str,
-        temperature: float,
-        max_tokens: int,
-    ) -> str:
-        """
-        Call OpenRouter chat completions API.
-        Docs: https://openrouter.ai/docs
-        """
-        if not self.openrouter_api_key:
-            raise RuntimeError("OPENROUTER_API_KEY not set")
-
-        url = "https://openrouter.ai/api/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {self.openrouter_api_key}",
-            "Content-Type": "application/json",
-            # Optional but recommended metadata
-            "HTTP-Referer": os.getenv("OPENROUTER_SITE_URL", "https://finiq.ai"),
-            "X-Title": os.getenv("OPENROUTER_APP_NAME", "FinIQ.ai"),
-        }
-        payload = {
-            "model": self.openrouter_model,
-            "messages": [
-                {"role": "system", "content": system_msg},
-                {"role": "user", "content": prompt},
-            ],
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        resp = requests.post(url, headers=headers, json=payload, timeout=30)
-        if resp.status_code >= 400:
-            raise RuntimeError(f"OpenRouter error {resp.status_code}: {resp.text[:200]}")
-
-        data = resp.json()
-        content = (
-            data.get("choices", [{}])[0]
-            .get("message", {})
-            .get("content", "")
-        )
-        if not content:
-            raise RuntimeError("OpenRouter returned empty content")
-        return content
-
-    def _call_gemini(
-        self,
-        prompt: str,
-        *,
-        system_msg: str,
-        temperature: float,
-        max_tokens: int,
-    ) -> str:
-        """
-        Call Gemini as a last-resort fallback.
-        Uses the same API as before but centralized here.
-        """
-        if not (self.gemini_api_key and genai is not None):
-            raise RuntimeError("Gemini not available (missing api key or library)")
-
-        if self._gemini_model is None:
-            genai.configure(api_key=self.gemini_api_key)
-            self._gemini_model = genai.GenerativeModel(self.gemini_model_name)
-            logger.info(f"[LLM] Gemini model initialised: {self.gemini_model_name}")
-
-        # Gemini doesn't use chat messages in the same way; we prepend the
-        # system/schema instructions into the prompt.
-        full_prompt = system_msg + "\n\n" + prompt
-
-        response = self._gemini_model.generate_content(
-            full_prompt,
-            generation_config={
-                "temperature": temperature,
-                "top_p": 0.8,
-                "max_output_tokens": max_tokens,
-            },
-        )
-        text = getattr(response, "text", None)
-        if not text:
-            raise RuntimeError("Gemini returned empty response")
-        return text
-
-
-# Lazy singleton instance used by all agents
-# This ensures environment variables are loaded before instantiation
-_llm_client_instance: Optional[LLMClient] = None
-
-
-def get_llm_client() -> LLMClient:
-    """Get the singleton LLM client instance (lazy initialization)."""
-    global _llm_client_instance
-    if _llm_client_instance is None:
-        _llm_client_instance = LLMClient()
-    return _llm_client_instance
-
-
-# For backwards compatibility, create a proxy object
-class _LLMClientProxy:
-    """Proxy that lazily initializes the real LLM client on first use."""
-    
-    def __getattr__(self, name: str):
-        return getattr(get_llm_client(), name)
-
-
-llm_client = _LLMClientProxy()
-
-
+"""
+Unified LLM client with automatic provider failover.
+
+Order of preference (if API keys are set):
+1. Groq
+2. DeepSeek
+3. OpenRouter
+4. Gemini (fallback, last resort)
+
+Design goals:
+- JSON-first: all prompts are written to return ONLY JSON.
+  This client just returns raw text; agents are responsible for parsing.
+- Failover: if a provider errors or times out, we log and try the next one.
+- Simplicity: no streaming, single-turn chat completion.
+- Connection reuse: HTTP providers go through persistent httpx clients
+  (HTTP/2 + keep-alive), so TLS handshakes are paid once, not per call.
+  The client is sync; the API runs the agent chain in a worker thread.
+- Request bodies are serialized straight to UTF-8 bytes with orjson (the
+  prompt is encoded once, by orjson, instead of json.dumps + str.encode).
+- Prompt caching: prompts put their static part first. When a prompt carries
+  its `static_prefix` (utils.prompt_templates.Prompt) and OpenRouter serves a
+  model with explicit caching (Anthropic, Gemini), the prefix is sent as its own
+  content part with a `cache_control` breakpoint. Other providers cache the
+  shared prefix automatically.
+- Tail latency: LLM_FAILOVER_MODE picks how failover behaves when a provider
+  is slow:
+    sequential (default) - try providers in order, each with the full timeout
+    fast                 - first pass over HTTP providers with a short
+                           LLM_FAST_TIMEOUT deadline, then the full-timeout pass
+    race                 - race the top two HTTP providers side by side with
+                           an LLM_RACE_TIMEOUT deadline each and keep the first
+                           good answer, then the full-timeout pass. The race
+                           runs in worker threads: a losing call can't be
+                           cancelled, so the deadline bounds how long it
+                           holds its thread
+"""
+
+from __future__ import annotations
+
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Dict, NamedTuple, Optional, Callable, Tuple
+
+import httpx
+import orjson
+
+try:
+    import google.generativeai as genai  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    genai = None
+
+
+logger = logging.getLogger(__name__)
+
+# Optional hard override for a single provider, e.g. FORCE_LLM_MODEL=groq
+FORCE_MODEL = os.getenv("FORCE_LLM_MODEL")
+
+# Shared connection settings for the sync and async HTTP clients
+HTTP_TIMEOUT = 30
+HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40)
+
+# Failover strategy (see module docstring) and the short deadline used by "fast"
+FAILOVER_MODE = os.getenv("LLM_FAILOVER_MODE", "sequential").lower().strip()
+FAST_TIMEOUT = float(os.getenv("LLM_FAST_TIMEOUT", "5"))
+RACE_TIMEOUT = float(os.getenv("LLM_RACE_TIMEOUT", "10"))
+
+# Worker threads for "race" mode (two per racing call, each held at most RACE_TIMEOUT)
+_race_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="llm-race")
+
+# Default system message; callers can override it per call
+DEFAULT_SYSTEM_MSG = (
+    "You are a precise JSON-generating assistant. "
+    "Always return ONLY valid JSON, no markdown or commentary."
+)
+
+# Shared system message entry for calls that use the default (never mutated)
+_SYS_MSG: Dict[str, str] = {"role": "system", "content": DEFAULT_SYSTEM_MSG}
+
+# OpenRouter models that need an explicit cache_control breakpoint to cache a prefix
+_CACHE_CONTROL_MODEL_PREFIXES: Tuple[str, ...] = ("anthropic/", "google/gemini")
+_EPHEMERAL_CACHE: Dict[str, str] = {"type": "ephemeral"}
+
+# (url, headers, payload) for an OpenAI-compatible chat completion
+ChatRequest = Tuple[str, Dict[str, str], Dict[str, Any]]
+
+
+class _Endpoint(NamedTuple):
+    """An OpenAI-compatible chat completions endpoint."""
+    label: str
+    url: str
+    key_env: str
+    headers: Dict[str, str]
+    payload: Dict[str, Any]  # per-provider skeleton, copied per request
+
+
+class LLMClient:
+    def __init__(self) -> None:
+        # Provider API keys
+        self.groq_api_key = os.getenv("GROQ_API_KEY")
+        self.deepseek_api_key = os.getenv("DEEPSEEK_API_KEY")
+        self.openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
+        self.gemini_api_key = os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
+
+        # Optional model overrides
+        self.groq_model = os.getenv("GROQ_MODEL", "llama-3.3-70b-versatile")
+        self.deepseek_model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+        self.openrouter_model = os.getenv(
+            "OPENROUTER_MODEL",
+            "meta-llama/3.1-70b-instruct"
+        )
+        self.gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+        self._openrouter_cache_control = self.openrouter_model.startswith(_CACHE_CONTROL_MODEL_PREFIXES)
+
+        # Lazy Gemini model
+        self._gemini_model = None
+
+        # Persistent HTTP client shared by every call
+        self._http = httpx.Client(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+        # OpenAI-compatible providers differ only in URL, headers and model.
+        # Docs: https://console.groq.com/docs/openai
+        #       https://platform.deepseek.com/api-docs
+        #       https://openrouter.ai/docs
+        self._endpoints: Dict[str, _Endpoint] = {
+            "groq": _Endpoint(
+                "Groq",
+                "https://api.groq.com/openai/v1/chat/completions",
+                "GROQ_API_KEY",
+                self._auth_headers(self.groq_api_key),
+                {"model": self.groq_model},
+            ),
+            "deepseek": _Endpoint(
+                "DeepSeek",
+                "https://api.deepseek.com/chat/completions",
+                "DEEPSEEK_API_KEY",
+                self._auth_headers(self.deepseek_api_key),
+                {"model": self.deepseek_model},
+            ),
+            "openrouter": _Endpoint(
+                "OpenRouter",
+                "https://openrouter.ai/api/v1/chat/completions",
+                "OPENROUTER_API_KEY",
+                self._auth_headers(
+                    self.openrouter_api_key,
+                    # Optional but recommended metadata
+                    {
+                        "HTTP-Referer": os.getenv("OPENROUTER_SITE_URL", "https://finiq.ai"),
+                        "X-Title": os.getenv("OPENROUTER_APP_NAME", "FinIQ.ai"),
+                    },
+                ),
+                {"model": self.openrouter_model},
+            ),
+        }
+
+        # Provider order: Groq → DeepSeek → OpenRouter → Gemini. Keys and the
+        # Gemini import are fixed for the process, so the enabled list is built once.
+        candidates = self._provider_order([
+            ("groq", self._call_groq, bool(self.groq_api_key), f"Groq[{self.groq_model}]"),
+            ("deepseek", self._call_deepseek, bool(self.deepseek_api_key), f"DeepSeek[{self.deepseek_model}]"),
+            ("openrouter", self._call_openrouter, bool(self.openrouter_api_key), f"OpenRouter[{self.openrouter_model}]"),
+            ("gemini", self._call_gemini, bool(self.gemini_api_key and genai is not None), f"Gemini[{self.gemini_model_name}]"),
+        ])
+        self._providers: list[tuple[str, Callable[..., str]]] = [
+            (name, fn) for name, fn, enabled, _ in candidates if enabled
+        ]
+
+        # Sync attempt list; "fast" mode adds a short-deadline pass over the
+        # HTTP providers in front of the full-timeout pass, "race" mode runs the
+        # top two HTTP providers side by side (with a deadline) before it
+        self._racers: list[tuple[str, Callable[..., str]]] = []
+        self._attempts = list(self._providers)
+        http_providers = [name for name, _ in self._providers if name in self._endpoints]
+        if FAILOVER_MODE == "fast":
+            self._attempts = [
+                (name, partial(self._call_openai_compat, name, timeout=FAST_TIMEOUT))
+                for name in http_providers
+            ] + self._attempts
+        elif FAILOVER_MODE == "race" and len(http_providers) > 1:
+            self._racers = [
+                (name, partial(self._call_openai_compat, name, timeout=RACE_TIMEOUT))
+                for name in http_providers[:2]
+            ]
+
+        # Log configuration summary (without leaking keys)
+        providers = [label for _, _, enabled, label in candidates if enabled]
+        if providers:
+            logger.info(f"[LLM] Available providers (in order): {', '.join(providers)}")
+        else:
+            logger.warning("[LLM] No LLM providers configured. All calls will fail.")
+
+    # --------------------------------------------------------------------- #
+    # Public API
+    # --------------------------------------------------------------------- #
+
+    def generate(
+        self,
+        prompt: str,
+        *,
+        temperature: float = 0.3,
+        max_output_tokens: int = 1024,
+        system_msg: Optional[str] = None,
+        schema_instruction: Optional[str] = None,
+    ) -> str:
+        """
+        Generate a completion for the given prompt using the first available provider.
+
+        Returns:
+            Raw text response (agents are responsible for JSON parsing).
+
+        Raises:
+            RuntimeError if all providers fail or none are configured.
+        """
+        last_error: Optional[Exception] = None
+        kwargs = dict(
+            system_msg=self._system_message(system_msg, schema_instruction),
+            temperature=temperature,
+            max_tokens=max_output_tokens,
+        )
+
+        if self._racers:
+            text, last_error = self._race(prompt, kwargs)
+            if text is not None:
+                return text
+
+        for name, fn in self._attempts:
+            try:
+                logger.info(f"[LLM] Trying provider: {name}")
+                text = fn(prompt, **kwargs)
+                if text and isinstance(text, str) and text.strip():
+                    logger.info(f"[LLM] Provider {name} succeeded")
+                    return text
+            except Exception as e:  # pragma: no cover - runtime behaviour
+                last_error = e
+                logger.warning(f"[LLM] Provider {name} failed: {e}", exc_info=True)
+
+        raise RuntimeError(f"All LLM providers failed. Last error: {last_error}")
+
+    def _race(self, prompt: str, kwargs: Dict[str, Any]) -> Tuple[Optional[str], Optional[Exception]]:
+        """
+        Call the racing providers side by side in worker threads.
+
+        Returns:
+            (text, None) for the first non-empty answer, else (None, last error).
+        """
+        last_error: Optional[Exception] = None
+        logger.info(f"[LLM] Racing providers: {', '.join(name for name, _ in self._racers)}")
+        futures = {_race_pool.submit(fn, prompt, **kwargs): name for name, fn in self._racers}
+        try:
+            # httpx deadlines are per network operation, so also cap the wait itself
+            for future in as_completed(futures, timeout=RACE_TIMEOUT):
+                name = futures[future]
+                try:
+                    text = future.result()
+                except Exception as e:  # pragma: no cover - runtime behaviour
+                    last_error = e
+                    logger.warning(f"[LLM] Provider {name} failed: {e}", exc_info=True)
+                    continue
+                if text and isinstance(text, str) and text.strip():
+                    logger.info(f"[LLM] Provider {name} won the race")
+                    return text, None
+        except TimeoutError as e:
+            last_error = e
+            logger.warning(f"[LLM] Race timed out after {RACE_TIMEOUT:g}s")
+        finally:
+            # A call already in flight can't be interrupted; it keeps its worker until its
+            # own RACE_TIMEOUT deadline and its result is discarded
+            for future in futures:
+                future.cancel()
+        return None, last_error
+
+    def close(self) -> None:
+        """Close the sync HTTP client."""
+        self._http.close()
+
+    # --------------------------------------------------------------------- #
+    # Shared helpers
+    # --------------------------------------------------------------------- #
+
+    @staticmethod
+    def _system_message(system_msg: Optional[str], schema_instruction: Optional[str]) -> str:
+        # Base system message – can be overridden per-call if needed
+        base_system_msg = system_msg or DEFAULT_SYSTEM_MSG
+
+        # If a schema is provided, append it to the system message so the model
+        # is forced to match it exactly.
+        return base_system_msg + ("\n" + schema_instruction if schema_instruction else "")
+
+    @staticmethod
+    def _provider_order(providers: list) -> list:
+        """Apply FORCE_LLM_MODEL to a list of (name, ...) provider tuples."""
+        # Optional hard override to a single provider (no failover)
+        if FORCE_MODEL:
+            forced = FORCE_MODEL.lower().strip()
+            forced_list = [p for p in providers if p[0] == forced]
+            if forced_list:
+                logger.info(f"[LLM] FORCE MODE: Using only provider '{forced}' (no failover)")
+                return forced_list
+        return providers
+
+    @staticmethod
+    def _auth_headers(api_key: Optional[str], extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _post_chat(
+        self,
+        name: str,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        *,
+        timeout: float = HTTP_TIMEOUT,
+    ) -> str:
+        resp = self._http.post(url, headers=headers, content=orjson.dumps(payload), timeout=timeout)
+        return self._parse_chat_response(name, resp)
+
+    def _parse_chat_response(self, name: str, resp: httpx.Response) -> str:
+        label = self._endpoints[name].label
+        if resp.status_code >= 400:
+            raise RuntimeError(f"{label} error {resp.status_code}: {resp.text[:200]}")
+
+        data = orjson.loads(resp.content)
+        content = (
+            data.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "")
+        )
+        if not content:
+            raise RuntimeError(f"{label} returned empty content")
+        return content
+
+    # --------------------------------------------------------------------- #
+    # Provider helpers
+    # --------------------------------------------------------------------- #
+
+    def _call_openai_compat(
+        self,
+        name: str,
+        prompt: str,
+        *,
+        system_msg: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: float = HTTP_TIMEOUT,
+    ) -> str:
+        """Call one of the OpenAI-compatible chat completions APIs."""
+        return self._post_chat(
+            name,
+            *self._openai_compat_request(
+                name, prompt, system_msg=system_msg, temperature=temperature, max_tokens=max_tokens
+            ),
+            timeout=timeout,
+        )
+
+    def _openai_compat_request(
+        self,
+        name: str,
+        prompt: str,
+        *,
+        system_msg: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> ChatRequest:
+        endpoint = self._endpoints[name]
+        if not getattr(self, f"{name}_api_key"):
+            raise RuntimeError(f"{endpoint.key_env} not set")
+
+        system_entry = (
+            _SYS_MSG if system_msg == DEFAULT_SYSTEM_MSG
+            else {"role": "system", "content": system_msg}
+        )
+        payload = endpoint.payload.copy()
+        payload["messages"] = [system_entry, {"role": "user", "content": self._user_content(name, prompt)}]
+        payload["temperature"] = temperature
+        payload["max_tokens"] = max_tokens
+        return endpoint.url, endpoint.headers, payload
+
+    def _user_content(self, name: str, prompt: str) -> Any:
+        """
+        User message content: plain text, or for a prompt with a `static_prefix`
+        sent to an OpenRouter model with explicit caching, a cached static part
+        followed by the per-request part.
+        """
+        static_prefix = getattr(prompt, "static_prefix", None)
+        if not (static_prefix and name == "openrouter" and self._openrouter_cache_control):
+            return prompt
+        return [
+            {"type": "text", "text": static_prefix, "cache_control": _EPHEMERAL_CACHE},
+            {"type": "text", "text": prompt[len(static_prefix):]},
+        ]
+
+    def _call_groq(self, prompt: str, **kwargs: Any) -> str:
+        return self._call_openai_compat("groq", prompt, **kwargs)
+
+    def _call_deepseek(self, prompt: str, **kwargs: Any) -> str:
+        return self._call_openai_compat("deepseek", prompt, **kwargs)
+
+    def _call_openrouter(self, prompt: str, **kwargs: Any) -> str:
+        return self._call_openai_compat("openrouter", prompt, **kwargs)
+
+    def _call_gemini(
+        self,
+        prompt: str,
+        *,
+        system_msg: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """
+        Call Gemini as a last-resort fallback.
+        Uses the same API as before but centralized here.
+        """
+        if not (self.gemini_api_key and genai is not None):
+            raise RuntimeError("Gemini not available (missing api key or library)")
+
+        if self._gemini_model is None:
+            genai.configure(api_key=self.gemini_api_key)
+            self._gemini_model = genai.GenerativeModel(self.gemini_model_name)
+            logger.info(f"[LLM] Gemini model initialised: {self.gemini_model_name}")
+
+        # Gemini doesn't use chat messages in the same way; we prepend the
+        # system/schema instructions into the prompt.
+        full_prompt = system_msg + "\n\n" + prompt
+
+        response = self._gemini_model.generate_content(
+            full_prompt,
+            generation_config={
+                "temperature": temperature,
+                "top_p": 0.8,
+                "max_output_tokens": max_tokens,
+            },
+        )
+        text = getattr(response, "text", None)
+        if not text:
+            raise RuntimeError("Gemini returned empty response")
+        return text
+
+
+# Lazy singleton instance used by all agents
+# This ensures environment variables are loaded before instantiation
+_llm_client_instance: Optional[LLMClient] = None
+
+
+def get_llm_client() -> LLMClient:
+    """Get the singleton LLM client instance (lazy initialization)."""
+    global _llm_client_instance
+    if _llm_client_instance is None:
+        _llm_client_instance = LLMClient()
+    return _llm_client_instance
+
+
+def close_llm_client() -> None:
+    """Close the singleton's HTTP client, if it was ever created."""
+    if _llm_client_instance is not None:
+        _llm_client_instance.close()
+
+
+# For backwards compatibility, create a proxy object
+class _LLMClientProxy:
+    """Proxy that lazily initializes the real LLM client on first use."""
+    
+    def __getattr__(self, name: str):
+        return getattr(get_llm_client(), name)
+
+
+llm_client = _LLMClientProxy()
+
+
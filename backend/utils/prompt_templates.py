@@ -1,465 +1,1092 @@
-"""
-Prompt Templates for FinIQ.ai Agents
-Each agent has a structured prompt with clear role, context, and output format.
-"""
-
-
-class PromptTemplates:
-    """Collection of all agent prompt templates."""
-    
-    @staticmethod
-    def _get_industry_bullets_section(startup_data: dict) -> str:
-        """
-        Build the industry-specific bullets section from IndustrySpecialistAgent output.
-        This provides hyper-specific, niche-aware context to all downstream agents.
-        """
-        industry_bullets = startup_data.get('industryBullets')
-        
-        if industry_bullets and isinstance(industry_bullets, dict):
-            bullets = industry_bullets.get('bullets', [])
-            industry_label = industry_bullets.get('industry_label', 'General')
-            confidence = industry_bullets.get('confidence', 'medium')
-            
-            if bullets:
-                bullets_text = '\n'.join([f"• {b}" for b in bullets])
-                return f"""
-**INDUSTRY-SPECIFIC REALITIES ({industry_label}, confidence: {confidence}):**
-These are the ACTUAL things that matter in this exact niche in 2025. Use these to ground your recommendations:
-
-{bullets_text}
-
-**CRITICAL:** Your recommendations MUST align with these industry-specific realities. Do NOT give generic advice that contradicts these bullets.
-"""
-        
-        return "\n**INDUSTRY-SPECIFIC REALITIES:** Not available (will use general guidance)\n"
-    
-    @staticmethod
-    def idea_understanding_agent(startup_data: dict) -> str:
-        """Prompt for understanding the startup idea and deriving a structured profile."""
-        startup_name = startup_data.get('startup_name') or startup_data.get('startupName', 'N/A')
-        one_line = startup_data.get('one_line_description') or startup_data.get('oneLineDescription') or startup_name
-        idea_desc = startup_data.get('idea_description') or startup_data.get('ideaDescription', 'N/A')
-        industry = startup_data.get('industry', 'N/A')
-        business_model = startup_data.get('businessModel') or startup_data.get('business_model', 'N/A')
-        target_market = startup_data.get('targetMarket') or startup_data.get('target_market', 'N/A')
-        
-        return f"""You are a senior startup analyst. Your job is to deeply understand a startup idea and output a concise, structured profile.
-
-STARTUP INPUTS:
-- Name: {startup_name}
-- One-line Description: {one_line}
-- Full Idea Description: {idea_desc}
-- Industry: {industry}
-- Business Model: {business_model}
-- Target Market: {target_market}
-
-YOUR TASK:
-Analyze this startup across the following dimensions:
-1. What category does it belong to? (e.g., "AI Infrastructure", "FinTech SaaS", "Food Delivery")
-2. How does it make money?
-3. Capital intensity (Very High/High/Medium/Low) - Does it need lots of upfront CapEx?
-4. Burn profile (Very High/High/Medium/Low) - Monthly burn rate expectations
-5. Hardware dependency (Very High/High/Medium/Low) - Reliance on physical infrastructure
-6. Operational complexity (Very High/High/Medium/Low) - Day-to-day operational demands
-7. Regulation risk (Very High/High/Medium/Low) - Compliance and legal overhead
-8. How does it scale?
-9. Margin profile (Very High/High/Medium/Low) - Expected gross margins
-10. What team roles are most critical?
-
-CRITICAL INSTRUCTIONS:
-- DO NOT output any explanation, markdown, comments, or extra text.
-- DO NOT use code fences like ```json or ```.
-- Output ONLY the raw JSON object below with NO other text before or after.
-- Ensure the JSON is valid and parseable.
-- If the input is unclear or nonsense, still return valid JSON with "Unknown" or "Low confidence" values and mark confidence as "low".
-
-OUTPUT FORMAT (return EXACTLY this structure with your values):
-{{
-  "category": "short domain label",
-  "business_model": "brief description of revenue model",
-  "capital_intensity": "Very High | High | Medium | Low",
-  "burn_profile": "Very High | High | Medium | Low",
-  "hardware_dependency": "Very High | High | Medium | Low",
-  "operational_complexity": "Very High | High | Medium | Low",
-  "regulation_risk": "Very High | High | Medium | Low",
-  "scalability_model": "one sentence on how it scales",
-  "margin_profile": "Very High | High | Medium | Low",
-  "team_requirements": ["role1", "role2", "role3"],
-  "confidence": "high | medium | low",
-  "notes": "one or two sentences of additional context"
-}}
-
-Remember: Output ONLY the JSON object. No markdown. No explanation. No code fences. Just the raw JSON."""
-    
-    @staticmethod
-    def funding_stage_agent(startup_data: dict) -> str:
-        """Prompt for determining funding stage."""
-        idea_profile = startup_data.get('ideaProfile')
-        industry_bullets_section = PromptTemplates._get_industry_bullets_section(startup_data)
-        
-        # Extract specific fields from idea_profile for better context
-        if idea_profile and isinstance(idea_profile, dict):
-            idea_profile_section = f"""
-**IDEA PROFILE (from IdeaUnderstandingAgent):**
-- Category: {idea_profile.get('category', 'N/A')}
-- Business Model: {idea_profile.get('business_model', 'N/A')}
-- Capital Intensity: {idea_profile.get('capital_intensity', 'N/A')}
-- Burn Profile: {idea_profile.get('burn_profile', 'N/A')}
-- Hardware Dependency: {idea_profile.get('hardware_dependency', 'N/A')}
-- Operational Complexity: {idea_profile.get('operational_complexity', 'N/A')}
-- Regulation Risk: {idea_profile.get('regulation_risk', 'N/A')}
-- Scalability Model: {idea_profile.get('scalability_model', 'N/A')}
-- Margin Profile: {idea_profile.get('margin_profile', 'N/A')}
-- Confidence: {idea_profile.get('confidence', 'N/A')}
-"""
-        else:
-            idea_profile_section = "\n**IDEA PROFILE:** Not available (will rely on basic inputs only)\n"
-
-        startup_name = startup_data.get('startup_name') or startup_data.get('startupName', 'N/A')
-        one_line = startup_data.get('one_line_description') or startup_data.get('oneLineDescription') or startup_name
-        idea_desc = startup_data.get('idea_description') or startup_data.get('ideaDescription', 'N/A')
-
-        return f"""You are a senior startup finance advisor specializing in funding strategies.
-
-**Your Role:** Analyze the startup profile and determine the most appropriate funding stage.
-
-**STARTUP INPUTS:**
-- Name: {startup_name}
-- One-line Description: {one_line}
-- Full Idea Description: {idea_desc}
-- Industry: {startup_data.get('industry', 'N/A')}
-- Target Market: {startup_data.get('targetMarket', 'N/A')}
-- Geography: {startup_data.get('geography', 'N/A')}
-- Team Size: {startup_data.get('teamSize', 0)}
-- Product Stage: {startup_data.get('productStage', 'N/A')}
-- Monthly Revenue: ${startup_data.get('monthlyRevenue', 0)}
-- Growth Rate: {startup_data.get('growthRate', 'N/A')}
-- Traction: {startup_data.get('tractionSummary', 'N/A')}
-- Business Model: {startup_data.get('businessModel', 'N/A')}
-- Funding Goal: ${startup_data.get('fundingGoal', 'Not specified')}
-{idea_profile_section}{industry_bullets_section}
-**CRITICAL:** Use the Idea Profile fields above (especially capital intensity, burn profile, operational complexity) AND the Industry-Specific Realities to refine your funding stage recommendation. These provide deep context about the startup's economic characteristics and niche-specific requirements.
-
-**Available Stages:**
-- Idea Stage (no product yet)
-- Pre-Seed (MVP in development, no revenue)
-- Seed (product launched, early traction)
-- Series A (product-market fit, scaling)
-- Series B+ (established revenue, expansion)
-- Bootstrapped/Profitable (no external funding needed)
-
-**Output Format (JSON only):**
-{{
-  "funding_stage": "one of the stages above",
-  "confidence": "high/medium/low",
-  "rationale": "2-3 sentence explanation based on product stage, revenue, traction, idea profile, AND industry-specific realities",
-  "stage_characteristics": "key indicators that led to this recommendation"
-}}
-
-Return ONLY valid JSON, no markdown or extra text."""
-    
-    @staticmethod
-    def raise_amount_agent(startup_data: dict, funding_stage: str) -> str:
-        """Prompt for determining raise amount."""
-        idea_profile = startup_data.get('ideaProfile')
-        industry_bullets_section = PromptTemplates._get_industry_bullets_section(startup_data)
-        
-        # Extract specific fields from idea_profile
-        if idea_profile and isinstance(idea_profile, dict):
-            idea_profile_section = f"""
-**IDEA PROFILE (from IdeaUnderstandingAgent):**
-- Category: {idea_profile.get('category', 'N/A')}
-- Capital Intensity: {idea_profile.get('capital_intensity', 'N/A')} (CRITICAL for raise amount)
-- Burn Profile: {idea_profile.get('burn_profile', 'N/A')} (CRITICAL for raise amount)
-- Hardware Dependency: {idea_profile.get('hardware_dependency', 'N/A')}
-- Operational Complexity: {idea_profile.get('operational_complexity', 'N/A')}
-- Margin Profile: {idea_profile.get('margin_profile', 'N/A')}
-"""
-        else:
-            idea_profile_section = "\n**IDEA PROFILE:** Not available\n"
-
-        startup_name = startup_data.get('startup_name') or startup_data.get('startupName', 'N/A')
-        one_line = startup_data.get('one_line_description') or startup_data.get('oneLineDescription') or startup_name
-        idea_desc = startup_data.get('idea_description') or startup_data.get('ideaDescription', 'N/A')
-
-        return f"""You are a startup CFO advisor specializing in fundraising strategy.
-
-**Your Role:** Recommend the ideal funding amount to raise.
-
-**STARTUP INPUTS:**
-- Name: {startup_name}
-- Idea Description: {idea_desc}
-- Industry: {startup_data.get('industry', 'N/A')}
-- Target Market: {startup_data.get('targetMarket', 'N/A')}
-- Team Size: {startup_data.get('teamSize', 0)}
-- Monthly Revenue: ${startup_data.get('monthlyRevenue', 0)}
-- Funding Stage: {funding_stage}
-- Funding Goal (user input): ${startup_data.get('fundingGoal', 'Not specified')}
-- Main Financial Concern: {startup_data.get('mainFinancialConcern', 'N/A')}
-{idea_profile_section}{industry_bullets_section}
-**CRITICAL:** Use Capital Intensity, Burn Profile, AND Industry-Specific Realities to adjust the raise amount:
-- Very High Capital Intensity → Increase raise by 50-100% above stage average
-- High Burn Profile → Add 6 months of extra runway buffer
-- Hardware-heavy startups → Factor in equipment/infrastructure costs
-- Industry bullets mention specific CapEx (e.g., "₹18–22L per shed", "$200Cr for certification") → Include these in calculations
-
-**Task:** Calculate the recommended raise amount based on:
-1. Typical range for this funding stage
-2. Team size and hiring needs
-3. Capital intensity from idea profile
-4. Burn profile expectations
-5. Runway target (18-24 months typical)
-6. User's stated goal (if provided)
-7. SPECIFIC COSTS mentioned in industry bullets (e.g., certifications, equipment, inventory)
-Use ALL information provided (including the full description, idea profile, AND industry-specific bullets) to determine the most accurate output.
-Do not fallback unless absolutely necessary.
-
-**Output Format (JSON only):**
-{{
-  "recommended_amount": "e.g., $500K-$750K",
-  "minimum_viable": "lowest amount that makes sense",
-  "optimal_amount": "ideal amount for 18-24mo runway",
-  "rationale": "explanation of calculation referencing industry-specific costs",
-  "breakdown": {{
-    "team_expansion": "estimated cost",
-    "product_development": "estimated cost",
-    "marketing_sales": "estimated cost",
-    "operations_overhead": "estimated cost",
-    "buffer": "contingency"
-  }}
-}}
-
-Return ONLY valid JSON, no markdown or extra text."""
-    
-    @staticmethod
-    def investor_type_agent(startup_data: dict, funding_stage: str, raise_amount: str) -> str:
-        """Prompt for identifying ideal investor types."""
-        idea_profile = startup_data.get('ideaProfile')
-        industry_bullets_section = PromptTemplates._get_industry_bullets_section(startup_data)
-        
-        # Extract specific fields from idea_profile
-        if idea_profile and isinstance(idea_profile, dict):
-            idea_profile_section = f"""
-**IDEA PROFILE (from IdeaUnderstandingAgent):**
-- Category: {idea_profile.get('category', 'N/A')} (helps identify domain-focused investors)
-- Capital Intensity: {idea_profile.get('capital_intensity', 'N/A')}
-- Regulation Risk: {idea_profile.get('regulation_risk', 'N/A')} (CRITICAL for investor selection)
-- Hardware Dependency: {idea_profile.get('hardware_dependency', 'N/A')}
-- Margin Profile: {idea_profile.get('margin_profile', 'N/A')}
-- Scalability Model: {idea_profile.get('scalability_model', 'N/A')}
-"""
-        else:
-            idea_profile_section = "\n**IDEA PROFILE:** Not available\n"
-
-        startup_name = startup_data.get('startup_name') or startup_data.get('startupName', 'N/A')
-        one_line = startup_data.get('one_line_description') or startup_data.get('oneLineDescription') or startup_name
-        idea_desc = startup_data.get('idea_description') or startup_data.get('ideaDescription', 'N/A')
-
-        return f"""You are a startup fundraising strategist with deep investor network knowledge.
-
-**Your Role:** Identify the best investor types AND specific investor names for this startup.
-
-**STARTUP INPUTS:**
-- Name: {startup_name}
-- Idea Description: {idea_desc}
-- Industry: {startup_data.get('industry', 'N/A')}
-- Target Market: {startup_data.get('targetMarket', 'N/A')}
-- Geography: {startup_data.get('geography', 'N/A')}
-- Funding Stage: {funding_stage}
-- Raise Amount: {raise_amount}
-- Business Model: {startup_data.get('businessModel', 'N/A')}
-{idea_profile_section}{industry_bullets_section}
-**CRITICAL:** Use the Idea Profile AND Industry-Specific Realities to match investors:
-- High Regulation Risk → Seek investors with domain expertise (e.g., FinTech VCs, HealthTech VCs)
-- Hardware-heavy → Prefer deep-tech investors, avoid pure software VCs
-- High Capital Intensity → Target larger funds with multi-stage capacity
-- Specific Category → Match to sector-focused investors (AI Infrastructure → AI funds, FinTech → FinTech funds)
-- Industry bullets mention specific investors/funds → Prioritize those EXACT names
-
-**Investor Categories:**
-- Angel Investors (individual high-net-worth)
-- Micro VCs ($50K-$500K checks) — e.g., Tiny Seed, Calm Fund, Earnest Capital
-- Seed VCs ($500K-$2M checks) — e.g., South Park Commons, Antler, Forum
-- Institutional VCs (Series A+) — e.g., Sequoia, a16z, Accel
-- Corporate VCs (strategic investors)
-- Accelerators (Y Combinator, Techstars, etc.)
-- Government Grants/Programs — e.g., iDEX, Make-II, FAME-II, TDF
-- Crowdfunding
-- Revenue-Based Financing
-
-**Output Format (JSON only):**
-{{
-  "primary_investor_type": "most suitable type",
-  "secondary_options": ["alternative type 1", "alternative type 2"],
-  "specific_investors": ["Name actual funds/angels that fit this niche"],
-  "avoid": ["types that don't make sense for this stage/model"],
-  "rationale": "why these investors are ideal based on category, regulation risk, capital needs, AND industry-specific realities",
-  "target_profile": "specific characteristics to look for in investors",
-  "approach_strategy": "how to approach these investors"
-}}
-
-Return ONLY valid JSON, no markdown or extra text."""
-    
-    @staticmethod
-    def runway_agent(startup_data: dict, raise_amount: str) -> str:
-        """Prompt for calculating runway."""
-        idea_profile = startup_data.get('ideaProfile')
-        industry_bullets_section = PromptTemplates._get_industry_bullets_section(startup_data)
-        
-        # Extract specific fields from idea_profile
-        if idea_profile and isinstance(idea_profile, dict):
-            idea_profile_section = f"""
-**IDEA PROFILE (from IdeaUnderstandingAgent):**
-- Burn Profile: {idea_profile.get('burn_profile', 'N/A')} (CRITICAL for runway calculation)
-- Operational Complexity: {idea_profile.get('operational_complexity', 'N/A')} (affects overhead)
-- Hardware Dependency: {idea_profile.get('hardware_dependency', 'N/A')} (affects CapEx)
-- Team Requirements: {idea_profile.get('team_requirements', [])} (affects headcount burn)
-- Capital Intensity: {idea_profile.get('capital_intensity', 'N/A')}
-"""
-        else:
-            idea_profile_section = "\n**IDEA PROFILE:** Not available\n"
-
-        startup_name = startup_data.get('startup_name') or startup_data.get('startupName', 'N/A')
-        one_line = startup_data.get('one_line_description') or startup_data.get('oneLineDescription') or startup_name
-        idea_desc = startup_data.get('idea_description') or startup_data.get('ideaDescription', 'N/A')
-
-        return f"""You are a startup financial planning expert.
-
-**Your Role:** Calculate expected runway and burn rate guidance.
-
-Startup Name:
-{startup_name}
-
-One-line Description:
-{one_line}
-
-Full Startup Idea Description:
-{idea_desc}
-
-**STARTUP INPUTS:**
-- Name: {startup_name}
-- Idea Description: {idea_desc}
-- Team Size: {startup_data.get('teamSize', 0)}
-- Monthly Revenue: ${startup_data.get('monthlyRevenue', 0)}
-- Industry: {startup_data.get('industry', 'N/A')}
-- Geography: {startup_data.get('geography', 'N/A')}
-- Raise Amount: {raise_amount}
-- Main Financial Concern: {startup_data.get('mainFinancialConcern', 'N/A')}
-{idea_profile_section}{industry_bullets_section}
-**CRITICAL:** Use the Idea Profile AND Industry-Specific Realities to estimate burn rate accurately:
-- High Burn Profile → Monthly burn 30-50% higher than stage average
-- High Operational Complexity → Add 20-30% overhead buffer
-- Hardware Dependency → Factor in CapEx and depreciation
-- Team Requirements → Adjust headcount assumptions by role types
-- Industry bullets mention specific costs (e.g., "₹18–22L per shed", "$400K+ for VP Growth") → Factor these into burn calculations
-
-**Task:** Estimate runway and provide burn rate guidance.
-
-**Consider:**
-1. Current team cost (salaries, benefits)
-2. Expected hiring based on raise amount and team requirements from idea profile
-3. Burn profile expectations from idea profile
-4. SPECIFIC COSTS from industry bullets (certifications, equipment, key hires)
-5. Geography-based cost differences (India vs US vs Europe)
-6. Revenue (if any) offsetting burn
-7. Target runway: 18-24 months
-
-**Output Format (JSON only):**
-{{
-  "estimated_runway_months": "12-18",
-  "monthly_burn_rate": "$50K-$75K",
-  "assumptions": {{
-    "team_costs": "breakdown including specific roles from industry bullets",
-    "operational_expenses": "breakdown including industry-specific costs",
-    "growth_investments": "breakdown"
-  }},
-  "revenue_impact": "how current/projected revenue affects runway",
-  "key_milestones": ["what should be achieved within this runway, aligned with industry bullets"],
-  "burn_rate_guidance": "advice on managing burn rate specific to this niche"
-}}
-
-Return ONLY valid JSON, no markdown or extra text."""
-    
-    @staticmethod
-    def financial_priority_agent(startup_data: dict, context: dict) -> str:
-        """Prompt for determining financial priorities."""
-        idea_profile = startup_data.get('ideaProfile')
-        industry_bullets_section = PromptTemplates._get_industry_bullets_section(startup_data)
-        
-        # Extract specific fields from idea_profile
-        if idea_profile and isinstance(idea_profile, dict):
-            idea_profile_section = f"""
-**IDEA PROFILE (from IdeaUnderstandingAgent):**
-- Category: {idea_profile.get('category', 'N/A')}
-- Business Model: {idea_profile.get('business_model', 'N/A')}
-- Capital Intensity: {idea_profile.get('capital_intensity', 'N/A')}
-- Operational Complexity: {idea_profile.get('operational_complexity', 'N/A')}
-- Hardware Dependency: {idea_profile.get('hardware_dependency', 'N/A')}
-- Regulation Risk: {idea_profile.get('regulation_risk', 'N/A')}
-- Team Requirements: {idea_profile.get('team_requirements', [])}
-- Margin Profile: {idea_profile.get('margin_profile', 'N/A')}
-"""
-        else:
-            idea_profile_section = "\n**IDEA PROFILE:** Not available\n"
-
-        startup_name = startup_data.get('startup_name') or startup_data.get('startupName', 'N/A')
-        one_line = startup_data.get('one_line_description') or startup_data.get('oneLineDescription') or startup_name
-        idea_desc = startup_data.get('idea_description') or startup_data.get('ideaDescription', 'N/A')
-
-        return f"""You are a strategic startup advisor focused on financial prioritization.
-
-**Your Role:** Identify the top 3-5 immediate financial priorities that are SPECIFIC to this exact niche.
-
-**STARTUP INPUTS:**
-- Name: {startup_name}
-- Idea Description: {idea_desc}
-- Industry: {startup_data.get('industry', 'N/A')}
-- Product Stage: {startup_data.get('productStage', 'N/A')}
-- Team Size: {startup_data.get('teamSize', 0)}
-- Monthly Revenue: ${startup_data.get('monthlyRevenue', 0)}
-- Main Concern: {startup_data.get('mainFinancialConcern', 'N/A')}
-
-**Previous Agent Outputs:**
-- Funding Stage: {context.get('funding_stage', 'N/A')}
-- Raise Amount: {context.get('raise_amount', 'N/A')}
-- Investor Type: {context.get('investor_type', 'N/A')}
-- Runway: {context.get('runway', 'N/A')}
-{idea_profile_section}{industry_bullets_section}
-**CRITICAL:** Your priorities MUST be derived from the Industry-Specific Realities above. Do NOT give generic advice like "hire key roles" or "optimize operations". Instead:
-- If bullets mention specific certifications → Priority: Get that exact certification
-- If bullets mention specific hires (e.g., "ex-Swiggy fleet manager") → Priority: Hire that exact role
-- If bullets mention specific partnerships → Priority: Close that partnership
-- If bullets mention specific price points → Priority: Achieve that unit economics target
-- If bullets mention specific platforms → Priority: Launch on that platform
-
-**Task:** Define the top financial priorities for the next 6-12 months, DIRECTLY DERIVED from the industry-specific bullets.
-
-**Priority Categories:**
-- Fundraising activities
-- Team expansion/hiring (SPECIFIC roles from bullets)
-- Product development investment
-- Marketing & customer acquisition (SPECIFIC channels from bullets)
-- Sales team & GTM strategy
-- Infrastructure & operations (SPECIFIC requirements from bullets)
-- Legal & compliance (SPECIFIC certifications from bullets)
-- Cash flow management
-- Unit economics optimization (SPECIFIC targets from bullets)
-
-**Output Format (JSON only):**
-{{
-  "priorities": [
-    {{
-      "priority": "SPECIFIC action item derived from industry bullets",
-      "importance": "critical/high/medium",
-      "rationale": "why this matters now, referencing industry-specific context",
-      "timeline": "when to address",
-      "estimated_cost": "if applicable, use costs from industry bullets"
-    }}
-  ],
-  "quick_wins": ["easy immediate actions from industry bullets"],
-  "avoid": ["what NOT to spend money on in this specific niche"],
-  "success_metrics": ["how to measure progress, using metrics from industry bullets"]
-}}
-
-Return ONLY valid JSON, no markdown or extra text."""
-
+"""
+Prompt Templates for FinIQ.ai Agents
+Each agent has a structured prompt with clear role, context, and output format.
+Prompt builders are plain module-level functions taking a StartupContext, e.g.
+`prompt_templates.funding_stage_agent(StartupContext.from_dict(startup_data))`;
+`bind(startup_data)` does that conversion once for a whole analysis.
+
+Every prompt is laid out as a static block (role, instructions, output format)
+followed by the request-specific inputs. The static block is a module-level
+constant, so it is identical byte-for-byte across calls and forms a stable
+prefix for provider-side prompt caching.
+"""
+
+import os
+import re
+import functools
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Final, Optional, Tuple
+
+from .data_validation import IdeaProfile, IndustryBullets, normalize_startup_data
+
+
+_JSON_ONLY_FOOTER: Final[str] = "\n\nReturn ONLY valid JSON, no markdown or extra text."
+
+
+# Defined once so the 4-value enum is not repeated for every idea profile field.
+# The legend spells out the full words so the JSON values stay unchanged.
+_LEVEL_ENUM_LEGEND: Final[str] = "Throughout this prompt, LEVEL means one of: Very High | High | Medium | Low (use these exact words in the JSON).\n\n"
+
+# Static reference blocks (stage list, investor/priority categories),
+# shared as-is by the role headers below
+
+_FUNDING_STAGES_BLOCK: Final[str] = """**Available Stages:**
+- Idea Stage (no product yet)
+- Pre-Seed (MVP in development, no revenue)
+- Seed (product launched, early traction)
+- Series A (product-market fit, scaling)
+- Series B+ (established revenue, expansion)
+- Bootstrapped/Profitable (no external funding needed)
+
+"""
+
+_INVESTOR_CATEGORIES_BLOCK: Final[str] = """**Investor Categories:**
+- Angel Investors (individual high-net-worth)
+- Micro VCs ($50K-$500K checks) — e.g., Tiny Seed, Calm Fund, Earnest Capital
+- Seed VCs ($500K-$2M checks) — e.g., South Park Commons, Antler, Forum
+- Institutional VCs (Series A+) — e.g., Sequoia, a16z, Accel
+- Corporate VCs (strategic investors)
+- Accelerators (Y Combinator, Techstars, etc.)
+- Government Grants/Programs — e.g., iDEX, Make-II, FAME-II, TDF
+- Crowdfunding
+- Revenue-Based Financing
+
+"""
+
+_PRIORITY_CATEGORIES_BLOCK: Final[str] = """**Priority Categories:**
+- Fundraising activities
+- Team expansion/hiring (SPECIFIC roles from bullets)
+- Product development investment
+- Marketing & customer acquisition (SPECIFIC channels from bullets)
+- Sales team & GTM strategy
+- Infrastructure & operations (SPECIFIC requirements from bullets)
+- Legal & compliance (SPECIFIC certifications from bullets)
+- Cash flow management
+- Unit economics optimization (SPECIFIC targets from bullets)
+
+"""
+
+
+# Output JSON skeletons, sent once in the system message (see schema_instruction)
+# instead of inline in every prompt; prompts refer to them by name
+SCHEMAS: Final[Dict[str, str]] = {
+    "IDEA_PROFILE_V1": """{
+  "category": "string (precise sub-industry, e.g., 'PropTech FinTech', not 'General')",
+  "business_model": "string (specific, e.g., 'Per-shipment + subscription')",
+  "capital_intensity": "string (Low/Medium/High/Very High, justified by hardware/logistics needs)",
+  "burn_profile": "string (Low/Medium/High, based on ops/compliance burn)",
+  "hardware_dependency": "string (Low/Medium/High, e.g., High for IoT sensors/dewars)",
+  "operational_complexity": "string (Low/Medium/High, factoring regulation/partnerships)",
+  "regulation_risk": "string (Low/Medium/High/Very High, e.g., Very High for FDA/pharma shipping)",
+  "scalability_model": "string (brief, e.g., 'Network effects via pharma partnerships')",
+  "margin_profile": "string (Low/Medium/High, e.g., High post-scale due to recurring fees)",
+  "team_requirements": "array of strings (3-5 key roles, e.g., ['Chief Quality Officer', 'Logistics Engineer'])",
+  "confidence": "string (low/medium/high, high if input is detailed)",
+  "notes": "string (1-2 sentences on key risks/opportunities)"
+}""",
+    "FUNDING_STAGE_V1": """{
+  "funding_stage": "one of the Available Stages listed in the prompt",
+  "confidence": "high/medium/low",
+  "rationale": "2-3 sentence explanation based on product stage, revenue, traction, idea profile, AND industry-specific realities",
+  "stage_characteristics": "key indicators that led to this recommendation"
+}""",
+    "RAISE_AMOUNT_V1": """{
+  "recommended_amount": "e.g., $500K-$750K",
+  "minimum_viable": "lowest amount that makes sense",
+  "optimal_amount": "ideal amount for 18-24mo runway",
+  "rationale": "explanation of calculation referencing industry-specific costs",
+  "breakdown": {
+    "team_expansion": "estimated cost",
+    "product_development": "estimated cost",
+    "marketing_sales": "estimated cost",
+    "operations_overhead": "estimated cost",
+    "buffer": "contingency"
+  }
+}""",
+    "INVESTOR_TYPE_V1": """{
+  "primary_investor_type": "most suitable type",
+  "secondary_options": ["alternative type 1", "alternative type 2"],
+  "specific_investors": ["Name actual funds/angels that fit this niche"],
+  "avoid": ["types that don't make sense for this stage/model"],
+  "rationale": "why these investors are ideal based on category, regulation risk, capital needs, AND industry-specific realities",
+  "target_profile": "specific characteristics to look for in investors",
+  "approach_strategy": "how to approach these investors"
+}""",
+    "RUNWAY_V1": """{
+  "estimated_runway_months": "12-18",
+  "monthly_burn_rate": "$50K-$75K",
+  "assumptions": {
+    "team_costs": "breakdown including specific roles from industry bullets",
+    "operational_expenses": "breakdown including industry-specific costs",
+    "growth_investments": "breakdown"
+  },
+  "revenue_impact": "how current/projected revenue affects runway",
+  "key_milestones": ["what should be achieved within this runway, aligned with industry bullets"],
+  "burn_rate_guidance": "advice on managing burn rate specific to this niche"
+}""",
+    "FINANCIAL_PRIORITY_V1": """{
+  "priorities": [
+    {
+      "priority": "SPECIFIC action item derived from industry bullets",
+      "importance": "critical/high/medium",
+      "rationale": "why this matters now, referencing industry-specific context",
+      "timeline": "when to address",
+      "estimated_cost": "if applicable, use costs from industry bullets"
+    }
+  ],
+  "quick_wins": ["easy immediate actions from industry bullets"],
+  "avoid": ["what NOT to spend money on in this specific niche"],
+  "success_metrics": ["how to measure progress, using metrics from industry bullets"]
+}""",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def schema_instruction(*names: str) -> str:
+    """System message text for the named SCHEMAS entries (pass as llm_client's schema_instruction)."""
+    return "\n\n".join(f"SCHEMA {name}:\n{SCHEMAS[name]}" for name in names)
+
+
+_IDEA_UNDERSTANDING_HEADER: Final[str] = (
+    """You are a senior startup analyst. Your job is to deeply understand a startup idea and output a concise, structured profile.
+
+"""
+    + _LEVEL_ENUM_LEGEND
+    + """YOUR TASK:
+Analyze the startup described in STARTUP INPUTS (at the end) across the following dimensions:
+1. What category does it belong to? (e.g., "AI Infrastructure", "FinTech SaaS", "Food Delivery")
+2. How does it make money?
+3. Capital intensity (LEVEL) - Does it need lots of upfront CapEx?
+4. Burn profile (LEVEL) - Monthly burn rate expectations
+5. Hardware dependency (LEVEL) - Reliance on physical infrastructure
+6. Operational complexity (LEVEL) - Day-to-day operational demands
+7. Regulation risk (LEVEL) - Compliance and legal overhead
+8. How does it scale?
+9. Margin profile (LEVEL) - Expected gross margins
+10. What team roles are most critical?
+
+CRITICAL INSTRUCTIONS:
+- DO NOT output any explanation, markdown, comments, or extra text.
+- DO NOT use code fences like ```json or ```.
+- Output ONLY the raw JSON object with NO other text before or after.
+- Ensure the JSON is valid and parseable.
+- If the input is unclear or nonsense, still return valid JSON with "Unknown" or "Low confidence" values and mark confidence as "low".
+
+OUTPUT FORMAT: Return the JSON object matching schema IDEA_PROFILE_V1 (see system prompt).
+
+"""
+)
+
+_IDEA_UNDERSTANDING_FOOTER: Final[str] = "\n\nRemember: Output ONLY the JSON object. No markdown. No explanation. No code fences. Just the raw JSON."
+
+
+_FUNDING_STAGE_HEADER: Final[str] = (
+    """You are a senior startup finance advisor specializing in funding strategies.
+
+**Your Role:** Analyze the startup profile and determine the most appropriate funding stage.
+
+**CRITICAL:** Use the Idea Profile fields in the inputs below (especially capital intensity, burn profile, operational complexity) AND the Industry-Specific Realities to refine your funding stage recommendation. These provide deep context about the startup's economic characteristics and niche-specific requirements.
+
+"""
+    + _FUNDING_STAGES_BLOCK
+    + """**Output Format:** Return JSON matching schema FUNDING_STAGE_V1 (see system prompt).
+
+"""
+)
+
+
+_RAISE_AMOUNT_HEADER: Final[str] = """You are a startup CFO advisor specializing in fundraising strategy.
+
+**Your Role:** Recommend the ideal funding amount to raise.
+
+**CRITICAL:** Use Capital Intensity, Burn Profile, AND Industry-Specific Realities from the inputs below to adjust the raise amount:
+- Very High Capital Intensity → Increase raise by 50-100% above stage average
+- High Burn Profile → Add 6 months of extra runway buffer
+- Hardware-heavy startups → Factor in equipment/infrastructure costs
+- Industry bullets mention specific CapEx (e.g., "₹18–22L per shed", "$200Cr for certification") → Include these in calculations
+
+**Task:** Calculate the recommended raise amount based on:
+1. Typical range for this funding stage
+2. Team size and hiring needs
+3. Capital intensity from idea profile
+4. Burn profile expectations
+5. Runway target (18-24 months typical)
+6. User's stated goal (if provided)
+7. SPECIFIC COSTS mentioned in industry bullets (e.g., certifications, equipment, inventory)
+Use ALL information provided (including the full description, idea profile, AND industry-specific bullets) to determine the most accurate output.
+Do not fallback unless absolutely necessary.
+
+**Output Format:** Return JSON matching schema RAISE_AMOUNT_V1 (see system prompt).
+
+"""
+
+
+_INVESTOR_TYPE_HEADER: Final[str] = (
+    """You are a startup fundraising strategist with deep investor network knowledge.
+
+**Your Role:** Identify the best investor types AND specific investor names for this startup.
+
+**CRITICAL:** Use the Idea Profile AND Industry-Specific Realities from the inputs below to match investors:
+- High Regulation Risk → Seek investors with domain expertise (e.g., FinTech VCs, HealthTech VCs)
+- Hardware-heavy → Prefer deep-tech investors, avoid pure software VCs
+- High Capital Intensity → Target larger funds with multi-stage capacity
+- Specific Category → Match to sector-focused investors (AI Infrastructure → AI funds, FinTech → FinTech funds)
+- Industry bullets mention specific investors/funds → Prioritize those EXACT names
+
+"""
+    + _INVESTOR_CATEGORIES_BLOCK
+    + """**Output Format:** Return JSON matching schema INVESTOR_TYPE_V1 (see system prompt).
+
+"""
+)
+
+
+_RUNWAY_HEADER: Final[str] = """You are a startup financial planning expert.
+
+**Your Role:** Calculate expected runway and burn rate guidance.
+
+**CRITICAL:** Use the Idea Profile AND Industry-Specific Realities from the inputs below to estimate burn rate accurately:
+- High Burn Profile → Monthly burn 30-50% higher than stage average
+- High Operational Complexity → Add 20-30% overhead buffer
+- Hardware Dependency → Factor in CapEx and depreciation
+- Team Requirements → Adjust headcount assumptions by role types
+- Industry bullets mention specific costs (e.g., "₹18–22L per shed", "$400K+ for VP Growth") → Factor these into burn calculations
+
+**Task:** Estimate runway and provide burn rate guidance.
+
+**Consider:**
+1. Current team cost (salaries, benefits)
+2. Expected hiring based on raise amount and team requirements from idea profile
+3. Burn profile expectations from idea profile
+4. SPECIFIC COSTS from industry bullets (certifications, equipment, key hires)
+5. Geography-based cost differences (India vs US vs Europe)
+6. Revenue (if any) offsetting burn
+7. Target runway: 18-24 months
+
+**Output Format:** Return JSON matching schema RUNWAY_V1 (see system prompt).
+
+"""
+
+
+_FINANCIAL_PRIORITY_HEADER: Final[str] = (
+    """You are a strategic startup advisor focused on financial prioritization.
+
+**Your Role:** Identify the top 3-5 immediate financial priorities that are SPECIFIC to this exact niche.
+
+**CRITICAL:** Your priorities MUST be derived from the Industry-Specific Realities in the inputs below. Do NOT give generic advice like "hire key roles" or "optimize operations". Instead:
+- If bullets mention specific certifications → Priority: Get that exact certification
+- If bullets mention specific hires (e.g., "ex-Swiggy fleet manager") → Priority: Hire that exact role
+- If bullets mention specific partnerships → Priority: Close that partnership
+- If bullets mention specific price points → Priority: Achieve that unit economics target
+- If bullets mention specific platforms → Priority: Launch on that platform
+
+**Task:** Define the top financial priorities for the next 6-12 months, DIRECTLY DERIVED from the industry-specific bullets.
+
+"""
+    + _PRIORITY_CATEGORIES_BLOCK
+    + """**Output Format:** Return JSON matching schema FINANCIAL_PRIORITY_V1 (see system prompt).
+
+"""
+)
+
+
+_COMBINED_POST_STAGE_HEADER: Final[str] = """You are a strategic startup finance advisor covering fundraising, financial planning, and prioritization.
+
+**Your Role:** The funding stage and raise amount are already decided (see inputs below). In ONE response, produce three analyses:
+1. investor_type - the best investor types AND specific investor names for this startup
+2. runway - expected runway and burn rate guidance for the raise amount
+3. priorities - the top 3-5 immediate financial priorities SPECIFIC to this exact niche
+
+**CRITICAL:** Use the Idea Profile AND Industry-Specific Realities from the inputs below for all three:
+- High Regulation Risk → Seek investors with domain expertise (e.g., FinTech VCs, HealthTech VCs)
+- Hardware-heavy → Prefer deep-tech investors; factor in CapEx and depreciation for burn
+- High Capital Intensity → Target larger funds with multi-stage capacity
+- Specific Category → Match to sector-focused investors; industry bullets naming investors/funds → prioritize those EXACT names
+- High Burn Profile → Monthly burn 30-50% higher than stage average
+- High Operational Complexity → Add 20-30% overhead buffer
+- Team Requirements → Adjust headcount assumptions by role types
+- Industry bullets mention specific costs → Factor these into burn calculations
+- Priorities MUST be derived from the industry bullets (exact certifications, hires, partnerships, price points, platforms). Do NOT give generic advice like "hire key roles" or "optimize operations".
+- Keep the three analyses consistent with each other (the runway must fit the investors and priorities you recommend).
+
+**Output Format (JSON only, exactly these three top-level keys):**
+{
+  "investor_type": {...} matching schema INVESTOR_TYPE_V1,
+  "runway": {...} matching schema RUNWAY_V1,
+  "priorities": {...} matching schema FINANCIAL_PRIORITY_V1
+}
+(schemas in the system prompt)
+
+"""
+
+
+_COMBINED_FINANCE_HEADER: Final[str] = (
+    """You are a senior startup finance advisor covering funding strategy, fundraising, financial planning, and prioritization.
+
+**Your Role:** In ONE response, produce five analyses, in this order (each later one must build on the earlier ones):
+1. funding_stage - the most appropriate funding stage
+2. raise_amount - the ideal amount to raise at that stage
+3. investor_type - the best investor types AND specific investor names for that stage and raise
+4. runway - expected runway and burn rate guidance for that raise
+5. priorities - the top 3-5 immediate financial priorities SPECIFIC to this exact niche
+
+**CRITICAL:** Use the Idea Profile AND Industry-Specific Realities from the inputs below for all five:
+- Funding stage: weigh product stage, revenue and traction against capital intensity, burn profile and operational complexity
+- Very High Capital Intensity → Increase raise by 50-100% above stage average; target larger funds with multi-stage capacity
+- High Burn Profile → Add 6 months of extra runway buffer; monthly burn 30-50% higher than stage average
+- Hardware-heavy → Factor in equipment/infrastructure costs, CapEx and depreciation; prefer deep-tech investors
+- High Operational Complexity → Add 20-30% overhead buffer
+- High Regulation Risk → Seek investors with domain expertise (e.g., FinTech VCs, HealthTech VCs)
+- Specific Category → Match to sector-focused investors; industry bullets naming investors/funds → prioritize those EXACT names
+- Team Requirements → Adjust headcount assumptions by role types
+- Industry bullets mention specific costs (certifications, equipment, key hires) → Include these in the raise and burn calculations
+- Priorities MUST be derived from the industry bullets (exact certifications, hires, partnerships, price points, platforms). Do NOT give generic advice like "hire key roles" or "optimize operations".
+
+"""
+    + _FUNDING_STAGES_BLOCK
+    + """**Output Format (JSON only, exactly these five top-level keys):**
+{
+  "funding_stage": {...} matching schema FUNDING_STAGE_V1,
+  "raise_amount": {...} matching schema RAISE_AMOUNT_V1,
+  "investor_type": {...} matching schema INVESTOR_TYPE_V1,
+  "runway": {...} matching schema RUNWAY_V1,
+  "priorities": {...} matching schema FINANCIAL_PRIORITY_V1
+}
+(schemas in the system prompt)
+
+"""
+)
+
+
+# Dynamic input blocks: str.format templates, filled in C with no per-call parsing in Python.
+
+# Name / one-line / full description, rendered once per analysis and shared by every prompt
+_CORE_IDENTITY_BLOCK: Final[str] = """Name: {startup_name}
+One-line Description: {one_line}
+Full Idea Description: {idea_desc}"""
+
+_INDUSTRY_BULLETS_SECTION: Final[str] = """
+**INDUSTRY-SPECIFIC REALITIES ({industry_label}, confidence: {confidence}):**
+These are the ACTUAL things that matter in this exact niche in 2025. Use these to ground your recommendations:
+
+{bullets_text}
+
+**CRITICAL:** Your recommendations MUST align with these industry-specific realities. Do NOT give generic advice that contradicts these bullets.
+"""
+
+_IDEA_UNDERSTANDING_INPUTS: Final[str] = """STARTUP INPUTS:
+{core_identity}
+Industry: {industry}
+Business Model: {business_model}
+Target Market: {target_market}"""
+
+_FUNDING_STAGE_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Industry: {industry}
+Target Market: {target_market}
+Geography: {geography}
+Team Size: {team_size}
+Product Stage: {product_stage}
+Monthly Revenue: {monthly_revenue}
+Growth Rate: {growth_rate}
+Traction: {traction}
+Business Model: {business_model}
+Funding Goal: {funding_goal}
+{idea_profile_section}{industry_bullets_section}"""
+
+_RAISE_AMOUNT_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Industry: {industry}
+Target Market: {target_market}
+Team Size: {team_size}
+Monthly Revenue: {monthly_revenue}
+Funding Stage: {funding_stage}
+Funding Goal (user input): {funding_goal}
+Main Financial Concern: {main_concern}
+{idea_profile_section}{industry_bullets_section}"""
+
+_INVESTOR_TYPE_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Industry: {industry}
+Target Market: {target_market}
+Geography: {geography}
+Funding Stage: {funding_stage}
+Raise Amount: {raise_amount}
+Business Model: {business_model}
+{idea_profile_section}{industry_bullets_section}"""
+
+_RUNWAY_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Team Size: {team_size}
+Monthly Revenue: {monthly_revenue}
+Industry: {industry}
+Geography: {geography}
+Raise Amount: {raise_amount}
+Main Financial Concern: {main_concern}
+{idea_profile_section}{industry_bullets_section}"""
+
+_FINANCIAL_PRIORITY_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Industry: {industry}
+Product Stage: {product_stage}
+Team Size: {team_size}
+Monthly Revenue: {monthly_revenue}
+Main Concern: {main_concern}
+
+**Previous Agent Outputs:**
+- Funding Stage: {prev_funding_stage}
+- Raise Amount: {prev_raise_amount}
+- Investor Type: {prev_investor_type}
+- Runway: {prev_runway}
+{idea_profile_section}{industry_bullets_section}"""
+
+_COMBINED_POST_STAGE_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Industry: {industry}
+Target Market: {target_market}
+Geography: {geography}
+Business Model: {business_model}
+Product Stage: {product_stage}
+Team Size: {team_size}
+Monthly Revenue: {monthly_revenue}
+Main Financial Concern: {main_concern}
+Funding Stage: {funding_stage}
+Raise Amount: {raise_amount}
+{idea_profile_section}{industry_bullets_section}"""
+
+_COMBINED_FINANCE_INPUTS: Final[str] = """**STARTUP INPUTS:**
+{core_identity}
+Industry: {industry}
+Target Market: {target_market}
+Geography: {geography}
+Business Model: {business_model}
+Product Stage: {product_stage}
+Team Size: {team_size}
+Monthly Revenue: {monthly_revenue}
+Growth Rate: {growth_rate}
+Traction: {traction}
+Funding Goal (user input): {funding_goal}
+Main Financial Concern: {main_concern}
+{idea_profile_section}{industry_bullets_section}"""
+
+_IDEA_PROFILE_LABELS: Final[Dict[str, str]] = {
+    'category': 'Category',
+    'business_model': 'Business Model',
+    'capital_intensity': 'Capital Intensity',
+    'burn_profile': 'Burn Profile',
+    'hardware_dependency': 'Hardware Dependency',
+    'operational_complexity': 'Operational Complexity',
+    'regulation_risk': 'Regulation Risk',
+    'scalability_model': 'Scalability Model',
+    'margin_profile': 'Margin Profile',
+    'team_requirements': 'Team Requirements',
+    'confidence': 'Confidence',
+}
+
+# Idea profile fields each agent sees (in display order) and their inline notes
+_FUNDING_STAGE_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'category', 'business_model', 'capital_intensity', 'burn_profile',
+    'hardware_dependency', 'operational_complexity', 'regulation_risk',
+    'scalability_model', 'margin_profile', 'confidence',
+)
+
+_RAISE_AMOUNT_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'category', 'capital_intensity', 'burn_profile', 'hardware_dependency',
+    'operational_complexity', 'margin_profile',
+)
+_RAISE_AMOUNT_PROFILE_NOTES: Final[Dict[str, str]] = {
+    'capital_intensity': '(CRITICAL for raise amount)',
+    'burn_profile': '(CRITICAL for raise amount)',
+}
+
+_INVESTOR_TYPE_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'category', 'capital_intensity', 'regulation_risk', 'hardware_dependency',
+    'margin_profile', 'scalability_model',
+)
+_INVESTOR_TYPE_PROFILE_NOTES: Final[Dict[str, str]] = {
+    'category': '(helps identify domain-focused investors)',
+    'regulation_risk': '(CRITICAL for investor selection)',
+}
+
+_RUNWAY_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'burn_profile', 'operational_complexity', 'hardware_dependency',
+    'team_requirements', 'capital_intensity',
+)
+_RUNWAY_PROFILE_NOTES: Final[Dict[str, str]] = {
+    'burn_profile': '(CRITICAL for runway calculation)',
+    'operational_complexity': '(affects overhead)',
+    'hardware_dependency': '(affects CapEx)',
+    'team_requirements': '(affects headcount burn)',
+}
+
+_FINANCIAL_PRIORITY_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'category', 'business_model', 'capital_intensity', 'operational_complexity',
+    'hardware_dependency', 'regulation_risk', 'team_requirements', 'margin_profile',
+)
+
+_COMBINED_POST_STAGE_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'category', 'business_model', 'capital_intensity', 'burn_profile',
+    'hardware_dependency', 'operational_complexity', 'regulation_risk',
+    'scalability_model', 'team_requirements', 'margin_profile',
+)
+_COMBINED_POST_STAGE_PROFILE_NOTES: Final[Dict[str, str]] = {
+    'regulation_risk': '(CRITICAL for investor selection)',
+    'burn_profile': '(CRITICAL for runway calculation)',
+}
+
+_COMBINED_FINANCE_PROFILE_FIELDS: Final[Tuple[str, ...]] = (
+    'category', 'business_model', 'capital_intensity', 'burn_profile',
+    'hardware_dependency', 'operational_complexity', 'regulation_risk',
+    'scalability_model', 'team_requirements', 'margin_profile', 'confidence',
+)
+_COMBINED_FINANCE_PROFILE_NOTES: Final[Dict[str, str]] = {
+    'capital_intensity': '(CRITICAL for raise amount)',
+    'burn_profile': '(CRITICAL for raise amount and runway)',
+    'regulation_risk': '(CRITICAL for investor selection)',
+}
+
+_IDEA_PROFILE_UNAVAILABLE: Final[str] = "\n**IDEA PROFILE:** Not available\n"
+_FUNDING_STAGE_PROFILE_UNAVAILABLE: Final[str] = (
+    "\n**IDEA PROFILE:** Not available (will rely on basic inputs only)\n"
+)
+
+# Stand-in when no profile has been attached yet (renders as "Not available")
+_EMPTY_IDEA_PROFILE: Final[IdeaProfile] = IdeaProfile()
+
+
+_INDUSTRY_BULLETS_UNAVAILABLE: Final[str] = (
+    "\n**INDUSTRY-SPECIFIC REALITIES:** Not available (will use general guidance)\n"
+)
+
+# Keyword heuristics routing each industry bullet to the agents it informs
+_BULLET_BUCKET_PATTERNS: Final[Dict[str, "re.Pattern[str]"]] = {
+    'funding': re.compile(
+        r"traction|revenue|\bmrr\b|\barr\b|\bgmv\b|users?\b|customers?|pilot|\bmvp\b|launch|"
+        r"milestone|retention|growth|orders|design partners|licen[cs]e|certif|approv|regulat",
+        re.IGNORECASE,
+    ),
+    'raise_amount': re.compile(
+        r"[₹$€£]|\bcr\b|crore|lakh|capex|capital|cost|price|inventory|fleet|equipment|hardware|"
+        r"plant|facility|factory|warehouse|kitchen|shed|certif",
+        re.IGNORECASE,
+    ),
+    'investor': re.compile(
+        r"investor|\bvcs?\b|venture|angel|fund|grant|scheme|subsid|\bpli\b|government|strategic|"
+        r"corporate|partner|accelerator|incubator|debt|loan|\bnbfc",
+        re.IGNORECASE,
+    ),
+    'runway': re.compile(
+        r"burn|salar|payroll|hire|hiring|team|engineer|[₹$€£]|cost|monthly|/month|per month|rent|"
+        r"lease|inventory|fleet|working capital|payment|receivable|cycle|margin|commission|"
+        r"\bmonths?\b|cheaper|expensive",
+        re.IGNORECASE,
+    ),
+    'priority': re.compile(
+        r"hire|hiring|certif|licen[cs]e|complian|regulat|partner|platform|launch|integrat|price|"
+        r"pricing|margin|unit economics|\bcac\b|channel|marketing|influencer|listing|distribution|"
+        r"sales|pilot",
+        re.IGNORECASE,
+    ),
+}
+
+# The combined post-stage prompt covers the investor, runway and priority agents
+_POST_STAGE_BUCKETS: Final[Tuple[str, ...]] = ('investor', 'runway', 'priority')
+
+
+def classify_bullets(bullets: Tuple[str, ...]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Route industry bullets to the agents they inform, using keyword heuristics.
+    
+    Returns buckets keyed 'funding', 'raise_amount', 'investor', 'runway' and
+    'priority'. A bullet can land in several buckets; a bucket that matches
+    nothing keeps every bullet so no agent loses its industry context.
+    """
+    bullets = tuple(bullets)
+    buckets = {}
+    for bucket, pattern in _BULLET_BUCKET_PATTERNS.items():
+        buckets[bucket] = tuple(bullet for bullet in bullets if pattern.search(bullet)) or bullets
+    return buckets
+
+
+def _render_bullets(industry_bullets: IndustryBullets, bullets: Tuple[str, ...]) -> str:
+    """Render the industry bullets block for one agent's subset of bullets."""
+    return _INDUSTRY_BULLETS_SECTION.format(
+        industry_label=industry_bullets.industry_label,
+        confidence=industry_bullets.confidence,
+        # Prefix via the separator: no per-bullet temporaries (bullets is never empty here)
+        bullets_text="• " + "\n• ".join(bullets),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class _BulletSections:
+    """Rendered industry bullets section per agent (see classify_bullets); hashable."""
+    funding: str
+    raise_amount: str
+    investor: str
+    runway: str
+    priority: str
+    # Combined investor / runway / priority prompt
+    post_stage: str
+    # Combined funding-to-priorities prompt (every bullet)
+    combined_finance: str
+
+
+@functools.lru_cache(maxsize=128)
+def _render_bullet_sections(industry_bullets: IndustryBullets) -> _BulletSections:
+    """Classify and render the industry bullets once per analysis, one section per agent."""
+    buckets = classify_bullets(industry_bullets.bullets)
+    post_stage = set().union(*(buckets[bucket] for bucket in _POST_STAGE_BUCKETS))
+    buckets['post_stage'] = tuple(bullet for bullet in industry_bullets.bullets if bullet in post_stage)
+    buckets['combined_finance'] = industry_bullets.bullets
+    return _BulletSections(**{
+        bucket: _render_bullets(industry_bullets, bullets) for bucket, bullets in buckets.items()
+    })
+
+
+_NO_BULLET_SECTIONS: Final[_BulletSections] = _BulletSections(
+    **dict.fromkeys((*_BULLET_BUCKET_PATTERNS, 'post_stage', 'combined_finance'), _INDUSTRY_BULLETS_UNAVAILABLE)
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_idea_profile(
+    fields: Tuple[str, ...],
+    notes: Tuple[Tuple[str, str], ...],
+    values: Tuple[str, ...],
+) -> str:
+    """Render the idea profile block; one analysis renders it five times over one profile."""
+    notes_by_field = dict(notes)
+    lines = ["\n**IDEA PROFILE (from IdeaUnderstandingAgent):**"]
+    for field, value in zip(fields, values):
+        note = notes_by_field.get(field)
+        line = f"- {_IDEA_PROFILE_LABELS[field]}: {value}"
+        lines.append(f"{line} {note}" if note else line)
+    return "\n".join(lines) + "\n"
+
+
+def _get_industry_bullets_sections(industry_bullets: Any) -> _BulletSections:
+    """
+    Build the industry-specific bullets sections from IndustrySpecialistAgent output,
+    one per bucket (see classify_bullets) plus `post_stage` and `combined_finance`
+    for the combined prompts.
+    Each downstream agent only sees the niche-aware bullets relevant to its domain.
+    """
+    # Raw agent output from callers that bypass the orchestrator
+    if isinstance(industry_bullets, dict):
+        industry_bullets = IndustryBullets.from_dict(industry_bullets)
+    
+    if industry_bullets is not None and industry_bullets.bullets:
+        return _render_bullet_sections(industry_bullets)
+    
+    return _NO_BULLET_SECTIONS
+
+
+def _get_idea_profile_section(
+    ctx: "StartupContext",
+    include_fields: Tuple[str, ...],
+    annotations: Optional[Dict[str, str]] = None,
+    unavailable: str = _IDEA_PROFILE_UNAVAILABLE,
+) -> str:
+    """
+    Build the idea profile section from IdeaUnderstandingAgent output.
+    Each agent passes the subset of fields it needs plus optional inline notes.
+    """
+    idea_profile = ctx.idea_profile
+    if idea_profile.is_empty:
+        return unavailable
+    
+    # Stringify up front so the render cache key is hashable
+    # (team requirements keep their list rendering)
+    values = tuple(
+        str(list(value) if isinstance(value, tuple) else value)
+        for value in (getattr(idea_profile, field) for field in include_fields)
+    )
+    notes = tuple(sorted(annotations.items())) if annotations else ()
+    return _render_idea_profile(include_fields, notes, values)
+
+
+class Prompt(str):
+    """
+    A rendered prompt that remembers where its static part ends.
+    
+    Behaves as a plain str everywhere. The static prefix (role, instructions,
+    output schema) is byte-identical across calls, so LLM clients that support
+    explicit prompt caching can mark it as a cache breakpoint (see llm_client).
+    """
+    
+    static_prefix: str
+    
+    def __new__(cls, static_prefix: str, dynamic_suffix: str) -> "Prompt":
+        prompt = super().__new__(cls, static_prefix + dynamic_suffix)
+        prompt.static_prefix = static_prefix
+        return prompt
+    
+    @property
+    def dynamic_suffix(self) -> str:
+        return str.__getitem__(self, slice(len(self.static_prefix), None))
+
+
+# Rendered prompts per builder, keyed on the (hashable) StartupContext plus stage args.
+# Retries and re-runs with identical inputs return the stored string instead of rendering.
+_PROMPT_CACHE_MAX: Final[int] = int(os.getenv("PROMPT_CACHE_MAX_ENTRIES", "512"))
+
+
+def _cached_prompt(builder: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize a prompt builder with an LRU of _PROMPT_CACHE_MAX entries.
+    Contexts holding unhashable values (e.g. a list in the idea profile) render uncached;
+    errors raised by the builder itself propagate as usual.
+    """
+    cached = functools.lru_cache(maxsize=_PROMPT_CACHE_MAX)(builder)
+    
+    @functools.wraps(builder)
+    def wrapper(ctx: "StartupContext", *args: Any) -> str:
+        # The LRU hashes the key itself; only a TypeError pays for a second hash,
+        # to tell an unhashable key apart from a TypeError raised by the builder
+        try:
+            return cached(ctx, *args)
+        except TypeError:
+            try:
+                hash((ctx, *args))
+            except TypeError:
+                return builder(ctx, *args)
+            raise
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@dataclass(slots=True, frozen=True)
+class StartupContext:
+    """
+    Everything the prompt builders read, resolved once per analysis.
+    Builders use plain attribute reads instead of dict lookups with defaults.
+    Hashable (as long as the inputs are), so it doubles as the prompt cache key.
+    """
+    startup_name: Any
+    one_line: Any
+    idea_desc: Any
+    core_identity: str
+    industry: Any
+    business_model: Any
+    target_market: Any
+    geography: Any
+    team_size: Any
+    product_stage: Any
+    monthly_revenue: str
+    growth_rate: Any
+    traction: Any
+    funding_goal: str
+    main_concern: Any
+    idea_profile: IdeaProfile
+    industry_bullets_sections: _BulletSections
+    
+    @classmethod
+    def from_dict(cls, startup_data: dict) -> "StartupContext":
+        """Build from startup input (camelCase or snake_case) plus any attached ideaProfile / industryBullets."""
+        startup_data = normalize_startup_data(startup_data)
+        
+        idea_profile = startup_data.get('ideaProfile') or _EMPTY_IDEA_PROFILE
+        # Raw agent output from callers that bypass the orchestrator
+        if isinstance(idea_profile, dict):
+            idea_profile = IdeaProfile.from_dict(idea_profile)
+        
+        startup_name = startup_data.get('startup_name', 'N/A')
+        one_line = startup_data.get('one_line_description') or startup_name
+        idea_desc = startup_data.get('idea_description', 'N/A')
+        
+        return cls(
+            startup_name=startup_name,
+            one_line=one_line,
+            idea_desc=idea_desc,
+            core_identity=_CORE_IDENTITY_BLOCK.format(
+                startup_name=startup_name, one_line=one_line, idea_desc=idea_desc
+            ),
+            industry=startup_data.get('industry', 'N/A'),
+            business_model=startup_data.get('business_model', 'N/A'),
+            target_market=startup_data.get('target_market', 'N/A'),
+            geography=startup_data.get('geography', 'N/A'),
+            team_size=startup_data.get('team_size', 0),
+            product_stage=startup_data.get('product_stage', 'N/A'),
+            monthly_revenue=startup_data['monthly_revenue_fmt'],
+            growth_rate=startup_data.get('growth_rate', 'N/A'),
+            traction=startup_data.get('traction_summary', 'N/A'),
+            funding_goal=startup_data['funding_goal_fmt'],
+            main_concern=startup_data.get('main_financial_concern', 'N/A'),
+            idea_profile=idea_profile,
+            industry_bullets_sections=_get_industry_bullets_sections(startup_data.get('industryBullets')),
+        )
+
+
+def bind(startup_data: dict) -> "BoundPromptTemplates":
+    """Partially apply the prompt builders to one startup's data (see BoundPromptTemplates)."""
+    return BoundPromptTemplates(startup_data)
+
+
+@_cached_prompt
+def idea_understanding_agent(ctx: StartupContext) -> Prompt:
+    """Prompt for understanding the startup idea and deriving a structured profile."""
+    return Prompt(
+        _IDEA_UNDERSTANDING_HEADER,
+        _IDEA_UNDERSTANDING_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            business_model=ctx.business_model,
+            target_market=ctx.target_market,
+        ) + _IDEA_UNDERSTANDING_FOOTER,
+    )
+
+
+@_cached_prompt
+def funding_stage_agent(ctx: StartupContext) -> Prompt:
+    """Prompt for determining funding stage."""
+    return Prompt(
+        _FUNDING_STAGE_HEADER,
+        _FUNDING_STAGE_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            target_market=ctx.target_market,
+            geography=ctx.geography,
+            team_size=ctx.team_size,
+            product_stage=ctx.product_stage,
+            monthly_revenue=ctx.monthly_revenue,
+            growth_rate=ctx.growth_rate,
+            traction=ctx.traction,
+            business_model=ctx.business_model,
+            funding_goal=ctx.funding_goal,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _FUNDING_STAGE_PROFILE_FIELDS,
+                unavailable=_FUNDING_STAGE_PROFILE_UNAVAILABLE,
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.funding,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+@_cached_prompt
+def raise_amount_agent(ctx: StartupContext, funding_stage: str) -> Prompt:
+    """Prompt for determining raise amount."""
+    return Prompt(
+        _RAISE_AMOUNT_HEADER,
+        _RAISE_AMOUNT_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            target_market=ctx.target_market,
+            team_size=ctx.team_size,
+            monthly_revenue=ctx.monthly_revenue,
+            funding_stage=funding_stage,
+            funding_goal=ctx.funding_goal,
+            main_concern=ctx.main_concern,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _RAISE_AMOUNT_PROFILE_FIELDS, _RAISE_AMOUNT_PROFILE_NOTES
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.raise_amount,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+@_cached_prompt
+def investor_type_agent(ctx: StartupContext, funding_stage: str, raise_amount: str) -> Prompt:
+    """Prompt for identifying ideal investor types."""
+    return Prompt(
+        _INVESTOR_TYPE_HEADER,
+        _INVESTOR_TYPE_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            target_market=ctx.target_market,
+            geography=ctx.geography,
+            funding_stage=funding_stage,
+            raise_amount=raise_amount,
+            business_model=ctx.business_model,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _INVESTOR_TYPE_PROFILE_FIELDS, _INVESTOR_TYPE_PROFILE_NOTES
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.investor,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+@_cached_prompt
+def runway_agent(ctx: StartupContext, raise_amount: str) -> Prompt:
+    """Prompt for calculating runway."""
+    return Prompt(
+        _RUNWAY_HEADER,
+        _RUNWAY_INPUTS.format(
+            core_identity=ctx.core_identity,
+            team_size=ctx.team_size,
+            monthly_revenue=ctx.monthly_revenue,
+            industry=ctx.industry,
+            geography=ctx.geography,
+            raise_amount=raise_amount,
+            main_concern=ctx.main_concern,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _RUNWAY_PROFILE_FIELDS, _RUNWAY_PROFILE_NOTES
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.runway,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+def financial_priority_agent(ctx: StartupContext, context: dict) -> Prompt:
+    """Prompt for determining financial priorities."""
+    # Only the upstream outputs feed the prompt (and its cache key), not the whole chain context;
+    # they render as str() anyway, and as strings they are hashable
+    return _financial_priority_prompt(
+        ctx,
+        str(context.get('funding_stage', 'N/A')),
+        str(context.get('raise_amount', 'N/A')),
+        str(context.get('investor_type', 'N/A')),
+        str(context.get('runway', 'N/A')),
+    )
+
+
+@_cached_prompt
+def _financial_priority_prompt(
+    ctx: StartupContext,
+    prev_funding_stage: str,
+    prev_raise_amount: str,
+    prev_investor_type: str,
+    prev_runway: str,
+) -> Prompt:
+    return Prompt(
+        _FINANCIAL_PRIORITY_HEADER,
+        _FINANCIAL_PRIORITY_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            product_stage=ctx.product_stage,
+            team_size=ctx.team_size,
+            monthly_revenue=ctx.monthly_revenue,
+            main_concern=ctx.main_concern,
+            prev_funding_stage=prev_funding_stage,
+            prev_raise_amount=prev_raise_amount,
+            prev_investor_type=prev_investor_type,
+            prev_runway=prev_runway,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _FINANCIAL_PRIORITY_PROFILE_FIELDS
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.priority,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+@_cached_prompt
+def combined_post_stage_agent(ctx: StartupContext, funding_stage: str, raise_amount: str) -> Prompt:
+    """
+    One prompt covering investor type, runway, and financial priorities.
+    
+    These stages only depend on funding stage and raise amount, so they can share
+    a single call; the response is a JSON object with `investor_type`, `runway`
+    and `priorities` keys.
+    """
+    return Prompt(
+        _COMBINED_POST_STAGE_HEADER,
+        _COMBINED_POST_STAGE_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            target_market=ctx.target_market,
+            geography=ctx.geography,
+            business_model=ctx.business_model,
+            product_stage=ctx.product_stage,
+            team_size=ctx.team_size,
+            monthly_revenue=ctx.monthly_revenue,
+            main_concern=ctx.main_concern,
+            funding_stage=funding_stage,
+            raise_amount=raise_amount,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _COMBINED_POST_STAGE_PROFILE_FIELDS, _COMBINED_POST_STAGE_PROFILE_NOTES
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.post_stage,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+@_cached_prompt
+def combined_finance_agent(ctx: StartupContext) -> Prompt:
+    """
+    One prompt covering funding stage, raise amount, investor type, runway,
+    and financial priorities.
+    
+    Everything after the idea profile and industry bullets, answered in a single
+    call with the startup context sent once; the response is a JSON object with
+    `funding_stage`, `raise_amount`, `investor_type`, `runway` and `priorities` keys.
+    """
+    return Prompt(
+        _COMBINED_FINANCE_HEADER,
+        _COMBINED_FINANCE_INPUTS.format(
+            core_identity=ctx.core_identity,
+            industry=ctx.industry,
+            target_market=ctx.target_market,
+            geography=ctx.geography,
+            business_model=ctx.business_model,
+            product_stage=ctx.product_stage,
+            team_size=ctx.team_size,
+            monthly_revenue=ctx.monthly_revenue,
+            growth_rate=ctx.growth_rate,
+            traction=ctx.traction,
+            funding_goal=ctx.funding_goal,
+            main_concern=ctx.main_concern,
+            idea_profile_section=_get_idea_profile_section(
+                ctx, _COMBINED_FINANCE_PROFILE_FIELDS, _COMBINED_FINANCE_PROFILE_NOTES
+            ),
+            industry_bullets_section=ctx.industry_bullets_sections.combined_finance,
+        ) + _JSON_ONLY_FOOTER,
+    )
+
+
+class BoundPromptTemplates:
+    """
+    The prompt builders bound to one startup's data.
+    
+    The StartupContext is built once, here, and reused by every method; each
+    method only fills in its stage-specific inputs. The bound dict is shared,
+    not copied: when the orchestrator attaches the idea profile or industry
+    bullets later in the chain, the context is rebuilt once to pick them up.
+    
+    Usage:
+        tpl = prompt_templates.bind(startup_data)
+        prompt = tpl.raise_amount_agent(funding_stage)
+    """
+    
+    __slots__ = ("startup_data", "_ctx", "_ctx_sources")
+    
+    def __init__(self, startup_data: dict):
+        self.startup_data = normalize_startup_data(startup_data)
+        self._ctx: Optional[StartupContext] = None
+        self._ctx_sources: Tuple[Any, Any] = (None, None)
+    
+    @property
+    def ctx(self) -> StartupContext:
+        """StartupContext for the bound data, rebuilt only when profile/bullets change."""
+        data = self.startup_data
+        sources = (data.get('ideaProfile'), data.get('industryBullets'))
+        ctx = self._ctx
+        if ctx is None or sources[0] is not self._ctx_sources[0] or sources[1] is not self._ctx_sources[1]:
+            ctx = self._ctx = StartupContext.from_dict(data)
+            self._ctx_sources = sources
+        return ctx
+    
+    def idea_understanding_agent(self) -> Prompt:
+        return idea_understanding_agent(self.ctx)
+    
+    def funding_stage_agent(self) -> Prompt:
+        return funding_stage_agent(self.ctx)
+    
+    def raise_amount_agent(self, funding_stage: str) -> Prompt:
+        return raise_amount_agent(self.ctx, funding_stage)
+    
+    def investor_type_agent(self, funding_stage: str, raise_amount: str) -> Prompt:
+        return investor_type_agent(self.ctx, funding_stage, raise_amount)
+    
+    def runway_agent(self, raise_amount: str) -> Prompt:
+        return runway_agent(self.ctx, raise_amount)
+    
+    def financial_priority_agent(self, context: dict) -> Prompt:
+        return financial_priority_agent(self.ctx, context)
+    
+    def combined_post_stage_agent(self, funding_stage: str, raise_amount: str) -> Prompt:
+        return combined_post_stage_agent(self.ctx, funding_stage, raise_amount)
+    
+    def combined_finance_agent(self) -> Prompt:
+        return combined_finance_agent(self.ctx)
@@ -1,275 +1,470 @@
-"""
-Redis manager for user metrics tracking.
-Handles user generation counts, feedback ratings, and activity timestamps.
-"""
-
-import redis
-import json
-from datetime import datetime
-from typing import Optional, Dict, Any
-import os
-import logging
-
-logger = logging.getLogger(__name__)
-
-
-class RedisMetricsManager:
-    """Manages user metrics in Redis with minimal API."""
-
-    def __init__(self, redis_url: Optional[str] = None):
-        """
-        Initialize Redis connection for metrics.
-        
-        Args:
-            redis_url: Redis connection URL (defaults to REDIS_URL env var)
-        """
-        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        try:
-            self.client = redis.from_url(self.redis_url, decode_responses=True)
-            # Test connection
-            self.client.ping()
-            logger.info(f"[OK] Redis metrics manager connected: {self.redis_url}")
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to connect to Redis: {e}")
-            self.client = None
-
-    def increment_generation_count(self, user_id: str) -> int:
-        """
-        Increment the generation counter for a user.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            New counter value
-        """
-        if not self.client:
-            return 0
-        
-        try:
-            key = f"user:{user_id}:generations"
-            count = self.client.incr(key)
-            # Set expiration to 1 year for user metrics
-            self.client.expire(key, 365 * 24 * 60 * 60)
-            logger.info(f"[OK] User {user_id} generation count: {count}")
-            return count
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to increment generation count: {e}")
-            return 0
-
-    def get_generation_count(self, user_id: str) -> int:
-        """
-        Get the total generation count for a user.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            Generation count (0 if not found)
-        """
-        if not self.client:
-            return 0
-        
-        try:
-            key = f"user:{user_id}:generations"
-            count = self.client.get(key)
-            return int(count) if count else 0
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to get generation count: {e}")
-            return 0
-
-    def add_feedback(self, user_id: str, strategy_id: str, rating: int) -> bool:
-        """
-        Store feedback rating for a strategy.
-        
-        Args:
-            user_id: Unique user identifier
-            strategy_id: Strategy ID to rate
-            rating: Rating value (1-5)
-            
-        Returns:
-            Success status
-        """
-        if not self.client or not (1 <= rating <= 5):
-            return False
-        
-        try:
-            key = f"user:{user_id}:feedback"
-            # Store as hash: strategy_id -> rating
-            self.client.hset(key, strategy_id, rating)
-            self.client.expire(key, 365 * 24 * 60 * 60)
-            logger.info(f"[OK] User {user_id} rated strategy {strategy_id}: {rating}")
-            return True
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to add feedback: {e}")
-            return False
-
-    def get_average_rating(self, user_id: str) -> float:
-        """
-        Calculate average rating across all user strategies.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            Average rating (0 if no ratings)
-        """
-        if not self.client:
-            return 0.0
-        
-        try:
-            key = f"user:{user_id}:feedback"
-            ratings = self.client.hgetall(key)
-            if not ratings:
-                return 0.0
-            
-            ratings_list = [int(r) for r in ratings.values()]
-            avg = sum(ratings_list) / len(ratings_list) if ratings_list else 0.0
-            return round(avg, 2)
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to calculate average rating: {e}")
-            return 0.0
-
-    def update_last_active(self, user_id: str) -> bool:
-        """
-        Update the last active timestamp for a user.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            Success status
-        """
-        if not self.client:
-            return False
-        
-        try:
-            key = f"user:{user_id}:last_active"
-            timestamp = datetime.utcnow().isoformat()
-            self.client.set(key, timestamp)
-            self.client.expire(key, 365 * 24 * 60 * 60)
-            return True
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to update last active: {e}")
-            return False
-
-    def get_user_metrics(self, user_id: str) -> Dict[str, Any]:
-        """
-        Get all metrics for a user in one call.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            Dictionary with generation_count, average_rating, last_active
-        """
-        if not self.client:
-            return {
-                "generation_count": 0,
-                "average_rating": 0.0,
-                "last_active": None,
-            }
-        
-        try:
-            generation_count = self.get_generation_count(user_id)
-            average_rating = self.get_average_rating(user_id)
-            
-            last_active_key = f"user:{user_id}:last_active"
-            last_active = self.client.get(last_active_key)
-            
-            return {
-                "generation_count": generation_count,
-                "average_rating": average_rating,
-                "last_active": last_active,
-            }
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to get user metrics: {e}")
-            return {
-                "generation_count": 0,
-                "average_rating": 0.0,
-                "last_active": None,
-            }
-
-    def create_session(self, user_id: str, session_data: Dict[str, Any]) -> bool:
-        """
-        Create a user session in Redis.
-        
-        Args:
-            user_id: Unique user identifier
-            session_data: Session data to store
-            
-        Returns:
-            Success status
-        """
-        if not self.client:
-            return False
-        
-        try:
-            key = f"session:{user_id}"
-            # Store session data as JSON
-            session_json = json.dumps(session_data)
-            self.client.set(key, session_json)
-            # 30 day TTL for sessions
-            self.client.expire(key, 30 * 24 * 60 * 60)
-            logger.info(f"[OK] Session created for user {user_id}")
-            return True
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to create session: {e}")
-            return False
-
-    def get_session(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """
-        Retrieve session data for a user.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            Session data dict or None if not found
-        """
-        if not self.client:
-            return None
-        
-        try:
-            key = f"session:{user_id}"
-            session_data = self.client.get(key)
-            if session_data:
-                return json.loads(session_data)
-            return None
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to get session: {e}")
-            return None
-
-    def delete_session(self, user_id: str) -> bool:
-        """
-        Delete a user session.
-        
-        Args:
-            user_id: Unique user identifier
-            
-        Returns:
-            Success status
-        """
-        if not self.client:
-            return False
-        
-        try:
-            key = f"session:{user_id}"
-            self.client.delete(key)
-            logger.info(f"[OK] Session deleted for user {user_id}")
-            return True
-        except Exception as e:
-            logger.error(f"[ERROR] Failed to delete session: {e}")
-            return False
-
-
-# Global instance
-_metrics_manager: Optional[RedisMetricsManager] = None
-
-
-def get_metrics_manager() -> RedisMetricsManager:
-    """Get or create the global metrics manager instance."""
-    global _metrics_manager
-    if _metrics_manager is None:
-        _metrics_manager = RedisMetricsManager()
-    return _metrics_manager
+"""
+Redis manager for user metrics tracking.
+Handles user generation counts, feedback ratings, and activity timestamps.
+
+Uses the asyncio Redis client, so metrics I/O never blocks the FastAPI event
+loop; every method is a coroutine.
+"""
+
+import redis.asyncio as aioredis
+import orjson
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List
+import os
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Key TTLs in seconds: user metrics live for a year, sessions for 30 days
+_YEAR_TTL = 365 * 24 * 60 * 60
+_MONTH_TTL = 30 * 24 * 60 * 60
+
+# Write + EXPIRE in one round trip (and atomically, so a key never lingers without a TTL)
+_INCR_EXPIRE_LUA = """
+local v = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return v
+"""
+
+# Ratings also keep a running sum and count, so reading the average is O(1).
+# KEYS: feedback hash, sum, count. Totals missing (ratings stored before they
+# existed) are rebuilt from the hash once.
+_RATING_TOTALS_LUA = """
+if redis.call('EXISTS', KEYS[3]) == 0 then
+    local total = 0
+    local ratings = redis.call('HVALS', KEYS[1])
+    for _, v in ipairs(ratings) do total = total + tonumber(v) end
+    redis.call('SET', KEYS[2], total)
+    redis.call('SET', KEYS[3], #ratings)
+end
+"""
+
+# ARGV: strategy_id, rating, ttl
+_ADD_RATING_LUA = _RATING_TOTALS_LUA + """
+local prev = redis.call('HGET', KEYS[1], ARGV[1])
+redis.call('HSET', KEYS[1], ARGV[1], ARGV[2])
+if prev then
+    redis.call('DECRBY', KEYS[2], prev)
+else
+    redis.call('INCR', KEYS[3])
+end
+redis.call('INCRBY', KEYS[2], ARGV[2])
+for i = 1, 3 do redis.call('EXPIRE', KEYS[i], ARGV[3]) end
+return 1
+"""
+
+# Returns {sum, count}
+_RATING_STATS_LUA = """
+local count = redis.call('GET', KEYS[3])
+if count then
+    return {tonumber(redis.call('GET', KEYS[2]) or 0), tonumber(count)}
+end
+local total = 0
+local ratings = redis.call('HVALS', KEYS[1])
+for _, v in ipairs(ratings) do total = total + tonumber(v) end
+return {total, #ratings}
+"""
+
+
+# Connection pools shared by every manager in the process, one per Redis URL
+_pools: Dict[str, aioredis.BlockingConnectionPool] = {}
+
+
+def _get_pool(redis_url: str) -> aioredis.BlockingConnectionPool:
+    """
+    Get or create the process-wide connection pool for a Redis URL.
+    Blocking pool: when all connections are busy, wait up to `timeout` instead of
+    opening more, so bursts don't turn into a storm of TCP connects.
+    """
+    pool = _pools.get(redis_url)
+    if pool is None:
+        pool = _pools[redis_url] = aioredis.BlockingConnectionPool.from_url(
+            redis_url,
+            max_connections=int(os.getenv("REDIS_METRICS_MAX_CONNECTIONS", "64")),
+            timeout=1,
+            decode_responses=True,  # Connection option, so it lives on the pool
+            socket_connect_timeout=2,
+            socket_timeout=2,
+            socket_keepalive=True,
+            health_check_interval=30,
+        )
+    return pool
+
+
+def _rating_keys(user_id: str) -> list:
+    """Feedback hash plus its running sum and count keys (argument order of the rating scripts)."""
+    key = f"user:{user_id}:feedback"
+    return [key, f"{key}:sum", f"{key}:count"]
+
+
+def _average_rating(stats) -> float:
+    """Average from a (sum, count) reply of _RATING_STATS_LUA (0 if no ratings)."""
+    total, count = stats
+    return round(int(total) / int(count), 2) if int(count) else 0.0
+
+
+def _last_active_iso(value: Optional[str]) -> Optional[str]:
+    """API form (naive UTC ISO-8601) of a stored last_active value (epoch seconds)."""
+    if value is None or not value.isdigit():
+        # Missing, or an ISO string stored before timestamps were epoch seconds
+        return value
+    return datetime.fromtimestamp(int(value), timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class _NullScript:
+    """Registered-script stand-in: always replies with the script's empty result."""
+
+    def __init__(self, reply: Any):
+        self.reply = reply
+
+    async def __call__(self, keys=None, args=None, client=None):
+        if client is not None:
+            # Queued on a (null) pipeline, like Script.__call__ with client=pipe
+            client.replies.append(self.reply)
+            return client
+        return self.reply
+
+
+class _NullPipeline:
+    """Pipeline stand-in: every queued command replies None."""
+
+    def __init__(self):
+        self.replies = []
+
+    def get(self, *args, **kwargs) -> "_NullPipeline":
+        self.replies.append(None)
+        return self
+
+    async def execute(self) -> list:
+        replies, self.replies = self.replies, []
+        return replies
+
+
+class _NullRedis:
+    """
+    Client stand-in while Redis is unavailable: reads find nothing and writes
+    are dropped, so the manager methods need no availability checks.
+    Falsy, so `if manager.client` still tells callers whether Redis is up.
+    """
+
+    # What each script replies with when nothing is stored
+    _SCRIPT_REPLIES = {
+        _INCR_EXPIRE_LUA: 0,
+        _ADD_RATING_LUA: 0,
+        _RATING_STATS_LUA: [0, 0],
+    }
+
+    def __bool__(self) -> bool:
+        return False
+
+    def register_script(self, script: str) -> _NullScript:
+        return _NullScript(self._SCRIPT_REPLIES.get(script))
+
+    def pipeline(self, transaction: bool = True) -> _NullPipeline:
+        return _NullPipeline()
+
+    async def ping(self) -> bool:
+        raise ConnectionError("Redis client unavailable")
+
+    async def get(self, *args, **kwargs) -> None:
+        return None
+
+    async def set(self, *args, **kwargs) -> None:
+        return None
+
+    async def delete(self, *args, **kwargs) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        pass
+
+
+class RedisMetricsManager:
+    """Manages user metrics in Redis with minimal API."""
+
+    __slots__ = ("redis_url", "client", "_incr_expire", "_add_rating", "_rating_stats")
+
+    def __init__(self, redis_url: Optional[str] = None):
+        """
+        Initialize Redis connection for metrics.
+        
+        Args:
+            redis_url: Redis connection URL (defaults to REDIS_URL env var)
+        """
+        self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
+        try:
+            # Connections are opened lazily; connect() verifies the server
+            self._use_client(aioredis.Redis(connection_pool=_get_pool(self.redis_url)))
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to create Redis client: {e}")
+            self._use_client(_NullRedis())
+
+    def _use_client(self, client) -> None:
+        """Switch to `client` (a Redis client or _NullRedis) and register the scripts on it."""
+        self.client = client
+        # Scripts run via EVALSHA, with EVAL as the automatic fallback
+        self._incr_expire = client.register_script(_INCR_EXPIRE_LUA)
+        self._add_rating = client.register_script(_ADD_RATING_LUA)
+        self._rating_stats = client.register_script(_RATING_STATS_LUA)
+
+    async def connect(self) -> bool:
+        """
+        Test the Redis connection (call once at startup).
+        On failure the client is swapped for _NullRedis, so every method
+        becomes a no-op.
+        
+        Returns:
+            True if Redis is reachable
+        """
+        try:
+            await self.client.ping()
+            logger.info(f"[OK] Redis metrics manager connected: {self.redis_url}")
+            return True
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to connect to Redis: {e}")
+            await self.close()
+            return False
+
+    async def close(self) -> None:
+        """Release the client (the shared pool stays open for other managers)."""
+        client = self.client
+        self._use_client(_NullRedis())
+        await client.aclose()
+
+    async def increment_generation_count(self, user_id: str) -> int:
+        """
+        Increment the generation counter for a user.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            New counter value
+        """
+        try:
+            key = f"user:{user_id}:generations"
+            # Expires after 1 year, like all user metrics
+            count = await self._incr_expire(keys=[key], args=[_YEAR_TTL])
+            logger.info(f"[OK] User {user_id} generation count: {count}")
+            return count
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to increment generation count: {e}")
+            return 0
+
+    async def get_generation_count(self, user_id: str) -> int:
+        """
+        Get the total generation count for a user.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            Generation count (0 if not found)
+        """
+        try:
+            key = f"user:{user_id}:generations"
+            count = await self.client.get(key)
+            return int(count) if count else 0
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to get generation count: {e}")
+            return 0
+
+    async def add_feedback(self, user_id: str, strategy_id: str, rating: int) -> bool:
+        """
+        Store feedback rating for a strategy.
+        
+        Args:
+            user_id: Unique user identifier
+            strategy_id: Strategy ID to rate
+            rating: Rating value (1-5)
+            
+        Returns:
+            Success status
+        """
+        if not (1 <= rating <= 5):
+            return False
+        
+        try:
+            # Store as hash: strategy_id -> rating, updating the running sum/count
+            stored = await self._add_rating(keys=_rating_keys(user_id), args=[strategy_id, rating, _YEAR_TTL])
+            if stored:
+                logger.info(f"[OK] User {user_id} rated strategy {strategy_id}: {rating}")
+            return bool(stored)
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to add feedback: {e}")
+            return False
+
+    async def get_average_rating(self, user_id: str) -> float:
+        """
+        Calculate average rating across all user strategies.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            Average rating (0 if no ratings)
+        """
+        try:
+            return _average_rating(await self._rating_stats(keys=_rating_keys(user_id)))
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to calculate average rating: {e}")
+            return 0.0
+
+    async def bulk_average_ratings(self, user_ids: List[str]) -> Dict[str, float]:
+        """
+        Average rating for many users at once (analytics).
+        
+        Reads each user's running sum/count, all in one pipelined round trip,
+        so the cost is O(1) per user however many ratings they have.
+        
+        Args:
+            user_ids: Unique user identifiers
+            
+        Returns:
+            Dictionary of user_id -> average rating (0 if no ratings)
+        """
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for user_id in user_ids:
+                await self._rating_stats(keys=_rating_keys(user_id), client=pipe)
+            stats = await pipe.execute()
+            return {user_id: _average_rating(user_stats) for user_id, user_stats in zip(user_ids, stats)}
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to calculate average ratings: {e}")
+            return dict.fromkeys(user_ids, 0.0)
+
+    async def update_last_active(self, user_id: str) -> bool:
+        """
+        Update the last active timestamp for a user.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            Success status
+        """
+        try:
+            key = f"user:{user_id}:last_active"
+            # Epoch seconds: no datetime formatting on every request (see _last_active_iso)
+            return bool(await self.client.set(key, int(time.time()), ex=_YEAR_TTL))
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to update last active: {e}")
+            return False
+
+    async def get_user_metrics(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get all metrics for a user in one call.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            Dictionary with generation_count, average_rating, last_active
+        """
+        try:
+            # One round trip for all three reads
+            pipe = self.client.pipeline(transaction=False)
+            pipe.get(f"user:{user_id}:generations")
+            await self._rating_stats(keys=_rating_keys(user_id), client=pipe)
+            pipe.get(f"user:{user_id}:last_active")
+            generation_count, rating_stats, last_active = await pipe.execute()
+            
+            return {
+                "generation_count": int(generation_count) if generation_count else 0,
+                "average_rating": _average_rating(rating_stats),
+                "last_active": _last_active_iso(last_active),
+            }
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to get user metrics: {e}")
+            return {
+                "generation_count": 0,
+                "average_rating": 0.0,
+                "last_active": None,
+            }
+
+    async def create_session(self, user_id: str, session_data: Dict[str, Any]) -> bool:
+        """
+        Create a user session in Redis.
+        
+        Args:
+            user_id: Unique user identifier
+            session_data: Session data to store
+            
+        Returns:
+            Success status
+        """
+        try:
+            key = f"session:{user_id}"
+            # Store session data as JSON (orjson: UTF-8 bytes, datetimes encoded natively)
+            session_json = orjson.dumps(session_data)
+            # 30 day TTL for sessions
+            stored = await self.client.set(key, session_json, ex=_MONTH_TTL)
+            if stored:
+                logger.info(f"[OK] Session created for user {user_id}")
+            return bool(stored)
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to create session: {e}")
+            return False
+
+    async def get_session(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve session data for a user.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            Session data dict or None if not found
+        """
+        try:
+            key = f"session:{user_id}"
+            session_data = await self.client.get(key)
+            if session_data:
+                # decode_responses hands back str; orjson parses str and bytes alike
+                return orjson.loads(session_data)
+            return None
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to get session: {e}")
+            return None
+
+    async def delete_session(self, user_id: str) -> bool:
+        """
+        Delete a user session.
+        
+        Args:
+            user_id: Unique user identifier
+            
+        Returns:
+            Success status
+        """
+        try:
+            key = f"session:{user_id}"
+            # Number of keys removed; None from _NullRedis
+            if await self.client.delete(key) is None:
+                return False
+            logger.info(f"[OK] Session deleted for user {user_id}")
+            return True
+        except Exception as e:
+            logger.error(f"[ERROR] Failed to delete session: {e}")
+            return False
+
+
+# Global instance
+_metrics_manager: Optional[RedisMetricsManager] = None
+
+
+def get_metrics_manager() -> RedisMetricsManager:
+    """Get or create the global metrics manager instance."""
+    global _metrics_manager
+    if _metrics_manager is None:
+        _metrics_manager = RedisMetricsManager()
+    return _metrics_manager
+
+
+async def close_metrics_manager() -> None:
+    """Close the global metrics manager and the shared connection pools (app shutdown)."""
+    if _metrics_manager is not None:
+        await _metrics_manager.close()
+    while _pools:
+        await _pools.popitem()[1].disconnect()
@@ -0,0 +1,95 @@
+"""
+Tracing helpers for FinIQ.ai.
+
+Wraps OpenTelemetry so the agent chain and cache can emit spans without
+hard-depending on the SDK:
+- If `opentelemetry-api` is installed, spans go to the globally configured
+  tracer provider (see `setup_tracing`).
+- If it is not installed, a no-op tracer is returned and instrumentation
+  costs next to nothing.
+"""
+
+from __future__ import annotations
+
+import os
+import logging
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+try:
+    from opentelemetry import trace  # type: ignore
+except ImportError:  # pragma: no cover - handled at runtime
+    trace = None
+
+
+logger = logging.getLogger(__name__)
+
+_tracing_configured = False
+
+
+class _NoopSpan:
+    """Span stand-in used when OpenTelemetry is not installed."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+class _NoopTracer:
+    """Tracer stand-in used when OpenTelemetry is not installed."""
+
+    _span = _NoopSpan()
+
+    @contextmanager
+    def start_as_current_span(self, name: str, **kwargs: Any) -> Iterator[_NoopSpan]:
+        yield self._span
+
+
+def get_tracer(name: str):
+    """Return an OpenTelemetry tracer, or a no-op tracer if the API is missing."""
+    if trace is None:
+        return _NoopTracer()
+    return trace.get_tracer(name)
+
+
+def setup_tracing(service_name: str = "finiq-backend") -> bool:
+    """
+    Install an OTLP span exporter if one is configured.
+
+    Only runs when `OTEL_EXPORTER_OTLP_ENDPOINT` is set and the SDK/exporter
+    packages are importable. Point the endpoint at a collector or Jaeger
+    (which accepts OTLP natively).
+
+    Returns:
+        True if an exporter was installed, False otherwise
+    """
+    global _tracing_configured
+
+    if _tracing_configured:
+        return True
+
+    endpoint: Optional[str] = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if not endpoint or trace is None:
+        logger.info("[TRACE] OpenTelemetry exporter not configured, spans are not exported")
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource  # type: ignore
+        from opentelemetry.sdk.trace import TracerProvider  # type: ignore
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor  # type: ignore
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter  # type: ignore
+    except ImportError as e:
+        logger.warning(f"[TRACE] OpenTelemetry SDK/exporter not installed: {e}")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": os.getenv("OTEL_SERVICE_NAME", service_name)})
+    )
+    provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    trace.set_tracer_provider(provider)
+
+    _tracing_configured = True
+    logger.info(f"[TRACE] ✓ Exporting spans via OTLP to {endpoint}")
+    return True